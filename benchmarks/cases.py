@@ -0,0 +1,243 @@
+"""
+Pairs of equivalent fluentiter and plain builtin/itertools implementations
+for every method of `FluentIterator`.
+
+Every case is a function taking the input list and returning a tuple of
+`(fluent, raw)` callables doing the same work.
+"""
+import collections
+import functools
+import itertools
+import math
+import operator
+from typing import Any, Callable, Dict, List, Tuple
+
+import more_itertools as miter
+
+from fluentiter import iterator
+
+Case = Callable[[List[int]], Tuple[Callable[[], Any], Callable[[], Any]]]
+
+
+def inc(x: int) -> int:
+    return x + 1
+
+
+def is_even(x: int) -> bool:
+    return x % 2 == 0
+
+
+def even_or_none(x: int) -> Any:
+    return x if x % 2 == 0 else None
+
+
+def pair(x: int) -> Tuple[int, int]:
+    return (x, x)
+
+
+def scan_sum(state: int, x: int) -> Tuple[int, int]:
+    return state + x, state + x
+
+
+def peek_raw(d: List[int]) -> Tuple[int, List[int]]:
+    it = iter(d)
+    x = next(it)
+    return x, list(itertools.chain([x], it))
+
+
+def take_batch(it: Any, size: int) -> Any:
+    while batch := list(itertools.islice(it, size)):
+        yield batch
+
+
+def take_tuple(it: Any, size: int) -> Any:
+    while batch := tuple(itertools.islice(it, size)):
+        yield batch
+
+
+CASES: Dict[str, Case] = {
+    # adapters
+    "map": lambda d: (
+        lambda: iterator(d).map(inc).to_list(),
+        lambda: list(map(inc, d)),
+    ),
+    "filter": lambda d: (
+        lambda: iterator(d).filter(is_even).to_list(),
+        lambda: list(filter(is_even, d)),
+    ),
+    "filter_map": lambda d: (
+        lambda: iterator(d).filter_map(even_or_none).to_list(),
+        lambda: [y for y in map(even_or_none, d) if y is not None],
+    ),
+    "enumerate": lambda d: (
+        lambda: iterator(d).enumerate().to_list(),
+        lambda: list(enumerate(d)),
+    ),
+    "zip": lambda d: (
+        lambda: iterator(d).zip(d).to_list(),
+        lambda: list(zip(d, d)),
+    ),
+    "chain": lambda d: (
+        lambda: iterator(d).chain(d).to_list(),
+        lambda: list(itertools.chain(d, d)),
+    ),
+    "step_by": lambda d: (
+        lambda: iterator(d).step_by(3).to_list(),
+        lambda: list(itertools.islice(d, None, None, 3)),
+    ),
+    "skip": lambda d: (
+        lambda: iterator(d).skip(len(d) // 2).to_list(),
+        lambda: list(itertools.islice(d, len(d) // 2, None)),
+    ),
+    "take": lambda d: (
+        lambda: iterator(d).take(len(d) // 2).to_list(),
+        lambda: list(itertools.islice(d, len(d) // 2)),
+    ),
+    "skip_while": lambda d: (
+        lambda: iterator(d).skip_while(lambda x: x < len(d) // 2).to_list(),
+        lambda: list(itertools.dropwhile(lambda x: x < len(d) // 2, d)),
+    ),
+    "take_while": lambda d: (
+        lambda: iterator(d).take_while(lambda x: x < len(d) // 2).to_list(),
+        lambda: list(itertools.takewhile(lambda x: x < len(d) // 2, d)),
+    ),
+    "map_while": lambda d: (
+        lambda: iterator(d).map_while(inc).to_list(),
+        lambda: list(itertools.takewhile(lambda x: x is not None, map(inc, d))),
+    ),
+    "scan": lambda d: (
+        lambda: iterator(d).scan(0, scan_sum).to_list(),
+        lambda: list(itertools.accumulate(d)),
+    ),
+    "flat_map": lambda d: (
+        lambda: iterator(d).flat_map(pair).to_list(),
+        lambda: list(itertools.chain.from_iterable(map(pair, d))),
+    ),
+    "flatten": lambda d: (
+        lambda: iterator(d).map(pair).flatten().to_list(),
+        lambda: list(itertools.chain.from_iterable(map(pair, d))),
+    ),
+    "inspect": lambda d: (
+        lambda: iterator(d).inspect(inc).to_list(),
+        lambda: [x for x in d if inc(x) or True],
+    ),
+    "cycle": lambda d: (
+        lambda: iterator(d).cycle().take(2 * len(d)).to_list(),
+        lambda: list(itertools.islice(itertools.cycle(d), 2 * len(d))),
+    ),
+    "peek": lambda d: (
+        lambda: (lambda it: (it.peek(), it.to_list()))(iterator(d)),
+        lambda: peek_raw(d),
+    ),
+    "tumbling_window": lambda d: (
+        lambda: iterator(d).tumbling_window(16).to_list(),
+        lambda: list(take_tuple(iter(d), 16)),
+    ),
+    "rolling_window": lambda d: (
+        lambda: iterator(d).rolling_window(16).to_list(),
+        lambda: list(miter.sliding_window(d, 16)),
+    ),
+    "batched": lambda d: (
+        lambda: iterator(d).batched(16).to_list(),
+        lambda: list(take_batch(iter(d), 16)),
+    ),
+    "map_batches": lambda d: (
+        lambda: iterator(d).map_batches(sorted, 16).to_list(),
+        lambda: list(
+            itertools.chain.from_iterable(map(sorted, take_batch(iter(d), 16)))
+        ),
+    ),
+    "partition": lambda d: (
+        lambda: [list(x) for x in iterator(d).partition(is_even)],
+        lambda: [list(x) for x in miter.partition(is_even, d)],
+    ),
+    "unzip": lambda d: (
+        lambda: [list(x) for x in iterator(d).map(pair).unzip()],
+        lambda: [list(x) for x in zip(*map(pair, d))],
+    ),
+    # terminals
+    "to_list": lambda d: (
+        lambda: iterator(d).to_list(),
+        lambda: list(d),
+    ),
+    "into": lambda d: (
+        lambda: iterator(d).into(set),
+        lambda: set(d),
+    ),
+    "count": lambda d: (
+        lambda: iterator(d).filter(is_even).count(),
+        lambda: sum(1 for _ in filter(is_even, d)),
+    ),
+    "last": lambda d: (
+        lambda: iterator(d).filter(is_even).last(),
+        lambda: collections.deque(filter(is_even, d), maxlen=1)[0],
+    ),
+    "nth": lambda d: (
+        lambda: iterator(d).filter(is_even).nth(len(d) // 4),
+        lambda: next(itertools.islice(filter(is_even, d), len(d) // 4, None)),
+    ),
+    "fold": lambda d: (
+        lambda: iterator(d).fold(0, operator.add),
+        lambda: functools.reduce(operator.add, d, 0),
+    ),
+    "reduce": lambda d: (
+        lambda: iterator(d).reduce(operator.add),
+        lambda: functools.reduce(operator.add, d),
+    ),
+    "any": lambda d: (
+        lambda: iterator(d).any(lambda x: x < 0),
+        lambda: any(x < 0 for x in d),
+    ),
+    "find": lambda d: (
+        lambda: iterator(d).find(lambda x: x == len(d) - 1),
+        lambda: next(x for x in d if x == len(d) - 1),
+    ),
+    "position": lambda d: (
+        lambda: iterator(d).position(lambda x: x == len(d) - 1),
+        lambda: next(i for i, x in enumerate(d) if x == len(d) - 1),
+    ),
+    "max": lambda d: (
+        lambda: iterator(d).max(),
+        lambda: max(d),
+    ),
+    "min": lambda d: (
+        lambda: iterator(d).min(),
+        lambda: min(d),
+    ),
+    "sum": lambda d: (
+        lambda: iterator(d).sum(),
+        lambda: sum(d),
+    ),
+    "product": lambda d: (
+        lambda: iterator(d).map(is_even).product(),
+        lambda: math.prod(map(is_even, d)),
+    ),
+}
+
+
+def pipeline(depth: int) -> Case:
+    """
+    A chain of `depth` alternating `.map` and `.filter` stages
+    """
+
+    def case(d: List[int]) -> Tuple[Callable[[], Any], Callable[[], Any]]:
+        def fluent() -> Any:
+            it = iterator(d)
+            for i in range(depth):
+                it = it.map(inc) if i % 2 == 0 else it.filter(bool)
+            return it.to_list()
+
+        def raw() -> Any:
+            it: Any = iter(d)
+            for i in range(depth):
+                it = map(inc, it) if i % 2 == 0 else filter(bool, it)
+            return list(it)
+
+        return fluent, raw
+
+    return case
+
+
+PIPELINES: Dict[str, Case] = {
+    f"pipeline-{depth}": pipeline(depth) for depth in (1, 4, 8)
+}
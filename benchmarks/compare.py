@@ -0,0 +1,71 @@
+"""
+Regression gate for the benchmark suite.
+
+Reads the JSON written by `pytest benchmarks --benchmark-json=<file>`, computes
+the overhead of every fluentiter method as the ratio of its median runtime to
+the runtime of the equivalent builtin/itertools code, and compares these ratios
+to the ones recorded in `benchmarks/baseline.json`.
+
+Usage
+-----
+    python -m benchmarks.compare results.json              # check against baseline
+    python -m benchmarks.compare results.json --update     # record a new baseline
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict
+
+BASELINE = Path(__file__).parent / "baseline.json"
+
+
+def overhead_ratios(results_path: Path) -> Dict[str, float]:
+    """
+    Get the ratio `fluent / raw` of the median runtimes for every benchmark group
+    """
+    results = json.loads(results_path.read_text())
+    medians: Dict[str, Dict[str, float]] = {}
+    for bench in results["benchmarks"]:
+        impl = bench["extra_info"]["impl"]
+        medians.setdefault(bench["group"], {})[impl] = bench["stats"]["median"]
+    return {
+        group: round(timings["fluent"] / timings["raw"], 3)
+        for group, timings in sorted(medians.items())
+        if {"fluent", "raw"} <= timings.keys()
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("results", type=Path, help="JSON written by pytest-benchmark")
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=1.5,
+        help="fail if a ratio grows by more than this factor, by default 1.5",
+    )
+    parser.add_argument("--update", action="store_true", help="overwrite the baseline")
+    args = parser.parse_args()
+
+    ratios = overhead_ratios(args.results)
+    if args.update:
+        args.baseline.write_text(json.dumps(ratios, indent=2) + "\n")
+        print(f"Recorded {len(ratios)} ratios in {args.baseline}")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    failed = False
+    print(f"{'benchmark':<28} {'baseline':>9} {'current':>9}")
+    for group, ratio in ratios.items():
+        expected = baseline.get(group)
+        regressed = expected is not None and ratio > expected * args.tolerance
+        failed |= regressed
+        marker = "  <-- regression" if regressed else ""
+        print(f"{group:<28} {expected or float('nan'):>9.2f} {ratio:>9.2f}{marker}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+"""
+Micro-benchmark for the per element cost of stacking adapters.
+
+Compares a chain of `.map` layers against the equivalent nested builtin
+`map` calls and reports the cost per element and layer.
+
+Run with `python -m benchmarks.layers`
+"""
+import timeit
+from typing import Callable, List
+
+from fluentiter import iterator
+
+SIZE = 100_000
+DEPTHS = (0, 1, 2, 4, 8)
+REPEAT = 5
+
+
+def raw(depth: int) -> List[int]:
+    it = iter(range(SIZE))
+    for _ in range(depth):
+        it = map(abs, it)
+    return list(it)
+
+
+def fluent(depth: int) -> List[int]:
+    it = iterator(range(SIZE))
+    for _ in range(depth):
+        it = it.map(abs)
+    return it.to_list()
+
+
+def fluent_next(depth: int) -> List[int]:
+    # goes through `FluentIterator.__next__` for every element
+    it = iterator(range(SIZE))
+    for _ in range(depth):
+        it = it.map(abs)
+    return [x for x in it]
+
+
+def best_of(func: Callable[[int], List[int]], depth: int) -> float:
+    return min(timeit.repeat(lambda: func(depth), number=1, repeat=REPEAT))
+
+
+def main() -> None:
+    print(f"{'depth':>5} {'raw':>10} {'fluent':>10} {'__next__':>10}  (ns per element)")
+    for depth in DEPTHS:
+        timings = [
+            best_of(func, depth) / SIZE * 1e9 for func in (raw, fluent, fluent_next)
+        ]
+        print(f"{depth:>5} " + " ".join(f"{t:>10.1f}" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
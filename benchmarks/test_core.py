@@ -0,0 +1,31 @@
+"""
+Benchmarks of every `FluentIterator` method against the equivalent
+plain builtin/itertools code.
+
+Run with `uv run poe bench`, see `benchmarks/compare.py` for
+checking the results against the recorded overhead.
+"""
+import pytest
+
+from .cases import CASES, PIPELINES
+
+SIZES = (100, 10_000)
+IMPLEMENTATIONS = ("fluent", "raw")
+
+
+@pytest.mark.parametrize("impl", IMPLEMENTATIONS)
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("name", list(CASES) + list(PIPELINES))
+def test_bench(benchmark, name, size, impl):
+    case = CASES.get(name) or PIPELINES[name]
+    fluent, raw = case(list(range(size)))
+    func = fluent if impl == "fluent" else raw
+    benchmark.group = f"{name}-{size}"
+    benchmark.extra_info.update(case=name, size=size, impl=impl)
+    benchmark(func)
+
+
+@pytest.mark.parametrize("name", list(CASES) + list(PIPELINES))
+def test_same_result(name):
+    fluent, raw = (CASES.get(name) or PIPELINES[name])(list(range(100)))
+    assert fluent() == raw()
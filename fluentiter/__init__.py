@@ -1,12 +1,48 @@
-from typing import Iterable, TypeVar
+import importlib
+from typing import TYPE_CHECKING, Any, AsyncIterable, Iterable, TypeVar, Union
 
 from fluentiter.core import FluentIterator
 
+if TYPE_CHECKING:
+    from fluentiter.aio import AsyncFluentIterator  # pragma: no cover
+    from fluentiter.io import from_chunks, from_lines, from_mmap  # pragma: no cover
+
 T = TypeVar("T")
 
+# names exported from modules, which are only imported once they are used,
+# e.g. asyncio takes longer to import than the rest of the package
+_LAZY = {
+    "AsyncFluentIterator": "fluentiter.aio",
+    "from_lines": "fluentiter.io",
+    "from_mmap": "fluentiter.io",
+    "from_chunks": "fluentiter.io",
+}
+
 
 def iterator(iterable: Iterable[T]) -> "FluentIterator[T]":
     return FluentIterator(iterable=iterable)
 
 
-__all__ = ["iterator", "FluentIterator"]
+def aiterator(
+    iterable: Union[AsyncIterable[T], Iterable[T]],
+) -> "AsyncFluentIterator[T]":
+    from fluentiter.aio import AsyncFluentIterator
+
+    return AsyncFluentIterator(iterable=iterable)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        return getattr(importlib.import_module(_LAZY[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = [
+    "iterator",
+    "aiterator",
+    "from_lines",
+    "from_mmap",
+    "from_chunks",
+    "FluentIterator",
+    "AsyncFluentIterator",
+]
@@ -0,0 +1,695 @@
+import asyncio
+import collections
+import inspect
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from fluentiter.exceptions import EmptyIteratorError, NotFoundError, StopScan
+
+T = TypeVar("T", covariant=True)
+U = TypeVar("U")
+R = TypeVar("R")
+S = TypeVar("S")
+A = TypeVar("A")
+
+# a function which may either return a value or an awaitable of that value
+MaybeAsync = Callable[..., Union[R, Awaitable[R]]]
+
+
+class AsyncFluentIterator(Generic[T], AsyncIterator[T]):
+    """
+    Easy to use container for async iterables.
+
+    All methods taking a function accept regular functions as well as
+    `async def` functions.
+    """
+
+    __slots__ = ("_iterable",)
+
+    def __init__(self, iterable: Union[AsyncIterable[T], Iterable[T]]) -> None:
+        if isinstance(iterable, AsyncIterable):
+            self._iterable: AsyncIterator[T] = iterable.__aiter__()
+        else:
+            self._iterable = _from_iterable(iterable)
+
+    async def next(self) -> T:
+        """
+        Advances the iterator and returns the next value.
+
+        Returns
+        -------
+        T
+            Next element
+
+        Raises
+        ------
+        StopAsyncIteration
+            If there is no next element
+        """
+        return await self.__anext__()
+
+    async def aclose(self) -> None:
+        """
+        Close the underlying async iterator, if it supports closing.
+        Pending work of upstream stages, e.g. running `amap` tasks, is cancelled.
+        """
+        await _aclose(self._iterable)
+
+    def map(self, func: MaybeAsync[R]) -> "AsyncFluentIterator[R]":
+        """
+        Apply a given function `func` to every element of the iterator.
+
+        Parameters
+        ----------
+        func : Callable[[T], Union[R, Awaitable[R]]]
+            Function to apply to every element.
+
+        Returns
+        -------
+        AsyncFluentIterator[R]
+            Iterator yielding the function call results
+
+        Examples
+        --------
+        >>> await aiterator(cursor).map(lambda row: row["id"]).to_list()
+            [1, 2, 3]
+        """
+        return AsyncFluentIterator(_map(self._iterable, func))
+
+    def amap(
+        self,
+        func: MaybeAsync[R],
+        concurrency: int = 8,
+        ordered: bool = True,
+        timeout: Optional[float] = None,
+    ) -> "AsyncFluentIterator[R]":
+        """
+        Like `.map`, but await up to `concurrency` calls of `func` at the same time.
+
+        Notes
+        -----
+        - Elements are only pulled from this iterator while fewer than `concurrency`
+          calls are running, so a slow consumer also slows down reading the source.
+        - If the iterator is closed before it is exhausted, e.g. by `.take` or
+          `.find`, all running calls are cancelled.
+
+        Parameters
+        ----------
+        func : Callable[[T], Union[R, Awaitable[R]]]
+            Function to apply to every element.
+        concurrency : int, optional
+            Maximum number of calls awaited at the same time, by default 8
+        ordered : bool, optional
+            Yield results in the order of the elements, by default True.
+            If `False` results are yielded as soon as they are available.
+        timeout : Optional[float], optional
+            Maximum number of seconds to await a single call, by default no limit
+
+        Returns
+        -------
+        AsyncFluentIterator[R]
+            Iterator yielding the function call results
+
+        Raises
+        ------
+        ValueError
+            If `concurrency` is <= 0
+        asyncio.TimeoutError
+            When iterating, if a call takes longer than `timeout`
+
+        Examples
+        --------
+        >>> await aiterator(urls).amap(fetch, concurrency=16, timeout=5).to_list()
+            [<Response 200>, <Response 200>]
+        """
+        if concurrency <= 0:
+            raise ValueError(f"Concurrency must be an integer >0. Got {concurrency}")
+        amap = _amap_ordered if ordered else _amap_unordered
+        return AsyncFluentIterator(amap(self._iterable, func, concurrency, timeout))
+
+    def filter(self, func: MaybeAsync[bool]) -> "AsyncFluentIterator[T]":
+        """
+        Only yield elements for which `func` returns `True`.
+
+        Parameters
+        ----------
+        func : Callable[[T], Union[bool, Awaitable[bool]]]
+            Function to apply as a filter.
+
+        Returns
+        -------
+        AsyncFluentIterator[T]
+            Filtered iterator
+        """
+        return AsyncFluentIterator(_filter(self._iterable, func))
+
+    def filter_map(self, func: MaybeAsync[Optional[R]]) -> "AsyncFluentIterator[R]":
+        """
+        Apply `func` to every element and yield the result if it is not `None`.
+
+        Parameters
+        ----------
+        func : Callable[[T], Union[Optional[R], Awaitable[Optional[R]]]]
+            Function to apply, returns `None` for elements to be filtered out.
+
+        Returns
+        -------
+        AsyncFluentIterator[R]
+            Iterator of mapped values.
+        """
+        return AsyncFluentIterator(_filter_map(self._iterable, func))
+
+    def enumerate(self) -> "AsyncFluentIterator[Tuple[int, T]]":
+        """
+        Create an iterator which yields tuples of `(index, value)`.
+
+        Returns
+        -------
+        AsyncFluentIterator[Tuple[int, T]]
+            Iterator of index, value tuples
+        """
+        return AsyncFluentIterator(_enumerate(self._iterable))
+
+    def inspect(self, func: MaybeAsync[Any]) -> "AsyncFluentIterator[T]":
+        """
+        Apply `func` to every element, but still yield the original elements.
+
+        Parameters
+        ----------
+        func : Callable[[T], Any]
+            Function to apply to every element.
+
+        Returns
+        -------
+        AsyncFluentIterator[T]
+            Iterator of the original elements.
+        """
+        return AsyncFluentIterator(_inspect(self._iterable, func))
+
+    def skip(self, n: int) -> "AsyncFluentIterator[T]":
+        """
+        Skip the first `n` elements of this iterator.
+
+        Parameters
+        ----------
+        n : int
+            Number of elements to skip
+
+        Returns
+        -------
+        AsyncFluentIterator[T]
+            Iterator which skips its first `n` elements
+        """
+        return AsyncFluentIterator(_skip(self._iterable, n))
+
+    def take(self, n: int) -> "AsyncFluentIterator[T]":
+        """
+        Only yield the first `n` items of the iterator. Afterwards the
+        underlying iterator is closed.
+
+        Parameters
+        ----------
+        n : int
+            Number of items to yield
+
+        Returns
+        -------
+        AsyncFluentIterator[T]
+            Iterator which yields the first `n` items
+        """
+        return AsyncFluentIterator(_take(self._iterable, n))
+
+    def skip_while(self, func: MaybeAsync[bool]) -> "AsyncFluentIterator[T]":
+        """
+        Skip elements while `func` returns `True`, then yield all subsequent
+        elements.
+
+        Parameters
+        ----------
+        func : Callable[[T], Union[bool, Awaitable[bool]]]
+            Function to apply to every element
+
+        Returns
+        -------
+        AsyncFluentIterator[T]
+            Iterator which skips elements while `func` returns `True`
+        """
+        return AsyncFluentIterator(_skip_while(self._iterable, func))
+
+    def take_while(self, func: MaybeAsync[bool]) -> "AsyncFluentIterator[T]":
+        """
+        Yield elements while `func` returns `True`. Afterwards the underlying
+        iterator is closed.
+
+        Parameters
+        ----------
+        func : Callable[[T], Union[bool, Awaitable[bool]]]
+            Function to apply to every element
+
+        Returns
+        -------
+        AsyncFluentIterator[T]
+            Iterator which yields elements until `func` returns `False`
+        """
+        return AsyncFluentIterator(_take_while(self._iterable, func))
+
+    def scan(
+        self,
+        initial_state: S,
+        func: Callable[[S, T], Union[Tuple[S, R], Awaitable[Tuple[S, R]]]],
+    ) -> "AsyncFluentIterator[R]":
+        """
+        Create an iterator which holds some internal state and applies `func`
+        using that state to every element. See `FluentIterator.scan`.
+
+        To end the iteration, the function should raise `StopScan`.
+
+        Parameters
+        ----------
+        initial_state : S
+            Inital value of the state
+        func : Callable[[S, T], Tuple[S, R]]
+            Function to recieve the state and element as arguments
+
+        Returns
+        -------
+        AsyncFluentIterator[R]
+            Mapped iterator
+        """
+        return AsyncFluentIterator(_scan(self._iterable, initial_state, func))
+
+    def tumbling_window(self, size: int) -> "AsyncFluentIterator[Tuple[T, ...]]":
+        """
+        Create an iterator of non-overlapping windows of at most size `size`.
+
+        Parameters
+        ----------
+        size : int
+            Size of the windows
+
+        Returns
+        -------
+        AsyncFluentIterator[Tuple[T, ...]]
+            An iterator of non-overlapping windows
+
+        Raises
+        ------
+        ValueError
+            If `size` is <= 0
+        """
+        if size <= 0:
+            raise ValueError(f"Size must be an integer >0. Got {size}")
+        return AsyncFluentIterator(_tumble(self._iterable, size))
+
+    def rolling_window(self, size: int) -> "AsyncFluentIterator[Tuple[T, ...]]":
+        """
+        Create an iterator of overlapping windows of size `size`.
+
+        Parameters
+        ----------
+        size : int
+            Size of the windows
+
+        Returns
+        -------
+        AsyncFluentIterator[Tuple[T, ...]]
+            An iterator of overlapping windows
+
+        Raises
+        ------
+        ValueError
+            If `size` is <= 0
+        """
+        if size <= 0:
+            raise ValueError(f"Size must be an integer >0. Got {size}")
+        return AsyncFluentIterator(_roll(self._iterable, size))
+
+    async def to_list(self) -> List[T]:
+        """
+        Collect this iterator into a list, completely consuming it.
+
+        Returns
+        -------
+        List[T]
+            Collected iterator
+        """
+        return [x async for x in self._iterable]
+
+    async def fold(
+        self, initial_value: A, func: Callable[[A, T], Union[A, Awaitable[A]]]
+    ) -> A:
+        """
+        Fold every element of this iterator into a single value by repeatedly
+        applying `func`. See `FluentIterator.fold`.
+
+        Parameters
+        ----------
+        initial_value: A
+            Initial value of the accumulator
+        func : Callable[[A, T], A]
+            Folding function
+
+        Returns
+        -------
+        A
+            Folded value
+        """
+        acc = initial_value
+        async for x in self._iterable:
+            acc = await _call(func, acc, x)
+        return acc
+
+    async def reduce(
+        self, func: Callable[[T, R], Union[R, Awaitable[R]]]
+    ) -> Union[T, R]:
+        """
+        Reduce all elements into a single element by repeatedly applying `func`.
+        See `FluentIterator.reduce`.
+
+        Parameters
+        ----------
+        func : Callable[[T, R], R]
+            Reducing function
+
+        Returns
+        -------
+        Union[T, R]
+            Reduced element or first element of the iterator if it only has one.
+
+        Raises
+        ------
+        EmptyIteratorError
+            If called on an empty iterator
+        """
+        try:
+            acc: Any = await self._iterable.__anext__()
+        except StopAsyncIteration:
+            raise EmptyIteratorError("Cannot reduce an empty iterator")
+        async for x in self._iterable:
+            acc = await _call(func, acc, x)
+        return cast(Union[T, R], acc)
+
+    async def count(self) -> int:
+        """
+        Count the elements in this iterator, consuming it.
+
+        Returns
+        -------
+        int
+            Count of items
+        """
+        i = 0
+        async for _ in self._iterable:
+            i += 1
+        return i
+
+    async def last(self) -> T:
+        """
+        Return the last element in this iterator, consuming it.
+
+        Returns
+        -------
+        T
+            Last element
+
+        Raises
+        ------
+        EmptyIteratorError
+            If the iterator has no elements
+        """
+        sentinel = last = object()
+        async for last in self._iterable:
+            pass
+        if last is sentinel:
+            raise EmptyIteratorError
+        return cast(T, last)
+
+    async def any(self, func: MaybeAsync[bool] = bool) -> bool:
+        """
+        Return `True` if `func` returns `True` for any element. Stops and closes
+        the underlying iterator at the first match.
+
+        Parameters
+        ----------
+        func : Callable[[T], Union[bool, Awaitable[bool]]], optional
+            Function to evaluate elements, by default bool
+
+        Returns
+        -------
+        bool
+            Whether any element of this iterator matches the predicate
+        """
+        try:
+            async for x in self._iterable:
+                if await _call(func, x):
+                    return True
+            return False
+        finally:
+            await self.aclose()
+
+    async def find(self, func: MaybeAsync[bool]) -> T:
+        """
+        Find and return the first element for which `func` returns `True`.
+        Stops and closes the underlying iterator at the first match.
+
+        Parameters
+        ----------
+        func : Callable[[T], Union[bool, Awaitable[bool]]]
+            Function to test elements
+
+        Returns
+        -------
+        T
+            First element which matches the predicate
+
+        Raises
+        ------
+        NotFoundError
+            If no element matches
+        """
+        try:
+            async for x in self._iterable:
+                if await _call(func, x):
+                    return x
+        finally:
+            await self.aclose()
+        raise NotFoundError("No element matching the given predicate")
+
+    def __aiter__(self) -> "AsyncFluentIterator[T]":
+        return self
+
+    async def __anext__(self) -> T:
+        return await self._iterable.__anext__()
+
+
+async def _call(func: Callable[..., Any], *args: Any) -> Any:
+    result = func(*args)
+    if inspect.isawaitable(result):
+        return await result
+    return result
+
+
+async def _aclose(it: AsyncIterator[Any]) -> None:
+    aclose = getattr(it, "aclose", None)
+    if aclose is not None:
+        await aclose()
+
+
+async def _from_iterable(iterable: Iterable[T]) -> AsyncGenerator[T, None]:
+    for x in iterable:
+        yield x
+
+
+async def _map(it: AsyncIterator[T], func: MaybeAsync[R]) -> AsyncGenerator[R, None]:
+    async for x in it:
+        yield await _call(func, x)
+
+
+async def _call_with_timeout(
+    func: MaybeAsync[R], x: Any, timeout: Optional[float]
+) -> R:
+    if timeout is None:
+        return await _call(func, x)
+    return await asyncio.wait_for(_call(func, x), timeout)
+
+
+async def _cancel(tasks: Iterable["asyncio.Future[Any]"]) -> None:
+    for task in tasks:
+        task.cancel()
+    # wait for the cancellation to be processed, so no task outlives its iterator
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _amap_ordered(
+    it: AsyncIterator[T],
+    func: MaybeAsync[R],
+    concurrency: int,
+    timeout: Optional[float],
+) -> AsyncGenerator[R, None]:
+    pending: Deque["asyncio.Future[R]"] = collections.deque()
+    try:
+        async for x in it:
+            pending.append(asyncio.ensure_future(_call_with_timeout(func, x, timeout)))
+            if len(pending) >= concurrency:
+                yield await pending.popleft()
+        while pending:
+            yield await pending.popleft()
+    finally:
+        await _cancel(pending)
+        await _aclose(it)
+
+
+async def _amap_unordered(
+    it: AsyncIterator[T],
+    func: MaybeAsync[R],
+    concurrency: int,
+    timeout: Optional[float],
+) -> AsyncGenerator[R, None]:
+    pending: Set["asyncio.Future[R]"] = set()
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) < concurrency:
+                try:
+                    x = await it.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                pending.add(asyncio.ensure_future(_call_with_timeout(func, x, timeout)))
+            if not pending:
+                return
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                yield task.result()
+    finally:
+        await _cancel(pending)
+        await _aclose(it)
+
+
+async def _filter(
+    it: AsyncIterator[T], func: MaybeAsync[bool]
+) -> AsyncGenerator[T, None]:
+    async for x in it:
+        if await _call(func, x):
+            yield x
+
+
+async def _filter_map(
+    it: AsyncIterator[T], func: MaybeAsync[Optional[R]]
+) -> AsyncGenerator[R, None]:
+    async for x in it:
+        y = await _call(func, x)
+        if y is not None:
+            yield y
+
+
+async def _enumerate(it: AsyncIterator[T]) -> AsyncGenerator[Tuple[int, T], None]:
+    i = 0
+    async for x in it:
+        yield i, x
+        i += 1
+
+
+async def _inspect(
+    it: AsyncIterator[T], func: MaybeAsync[Any]
+) -> AsyncGenerator[T, None]:
+    async for x in it:
+        await _call(func, x)
+        yield x
+
+
+async def _skip(it: AsyncIterator[T], n: int) -> AsyncGenerator[T, None]:
+    async for x in it:
+        if n > 0:
+            n -= 1
+            continue
+        yield x
+
+
+async def _take(it: AsyncIterator[T], n: int) -> AsyncGenerator[T, None]:
+    try:
+        if n <= 0:
+            return
+        async for x in it:
+            yield x
+            n -= 1
+            if n == 0:
+                return
+    finally:
+        await _aclose(it)
+
+
+async def _skip_while(
+    it: AsyncIterator[T], func: MaybeAsync[bool]
+) -> AsyncGenerator[T, None]:
+    skipping = True
+    async for x in it:
+        if skipping and await _call(func, x):
+            continue
+        skipping = False
+        yield x
+
+
+async def _take_while(
+    it: AsyncIterator[T], func: MaybeAsync[bool]
+) -> AsyncGenerator[T, None]:
+    try:
+        async for x in it:
+            if not await _call(func, x):
+                return
+            yield x
+    finally:
+        await _aclose(it)
+
+
+async def _scan(
+    it: AsyncIterator[T], state: S, func: Callable[[S, T], Any]
+) -> AsyncGenerator[R, None]:
+    try:
+        async for x in it:
+            try:
+                state, val = await _call(func, state, x)
+            except StopScan:
+                return
+            yield val
+    finally:
+        await _aclose(it)
+
+
+async def _tumble(
+    it: AsyncIterator[T], size: int
+) -> AsyncGenerator[Tuple[T, ...], None]:
+    window: List[T] = []
+    async for x in it:
+        window.append(x)
+        if len(window) == size:
+            yield tuple(window)
+            window = []
+    if window:
+        yield tuple(window)
+
+
+async def _roll(it: AsyncIterator[T], size: int) -> AsyncGenerator[Tuple[T, ...], None]:
+    window: Deque[T] = collections.deque(maxlen=size)
+    async for x in it:
+        window.append(x)
+        if len(window) == size:
+            yield tuple(window)
@@ -0,0 +1,53 @@
+import math
+from typing import Hashable
+
+
+class BloomFilter:
+    """
+    Set of a fixed size, which may report elements as contained
+    although they were never added.
+
+    For up to `capacity` added elements the rate of such false positives
+    stays below `error_rate`. Elements are never reported as missing
+    once they were added.
+    """
+
+    __slots__ = ("_bits", "_size", "_hashes")
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        # optimal number of bits and hash functions for the given capacity
+        self._size = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self._hashes = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+
+    @property
+    def size_in_bytes(self) -> int:
+        return len(self._bits)
+
+    def add(self, x: Hashable) -> bool:
+        """
+        Add `x` and return whether it was (possibly) contained before
+        """
+        # double hashing, the tuple hash mixes the bits of hash(x)
+        h1 = hash(x)
+        h2 = hash((x,)) | 1
+        bits = self._bits
+        contained = True
+        for i in range(self._hashes):
+            position = (h1 + i * h2) % self._size
+            byte, mask = position >> 3, 1 << (position & 7)
+            if not bits[byte] & mask:
+                contained = False
+                bits[byte] |= mask
+        return contained
+
+    def __contains__(self, x: Hashable) -> bool:
+        h1 = hash(x)
+        h2 = hash((x,)) | 1
+        for i in range(self._hashes):
+            position = (h1 + i * h2) % self._size
+            if not self._bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
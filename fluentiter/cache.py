@@ -0,0 +1,138 @@
+import pickle
+import tempfile
+import threading
+from typing import IO, Generator, Generic, Iterator, List, Optional, TypeVar
+
+import fluentiter as fl
+
+T = TypeVar("T")
+
+
+class CachedIterable(Generic[T]):
+    """
+    Iterable, which pulls elements from an iterator on demand and remembers
+    them, so it can be iterated any number of times.
+
+    The first elements are kept in memory, once there are more than
+    `max_memory` elements, further elements are pickled to a temporary file
+    in chunks of `max_memory // 2` elements.
+    """
+
+    __slots__ = (
+        "_source",
+        "_head_size",
+        "_chunk_size",
+        "_dir",
+        "_head",
+        "_tail",
+        "_file",
+        "_offsets",
+        "_len",
+        "_lock",
+    )
+
+    def __init__(
+        self,
+        source: Iterator[T],
+        max_memory: Optional[int] = None,
+        dir: Optional[str] = None,
+    ) -> None:
+        self._source = source
+        if max_memory is None:
+            self._chunk_size = self._head_size = -1
+        else:
+            self._chunk_size = max(1, max_memory // 2)
+            self._head_size = max_memory - self._chunk_size
+        self._dir = dir
+        # the elements are stored in the head, then in the chunks
+        # in the file and finally in the tail, which is written to the file
+        # once full
+        self._head: List[T] = []
+        self._tail: List[T] = []
+        self._file: Optional[IO[bytes]] = None
+        self._offsets: List[int] = []
+        self._len = 0
+        self._lock = threading.Lock()
+
+    def __iter__(self) -> "fl.FluentIterator[T]":
+        """
+        Create a new cursor starting at the first element.
+        Cursors are independent of each other.
+        """
+        return fl.iterator(self._cursor())
+
+    @property
+    def cached(self) -> int:
+        """
+        Number of elements pulled from the source so far
+        """
+        return self._len
+
+    @property
+    def in_memory(self) -> int:
+        """
+        Number of elements currently held in memory, not counting
+        the chunks loaded by cursors
+        """
+        return len(self._head) + len(self._tail)
+
+    def _cursor(self) -> Generator[T, None, None]:
+        head = self._head
+        i = 0
+        # spilled chunk this cursor is reading from
+        chunk: List[T] = []
+        chunk_start = 0
+        while True:
+            while i < len(head):
+                yield head[i]
+                i += 1
+            if i >= self._len and not self._fill(i):
+                return
+            if i < len(head):
+                continue
+            j = i - self._head_size
+            with self._lock:
+                # another cursor may spill the tail concurrently
+                spilled = len(self._offsets) * self._chunk_size
+                in_tail = j >= spilled
+                if in_tail:
+                    x = self._tail[j - spilled]
+            if not in_tail:
+                if not chunk_start <= j < chunk_start + len(chunk):
+                    chunk = self._load(j // self._chunk_size)
+                    chunk_start = j - j % self._chunk_size
+                x = chunk[j - chunk_start]
+            yield x
+            i += 1
+
+    def _fill(self, i: int) -> bool:
+        # pull the element at `i` from the source
+        with self._lock:
+            if i < self._len:
+                # another cursor pulled it in the meantime
+                return True
+            for x in self._source:
+                if self._head_size == -1 or len(self._head) < self._head_size:
+                    self._head.append(x)
+                else:
+                    self._tail.append(x)
+                    if len(self._tail) >= self._chunk_size:
+                        self._spill()
+                self._len += 1
+                return True
+            return False
+
+    def _spill(self) -> None:
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(dir=self._dir)
+        self._file.seek(0, 2)
+        self._offsets.append(self._file.tell())
+        pickle.dump(self._tail, self._file, pickle.HIGHEST_PROTOCOL)
+        self._tail = []
+
+    def _load(self, index: int) -> List[T]:
+        assert self._file is not None
+        with self._lock:
+            self._file.seek(self._offsets[index])
+            chunk: List[T] = pickle.load(self._file)
+        return chunk
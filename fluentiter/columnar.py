@@ -0,0 +1,231 @@
+import array
+import itertools
+import operator
+from typing import Any, Callable, Generator, Iterable, Iterator, List, Optional
+
+import fluentiter as fl
+from fluentiter.exceptions import EmptyIteratorError, RequiresExtraError
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+# an `array.array` or, if numpy is used, a `numpy.ndarray`
+Chunk = Any
+
+
+class ColumnIterator:
+    """
+    Iterator of numbers, which are stored in chunks of `array.array`
+    or `numpy.ndarray`.
+
+    With numpy, functions passed to `map` and `filter` are called once per
+    chunk with a whole array. Without numpy, they are called per element.
+    """
+
+    __slots__ = ("_chunks", "_dtype", "_numpy")
+
+    def __init__(self, chunks: Iterator[Chunk], dtype: Any, numpy: bool) -> None:
+        self._chunks = chunks
+        self._dtype = dtype
+        self._numpy = numpy
+
+    def __iter__(self) -> Iterator[Any]:
+        return itertools.chain.from_iterable(
+            map(operator.methodcaller("tolist"), self._chunks)
+        )
+
+    def chunks(self) -> "fl.FluentIterator[Chunk]":
+        """
+        Turn this into an iterator of the chunks
+
+        Returns
+        -------
+        FluentIterator[Chunk]
+            Iterator of `array.array` or `numpy.ndarray`
+        """
+        return fl.iterator(self._chunks)
+
+    def values(self) -> "fl.FluentIterator[Any]":
+        """
+        Turn this back into an iterator of single elements
+
+        Returns
+        -------
+        FluentIterator[Any]
+            Iterator of Python numbers
+        """
+        return fl.iterator(iter(self))
+
+    def map(self, func: Callable[[Any], Any], dtype: Any = None) -> "ColumnIterator":
+        """
+        Apply a function to every element.
+
+        Notes
+        -----
+        With numpy, `func` is called with whole chunks, so it must work
+        elementwise on arrays, like arithmetic operators and numpy ufuncs do.
+
+        Parameters
+        ----------
+        func : Callable[[Any], Any]
+            Function to apply
+        dtype : Any, optional
+            Type of the results, by default the type of this column
+
+        Returns
+        -------
+        ColumnIterator
+            Column of the results
+
+        Examples
+        --------
+        >>> iterator(range(5)).columns("l").map(lambda x: x * 2).to_array()
+            array("l", [0, 2, 4, 6, 8])
+        """
+        dtype = self._dtype if dtype is None else dtype
+        chunks: Iterator[Chunk]
+        if self._numpy:
+            chunks = (np.asarray(func(c), dtype=dtype) for c in self._chunks)
+        else:
+            chunks = (array.array(dtype, map(func, c)) for c in self._chunks)
+        return ColumnIterator(chunks, dtype, self._numpy)
+
+    def filter(self, func: Callable[[Any], Any]) -> "ColumnIterator":
+        """
+        Only keep the elements for which `func` returns True.
+
+        Notes
+        -----
+        With numpy, `func` is called with whole chunks and must return
+        a boolean mask, like comparison operators do.
+
+        Parameters
+        ----------
+        func : Callable[[Any], Any]
+            Predicate
+
+        Returns
+        -------
+        ColumnIterator
+            Column of the kept elements
+
+        Examples
+        --------
+        >>> iterator([-1.5, 2.0, 0.5]).columns().filter(lambda x: x > 0).sum()
+            2.5
+        """
+        if self._numpy:
+            chunks: Iterable[Chunk] = (c[func(c)] for c in self._chunks)
+        else:
+            chunks = (
+                array.array(c.typecode, itertools.compress(c, map(func, c)))
+                for c in self._chunks
+            )
+        return ColumnIterator(filter(len, chunks), self._dtype, self._numpy)
+
+    def sum(self) -> Optional[Any]:
+        """
+        Sum up all elements
+
+        Returns
+        -------
+        Optional[Any]
+            The sum of all elements or `None` if the column is empty
+        """
+        sums = [c.sum().item() if self._numpy else sum(c) for c in self._chunks]
+        return sum(sums) if sums else None
+
+    def min(self) -> Any:
+        """
+        Return the minimum element
+
+        Raises
+        ------
+        EmptyIteratorError
+            If the column is empty
+        """
+        return self._reduce(min, "min")
+
+    def max(self) -> Any:
+        """
+        Return the maximum element
+
+        Raises
+        ------
+        EmptyIteratorError
+            If the column is empty
+        """
+        return self._reduce(max, "max")
+
+    def count(self) -> int:
+        """
+        Return the number of elements
+        """
+        return sum(map(len, self._chunks))
+
+    def to_array(self) -> Chunk:
+        """
+        Collect all elements into a single `array.array` or `numpy.ndarray`
+        """
+        if self._numpy:
+            chunks = list(self._chunks)
+            if not chunks:
+                return np.empty(0, dtype=self._dtype)
+            return np.concatenate(chunks)
+        result = array.array(self._dtype)
+        for c in self._chunks:
+            result.extend(c)
+        return result
+
+    def _reduce(self, func: Callable[[Iterable[Any]], Any], name: str) -> Any:
+        if self._numpy:
+            # numpy arrays have .min() and .max() methods returning numpy scalars
+            results: List[Any] = [getattr(c, name)().item() for c in self._chunks]
+        else:
+            results = list(map(func, self._chunks))
+        if not results:
+            raise EmptyIteratorError(f"Can not get `{name}` of empty iterator")
+        return func(results)
+
+
+def columns(
+    it: Iterator[Any], dtype: Any, chunk_size: int, numpy: Optional[bool]
+) -> ColumnIterator:
+    """
+    See `FluentIterator.columns`
+    """
+    use_numpy = _use_numpy(numpy)
+    return ColumnIterator(_chunks(it, dtype, chunk_size, use_numpy), dtype, use_numpy)
+
+
+def to_array(it: Iterator[Any], dtype: Any, numpy: Optional[bool]) -> Chunk:
+    """
+    See `FluentIterator.to_array`
+    """
+    if _use_numpy(numpy):
+        return np.fromiter(it, dtype)
+    return array.array(dtype, it)
+
+
+def _chunks(
+    it: Iterator[Any], dtype: Any, chunk_size: int, use_numpy: bool
+) -> Generator[Chunk, None, None]:
+    while True:
+        part = itertools.islice(it, chunk_size)
+        chunk = np.fromiter(part, dtype) if use_numpy else array.array(dtype, part)
+        if not len(chunk):
+            return
+        yield chunk
+
+
+def _use_numpy(numpy: Optional[bool]) -> bool:
+    if numpy is None:
+        return np is not None
+    if numpy and np is None:
+        raise RequiresExtraError(
+            "This feature requires extra `numpy` "
+            "Install with `pip install 'fluentiter[numpy]'`"
+        )
+    return numpy
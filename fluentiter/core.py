@@ -1,16 +1,27 @@
+import collections
+import contextvars
+import copy
 import functools
+import heapq
+import io
 import itertools
+import math
+import operator
+import os
 from operator import length_hint
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Counter,
+    Dict,
     Generic,
     Iterable,
     Iterator,
     List,
     Literal,
     Optional,
+    Sequence,
     Tuple,
     Type,
     TypeVar,
@@ -18,9 +29,14 @@ from typing import (
     cast,
 )
 
+from fluentiter.views import SequenceView, WatchedIterator
+
 if TYPE_CHECKING:
     from fluentiter import more  # pragma: no cover
+    from fluentiter.cache import CachedIterable  # pragma: no cover
+    from fluentiter.columnar import Chunk, ColumnIterator  # pragma: no cover
     from fluentiter.itertypes import (  # pragma: no cover
+        BatchedIterator,
         ChainedIterator,
         CycleIterator,
         EnumerateIterator,
@@ -28,20 +44,47 @@ if TYPE_CHECKING:
         FilterMapIterator,
         FlatMapIterator,
         FlattenIterator,
+        GroupConsecutiveIterator,
+        HashJoinIterator,
         InspectIterator,
+        MapBatchesIterator,
+        MapCachedIterator,
         MapIterator,
         MapWhileIterator,
+        MergeJoinIterator,
         ScanIterator,
         SkipNIterator,
         SkipWhileIterator,
+        SortedIterator,
         StepByIterator,
         TakeNIterator,
         TakeWhileIterator,
+        TopKWindowIterator,
         TumblingWindowIterator,
+        UniqueApproxIterator,
+        UniqueIterator,
         ZippedIterator,
     )
+    from fluentiter.memo import Cache  # pragma: no cover
+    from fluentiter.parallel import (  # pragma: no cover
+        ParFilterIterator,
+        ParMapIterator,
+    )
+    from fluentiter.profiling import Profile  # pragma: no cover
+    from fluentiter.views import View  # pragma: no cover
+
+# profile recording the pipelines built in the current context, it is defined
+# here, so `fluentiter.profiling` is only imported once profiling is used
+ACTIVE_PROFILE: "contextvars.ContextVar[Optional[Profile]]" = contextvars.ContextVar(
+    "fluentiter_active_profile", default=None
+)
+
+# types for which `math.prod` gives the same results as multiplying in a loop
+_NUMBERS = (int, float, complex, bool)
+# types for which the builtin `sum` gives the same results as adding in a loop,
+# since Python 3.12 it adds floats with compensated summation
+_INTEGERS = (int, bool)
 
-ITER_STOP = object()
 Inner = TypeVar("Inner", covariant=True)
 T = TypeVar("T", covariant=True)
 U = TypeVar("U")
@@ -53,14 +96,82 @@ class FluentIterator(Generic[T], Iterator[T]):
     Easy to use container for iterables
     """
 
+    __slots__ = ("_iterable", "_view")
+
     def __init__(self, iterable: Iterable[T]) -> None:
-        self._iterable = iter(iterable)
+        self._view: Optional["View"]
+        if isinstance(iterable, FluentIterator):
+            self._view = iterable._sized_view()
+            self._iterable = iterable._fuse()
+        else:
+            self._iterable = iter(iterable)
+            self._view = SequenceView.of(iterable, self._iterable)
+
+    def _unwrap(self) -> Iterator[T]:
+        """
+        Return the iterator this FluentIterator draws its elements from.
+
+        Adapters build on top of this instead of on the FluentIterator itself,
+        so a chain like `.map(f).filter(g)` becomes nested builtin iterators
+        without a Python level `__next__` call between the stages.
+        """
+        it = self._iterable if type(self).__next__ is FluentIterator.__next__ else self
+        profile = ACTIVE_PROFILE.get()
+        if profile is not None:
+            return profile.track_output(self, it)
+        return it
+
+    def _fuse(self) -> Iterator[T]:
+        """
+        Like `_unwrap`, but for an adapter built on top of this iterator.
+
+        The adapter draws from the same iterator as this one, so elements
+        pulled from this one directly are missing in the adapter. Those pulls
+        go through a `WatchedIterator` from now on, which tells the views of
+        the adapters, and `peek` which must not consume an element then.
+        """
+        it = self._unwrap()
+        if (
+            type(self).__next__ is FluentIterator.__next__
+            and type(self._iterable) is not WatchedIterator
+        ):
+            self._iterable = WatchedIterator(self._iterable, self._sized_view())
+        return it
+
+    def _track(self, func: Callable[..., R]) -> Callable[..., R]:
+        """
+        Wrap a function given to this iterator, so its calls are recorded
+        while profiling. Otherwise `func` is returned as is.
+        """
+        profile = ACTIVE_PROFILE.get()
+        if profile is not None:
+            return profile.track_callable(self, func)
+        return func
 
-    def _infallible_next(self) -> Union[T, object]:
+    def _sized_view(self) -> Optional["View"]:
+        """
+        Return the view describing the remaining elements, if this iterator
+        draws them from a list, tuple or range through length preserving
+        adapters only. Terminals use it to answer without iterating.
+        """
         try:
-            return next(self._iterable)
-        except StopIteration:
-            return ITER_STOP
+            view = self._view
+        except AttributeError:
+            # adapters which do not preserve the length never set a view
+            return None
+        if view is None or not view.valid():
+            return None
+        return view
+
+    def _unshared_view(self) -> Optional["View"]:
+        """
+        Like `_sized_view`, but only if no adapter was built on this iterator.
+        Those draw from the same iterator, so they would still yield the
+        elements terminals skip through the view.
+        """
+        if type(self._iterable) is WatchedIterator:
+            return None
+        return self._sized_view()
 
     def next(self) -> T:
         """
@@ -82,25 +193,86 @@ class FluentIterator(Generic[T], Iterator[T]):
 
     def size_hint(self) -> Union[int, None]:
         """
-        Get an estimate of the number of elements in
-        this iterator or `None` if the value can not be
-        estimated.
+        Get the number of remaining elements in
+        this iterator or `None` if it is not known exactly.
+        Use `size_bounds` to get an estimate instead.
 
         Returns
         -------
         Union[int, None]
             Length hint
+
+        Examples
+        --------
+        >>> iterator([1, 2, 3]).map(str).size_hint()
+            3
+        >>> iterator([1, 2, 3]).filter(is_even).size_hint()
+            None
         """
-        hint = length_hint(self._iterable, -1)
-        if hint == -1:
-            return None
-        return hint
+        lower, upper = self.size_bounds()
+        if lower == upper:
+            return lower
+        return None
+
+    def size_bounds(self) -> Tuple[int, Optional[int]]:
+        """
+        Get a lower and an upper bound of the number of remaining
+        elements in this iterator. The upper bound is `None` if it is
+        unknown or the iterator is infinite.
+
+        This allows to decide up front whether the elements can be
+        buffered or must be streamed.
+
+        Returns
+        -------
+        Tuple[int, Optional[int]]
+            Lower and upper bound
+
+        Examples
+        --------
+        >>> iterator([1, 2, 3, 4]).filter(is_even).size_bounds()
+            (0, 4)
+        >>> iterator([1, 2, 3, 4]).chain(my_generator()).size_bounds()
+            (4, None)
+        """
+        view = self._sized_view()
+        if view is not None:
+            remaining = view.remaining()
+            return remaining, remaining
+        from fluentiter.itertypes import PeekIterator
+
+        it = self._iterable
+        if type(it) is WatchedIterator:
+            it = it.source
+        if (
+            isinstance(it, PeekIterator)
+            and type(self)._bounds is not FluentIterator._bounds
+        ):
+            # the bounds derived from the upstream miss the peeked element
+            return it._with_peeked(self._bounds())
+        return self._bounds()
+
+    def _bounds(self) -> Tuple[int, Optional[int]]:
+        """
+        Bounds of the remaining elements, adapters override this to derive
+        them from the bounds of the iterator they were created from.
+        """
+        return _bounds_of(self._iterable)
 
     def count(self) -> int:
         """
         Count the elements in this iterator.
         This will consume the iterator.
 
+        Notes
+        -----
+        If the iterator draws its elements from a list, tuple or range
+        and only `map`, `enumerate`, `zip`, `step_by`, `skip` and `take`
+        were applied, the count is calculated without iterating and the
+        functions given to `map` are not called. The source is still consumed
+        as far as iterating would, unless adapters were built on this iterator,
+        which then iterates.
+
         Returns
         -------
         int
@@ -111,10 +283,16 @@ class FluentIterator(Generic[T], Iterator[T]):
         >>> iterator(range(5)).count()
             5
         """
-        i = 0
-        for _ in self:
-            i += 1
-        return i
+        view = self._unshared_view()
+        if view is not None:
+            count = view.remaining()
+            view.exhaust()
+            self._iterable = iter(())
+            return count
+        # zip with a counter, so the loop runs in C
+        counter = itertools.count()
+        collections.deque(zip(self._unwrap(), counter), maxlen=0)
+        return next(counter)
 
     def last(self) -> Optional[T]:
         """
@@ -124,6 +302,11 @@ class FluentIterator(Generic[T], Iterator[T]):
 
         This consumes the iterator.
 
+        Notes
+        -----
+        Like `count`, this does not iterate over sequences. The functions given
+        to `map` are only called for the last element.
+
         Returns
         -------
         Optional[T]
@@ -143,12 +326,17 @@ class FluentIterator(Generic[T], Iterator[T]):
         """
         from fluentiter.exceptions import EmptyIteratorError
 
-        has_elems = False
-        for y in self:
-            has_elems = True
-            x = y
-        if has_elems:
-            return x
+        tail: Sequence[T]
+        view = self._unshared_view()
+        if isinstance(view, SequenceView):
+            remaining = view.remaining_indices()
+            tail = [view.value(remaining[-1])] if remaining else []
+            view.exhaust()
+            self._iterable = iter(())
+        else:
+            tail = collections.deque(self._unwrap(), maxlen=1)
+        if tail:
+            return tail[0]
         raise EmptyIteratorError
 
     def nth(self, index: int) -> Optional[T]:
@@ -160,6 +348,8 @@ class FluentIterator(Generic[T], Iterator[T]):
         Notes
         -----
         This method consumes the iterator up to and including `index`.
+        Like `count`, this does not iterate over sequences and the functions
+        given to `map` are only called for the returned element.
 
         Parameters
         ----------
@@ -181,10 +371,21 @@ class FluentIterator(Generic[T], Iterator[T]):
         >>> iterator(["n", "t", "h"]).nth(1)
             "t"
         """
+        if index < 0:
+            raise ValueError("Index must be positive")
+        view = self._unshared_view()
+        if isinstance(view, SequenceView):
+            remaining = view.remaining_indices()
+            if index >= len(remaining):
+                view.exhaust()
+                self._iterable = iter(())
+                raise IndexError
+            value = view.value(remaining[index])
+            view.advance(index + 1)
+            self._iterable = view.iterate()
+            return cast(T, value)
         try:
-            if index < 0:
-                raise ValueError("Index must be positive")
-            return self.skip(index).next()
+            return next(itertools.islice(self._unwrap(), index, None))
         except StopIteration:
             raise IndexError
 
@@ -271,6 +472,125 @@ class FluentIterator(Generic[T], Iterator[T]):
 
         return ZippedIterator(self, iterator(other))
 
+    def join(
+        self,
+        other: Iterable[U],
+        left_key: Callable[[T], Any],
+        right_key: Optional[Callable[[U], Any]] = None,
+        how: Literal["inner", "left", "outer"] = "inner",
+    ) -> "HashJoinIterator[T, U]":
+        """
+        Join this iterator with another iterable, yielding a tuple
+        `(left, right)` for every pair of elements with equal keys.
+
+        With `how="left"` elements of this iterator without a match are yielded
+        as `(left, None)`, with `how="outer"` elements of `other` without a
+        match are also yielded as `(None, right)`.
+
+        Notes
+        -----
+        - A hash table of one side is built, the other side is streamed.
+          By default the table is built from `other`. If the size of this
+          iterator is known and smaller than that of `other`, see `size_bounds`,
+          the table is built from this iterator instead.
+        - The pairs are yielded in the order of the streamed side, unmatched
+          elements of the other side are yielded last.
+        - Use `merge_join` for large inputs which are sorted by key.
+
+        Parameters
+        ----------
+        other : Iterable[U]
+            Iterable to join this iterator with
+        left_key : Callable[[T], Any]
+            Function returning the key of an element of this iterator
+        right_key : Optional[Callable[[U], Any]], optional
+            Function returning the key of an element of `other`,
+            by default `left_key`
+        how : Literal["inner", "left", "outer"], optional
+            Which unmatched elements to yield, by default "inner"
+
+        Returns
+        -------
+        FluentIterator[Tuple[Optional[T], Optional[U]]]
+            Iterator of joined pairs
+
+        Raises
+        ------
+        ValueError
+            If `how` is not one of "inner", "left" or "outer"
+
+        Examples
+        --------
+        >>> users = [{"id": 1, "name": "Arthur"}, {"id": 2, "name": "Ford"}]
+        >>> events = [{"user": 2, "action": "hitchhike"}]
+        >>> iterator(events).join(users, lambda e: e["user"], lambda u: u["id"]).to_list()
+            [({"user": 2, "action": "hitchhike"}, {"id": 2, "name": "Ford"})]
+        """
+        from fluentiter import iterator
+        from fluentiter.itertypes import HashJoinIterator
+
+        _validate_how(how)
+        return HashJoinIterator(
+            self,
+            iterator(other),
+            left_key,
+            right_key or left_key,  # type: ignore[arg-type]
+            how,
+        )
+
+    def merge_join(
+        self,
+        other: Iterable[U],
+        left_key: Callable[[T], Any],
+        right_key: Optional[Callable[[U], Any]] = None,
+        how: Literal["inner", "left", "outer"] = "inner",
+    ) -> "MergeJoinIterator[T, U]":
+        """
+        Like `join`, but for inputs which are both sorted by key in ascending
+        order. Both sides are streamed, only the elements of `other` sharing
+        the current key are kept in memory.
+
+        The pairs are yielded in the order of the keys.
+
+        Parameters
+        ----------
+        other : Iterable[U]
+            Iterable to join this iterator with
+        left_key : Callable[[T], Any]
+            Function returning the key of an element of this iterator
+        right_key : Optional[Callable[[U], Any]], optional
+            Function returning the key of an element of `other`,
+            by default `left_key`
+        how : Literal["inner", "left", "outer"], optional
+            Which unmatched elements to yield, by default "inner"
+
+        Returns
+        -------
+        FluentIterator[Tuple[Optional[T], Optional[U]]]
+            Iterator of joined pairs
+
+        Raises
+        ------
+        ValueError
+            If `how` is not one of "inner", "left" or "outer"
+
+        Examples
+        --------
+        >>> iterator([1, 2, 4]).merge_join([2, 3, 4], lambda x: x, how="outer").to_list()
+            [(1, None), (2, 2), (None, 3), (4, 4)]
+        """
+        from fluentiter import iterator
+        from fluentiter.itertypes import MergeJoinIterator
+
+        _validate_how(how)
+        return MergeJoinIterator(
+            self,
+            iterator(other),
+            left_key,
+            right_key or left_key,  # type: ignore[arg-type]
+            how,
+        )
+
     def map(self, func: Callable[[T], R]) -> "MapIterator[R]":
         """
         Apply a given function `func` to every element of the iterator,
@@ -298,6 +618,114 @@ class FluentIterator(Generic[T], Iterator[T]):
 
         return MapIterator(self, func)
 
+    def map_cached(
+        self,
+        func: Callable[[T], R],
+        cache: Optional["Cache"] = None,
+        key: Optional[Callable[[T], Any]] = None,
+    ) -> "MapCachedIterator[R]":
+        """
+        Like `.map`, but call `func` only once for repeated elements
+        and look up its result in a cache instead.
+
+        Notes
+        -----
+        `func` may be called again for an element whose result
+        was evicted from the cache. The cache keeps counting hits and misses
+        and can be read after the run, it is also available as the `memo`
+        attribute of the returned iterator.
+
+        Parameters
+        ----------
+        func : Callable[[T], R]
+            Function to apply to every element.
+        cache : Optional[Cache], optional
+            Cache of the results, e.g. `fluentiter.memo.LRU(maxsize)` or
+            `fluentiter.memo.TTL(ttl)`, by default an LRU of 1024 results
+        key : Optional[Callable[[T], Any]], optional
+            Function returning the hashable cache key of an element,
+            e.g. for unhashable elements, by default the element itself
+
+        Returns
+        -------
+        MapCachedIterator[R]
+            Iterator yielding the function call results
+
+        Examples
+        --------
+        >>> from fluentiter.memo import LRU
+        >>> cities = iterator(clicks).map_cached(geo_lookup, LRU(10_000), key=ip_of)
+        >>> cities.to_list()
+        >>> cities.memo.hit_rate
+            0.97
+        """
+        from fluentiter.itertypes import MapCachedIterator
+        from fluentiter.memo import LRU
+
+        return MapCachedIterator(self, func, LRU() if cache is None else cache, key)
+
+    def par_map(
+        self,
+        func: Callable[[T], R],
+        workers: Optional[int] = None,
+        ordered: bool = True,
+        prefetch: Optional[int] = None,
+        executor: Literal["thread", "process"] = "thread",
+        chunksize: int = 1,
+    ) -> "ParMapIterator[R]":
+        """
+        Like `.map`, but apply `func` to the elements concurrently on a pool
+        of workers.
+
+        Use `executor="thread"` if `func` is I/O bound, e.g. it makes HTTP requests
+        or database queries, and `executor="process"` if `func` is CPU bound.
+
+        Notes
+        -----
+        - The iterator stays lazy: at most `prefetch` chunks are taken from
+          this iterator before their results have been yielded.
+        - With `executor="process"` `func` and the elements must be picklable.
+          Use a larger `chunksize` to reduce the pickling overhead.
+
+        Parameters
+        ----------
+        func : Callable[[T], R]
+            Function to apply to every element.
+        workers : Optional[int], optional
+            Number of workers, by default the same as for the
+            executors in `concurrent.futures`
+        ordered : bool, optional
+            Yield results in the order of the elements, by default True.
+            If `False` results are yielded as soon as they are available.
+        prefetch : Optional[int], optional
+            Maximum number of chunks in flight, by default `2 * workers`
+        executor : Literal["thread", "process"], optional
+            Whether to use a pool of threads or processes, by default "thread"
+        chunksize : int, optional
+            Number of elements sent to a worker at once, by default 1
+
+        Returns
+        -------
+        FluentIterator[R]
+            Iterator yielding the function call results
+
+        Raises
+        ------
+        ValueError
+            If `workers`, `prefetch` or `chunksize` is <= 0
+
+        Examples
+        --------
+        >>> iterator(urls).par_map(requests.get, workers=8).map(lambda r: r.status_code).to_list()
+            [200, 200, 404]
+        """
+        from fluentiter.parallel import ParMapIterator, validate_arguments
+
+        validate_arguments(workers, prefetch, executor, chunksize)
+        return ParMapIterator(
+            self, func, workers, ordered, prefetch, executor, chunksize
+        )
+
     def filter(self, func: Callable[[T], bool]) -> "FilterIterator[T]":
         """
         Create a filtered iterator by applying a function to every element
@@ -325,6 +753,57 @@ class FluentIterator(Generic[T], Iterator[T]):
 
         return FilterIterator(self, func)
 
+    def par_filter(
+        self,
+        func: Callable[[T], bool],
+        workers: Optional[int] = None,
+        ordered: bool = True,
+        prefetch: Optional[int] = None,
+        executor: Literal["thread", "process"] = "process",
+        chunksize: int = 1024,
+    ) -> "ParFilterIterator[T]":
+        """
+        Like `.filter`, but evaluate `func` concurrently on a pool of workers.
+        See `.par_map` for details on the parameters.
+
+        Parameters
+        ----------
+        func : Callable[[T], bool]
+            Function to apply as a filter.
+        workers : Optional[int], optional
+            Number of workers, by default the same as for the
+            executors in `concurrent.futures`
+        ordered : bool, optional
+            Keep the order of the elements, by default True
+        prefetch : Optional[int], optional
+            Maximum number of chunks in flight, by default `2 * workers`
+        executor : Literal["thread", "process"], optional
+            Whether to use a pool of threads or processes, by default "process"
+        chunksize : int, optional
+            Number of elements sent to a worker at once, by default 1024
+
+        Returns
+        -------
+        FluentIterator[T]
+            Filtered iterator
+
+        Raises
+        ------
+        ValueError
+            If `workers`, `prefetch` or `chunksize` is <= 0
+
+        Examples
+        --------
+        >>> iterator(range(10**6)).par_filter(is_prime).take(3).to_list()
+            [2, 3, 5]
+        """
+        from fluentiter.parallel import ParFilterIterator, validate_arguments
+
+        validate_arguments(workers, prefetch, executor, chunksize)
+        return ParFilterIterator(
+            self, func, workers, ordered, prefetch, executor, chunksize
+        )
+
     def filter_map(self, func: Callable[[T], Optional[R]]) -> "FilterMapIterator[R]":
         """
         A combination of `.map` and `.filter`. Apply a given function to every
@@ -380,6 +859,10 @@ class FluentIterator(Generic[T], Iterator[T]):
         Calling peek multiple times consecutively always returns
         the same element
 
+        Once adapters were built on this iterator, it can only be peeked if
+        it draws from a list, tuple or range. The functions given to `map`
+        are then called for the peeked element again when it is pulled.
+
         Returns
         -------
         T
@@ -389,6 +872,9 @@ class FluentIterator(Generic[T], Iterator[T]):
         ------
         StopIteration
             If there is no next element to peek
+        ValueError
+            If adapters were built on this iterator and the next element
+            can not be looked up without consuming it
 
         Examples
         --------
@@ -402,10 +888,128 @@ class FluentIterator(Generic[T], Iterator[T]):
         """
         from fluentiter.itertypes import PeekIterator
 
-        if not isinstance(self, PeekIterator):
-            self._iterable = PeekIterator(self._iterable)
-        self._iterable = cast(PeekIterator[T], self._iterable)
-        return self._iterable._peeked
+        it = self._iterable
+        if type(it) is WatchedIterator:
+            # adapters draw from `it.source` as well, so the element must be
+            # looked up without consuming it
+            it = it.source
+            if not isinstance(it, PeekIterator):
+                view = self._sized_view()
+                if not isinstance(view, SequenceView):
+                    raise ValueError(
+                        "Can not peek an iterator adapters were built on, "
+                        "unless it draws from a list, tuple or range"
+                    )
+                remaining = view.remaining_indices()
+                if not remaining:
+                    raise StopIteration
+                return cast(T, view.value(remaining[0]))
+        elif not isinstance(it, PeekIterator):
+            it = self._iterable = PeekIterator(it)
+            # the peeked element is consumed from the source already
+            self._view = None
+        if it._peeked is it._sentinel:
+            raise StopIteration
+        return it._peeked
+
+    def unique(
+        self,
+        key: Optional[Callable[[T], Any]] = None,
+        max_seen: Optional[int] = None,
+    ) -> "UniqueIterator[T]":
+        """
+        Create an iterator which only yields the first element of every key.
+        Without a key, the elements themselves are compared.
+
+        Notes
+        -----
+        By default the keys of all yielded elements are remembered. With
+        `max_seen` only the most recently seen keys are remembered, so an
+        element is only skipped if its key was seen among the last `max_seen`
+        distinct keys. Use `unique_approx` to deduplicate a large number of
+        keys in fixed memory.
+
+        Parameters
+        ----------
+        key : Optional[Callable[[T], Any]], optional
+            Function returning the hashable key of an element, by default None
+        max_seen : Optional[int], optional
+            Maximum number of keys to remember, by default unlimited
+
+        Returns
+        -------
+        UniqueIterator[T]
+            Iterator of unique elements
+
+        Raises
+        ------
+        ValueError
+            If `max_seen` is <= 0
+
+        Examples
+        --------
+        >>> iterator([3, 1, 3, 2, 1]).unique().to_list()
+            [3, 1, 2]
+        >>> iterator(["Fish", "fish", "Whale"]).unique(key=str.lower).to_list()
+            ["Fish", "Whale"]
+        """
+        from fluentiter.itertypes import UniqueIterator
+
+        if max_seen is not None and max_seen <= 0:
+            raise ValueError(f"Max seen must be an integer >0. Got {max_seen}")
+        return UniqueIterator(self, key, max_seen)
+
+    def unique_approx(
+        self,
+        capacity: int,
+        error_rate: float = 0.01,
+        key: Optional[Callable[[T], Any]] = None,
+    ) -> "UniqueApproxIterator[T]":
+        """
+        Like `unique`, but remember the seen keys in a Bloom filter of
+        fixed size.
+
+        The filter may wrongly consider a key as seen, so some unique elements
+        are skipped. As long as there are at most `capacity` distinct keys,
+        the rate of such false positives stays below `error_rate`. Duplicates
+        are always skipped.
+
+        Notes
+        -----
+        The filter takes about `-capacity * ln(error_rate) / ln(2)**2` bits,
+        e.g. 1.2 bytes per key at an error rate of 1%.
+
+        Parameters
+        ----------
+        capacity : int
+            Expected number of distinct keys
+        error_rate : float, optional
+            Acceptable rate of falsely skipped elements, by default 0.01
+        key : Optional[Callable[[T], Any]], optional
+            Function returning the hashable key of an element, by default None
+
+        Returns
+        -------
+        UniqueApproxIterator[T]
+            Iterator of (mostly) unique elements
+
+        Raises
+        ------
+        ValueError
+            If `capacity` is <= 0 or `error_rate` is not between 0 and 1
+
+        Examples
+        --------
+        >>> iterator(click_ids).unique_approx(capacity=500_000_000).count()
+            499871232
+        """
+        from fluentiter.itertypes import UniqueApproxIterator
+
+        if capacity <= 0:
+            raise ValueError(f"Capacity must be an integer >0. Got {capacity}")
+        if not 0 < error_rate < 1:
+            raise ValueError(f"Error rate must be between 0 and 1. Got {error_rate}")
+        return UniqueApproxIterator(self, key, capacity, error_rate)
 
     def skip_while(self, func: Callable[[T], bool]) -> "SkipWhileIterator[T]":
         """
@@ -697,10 +1301,115 @@ class FluentIterator(Generic[T], Iterator[T]):
         >>> iterator(["bucket", "to-do", "wish"]).to_list()
             ["bucket", "to-do", "wish"]
         """
-        return list(self)
+        return list(self._unwrap())
+
+    def to_array(self, dtype: Any = "d", numpy: Optional[bool] = None) -> "Chunk":
+        """
+        Collect this iterator of numbers into a `numpy.ndarray` or,
+        if numpy is not installed, an `array.array`, completely consuming it.
+
+        Parameters
+        ----------
+        dtype : Any, optional
+            Type of the elements, an `array` typecode like "d" or "l" works
+            with both, by default "d" (float)
+        numpy : Optional[bool], optional
+            Whether to collect into a numpy array, by default
+            if numpy is installed
+
+        Returns
+        -------
+        Chunk
+            Collected iterator
+
+        Raises
+        ------
+        RequiresExtraError
+            If `numpy` is True, but numpy is not installed
+
+        Examples
+        --------
+        >>> iterator([1, 2, 3]).to_array("l", numpy=False)
+            array("l", [1, 2, 3])
+        """
+        from fluentiter.columnar import to_array
+
+        return to_array(self._unwrap(), dtype, numpy)
+
+    def write_csv(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        header: Union[bool, Sequence[str]] = True,
+        encoding: str = "utf-8",
+        buffer_size: int = io.DEFAULT_BUFFER_SIZE,
+        **fmtparams: Any,
+    ) -> None:
+        """
+        Write the elements of this iterator as rows to a CSV file,
+        completely consuming it. Elements may be dicts or sequences of values.
+
+        Notes
+        -----
+        The rows are handed to the csv writer in a single call and
+        written in blocks of `buffer_size` bytes.
+
+        Parameters
+        ----------
+        path : Union[str, os.PathLike[str]]
+            Path of the file, which is overwritten
+        header : Union[bool, Sequence[str]], optional
+            True to write the keys of the first dict as header, a sequence
+            of column names or False to write no header, by default True.
+            The columns also select which values of dicts are written.
+        encoding : str, optional
+            Encoding of the file, by default "utf-8"
+        buffer_size : int, optional
+            Size of the write buffer in bytes, by default io.DEFAULT_BUFFER_SIZE
+        **fmtparams : Any
+            Formatting parameters passed on to `csv.writer`, e.g. `delimiter`
+
+        Raises
+        ------
+        KeyError
+            If a dict misses one of the columns
+
+        Examples
+        --------
+        >>> iterator([{"name": "Bielefeld", "country": "Germany"}]).write_csv("cities.csv")
+        """
+        from fluentiter.io import write_csv
+
+        write_csv(self._unwrap(), path, header, encoding, buffer_size, **fmtparams)
+
+    def write_jsonl(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        encoding: str = "utf-8",
+        buffer_size: int = io.DEFAULT_BUFFER_SIZE,
+    ) -> None:
+        """
+        Write the elements of this iterator to a file as JSON, one per line,
+        completely consuming it.
+
+        Parameters
+        ----------
+        path : Union[str, os.PathLike[str]]
+            Path of the file, which is overwritten
+        encoding : str, optional
+            Encoding of the file, by default "utf-8"
+        buffer_size : int, optional
+            Size of the write buffer in bytes, by default io.DEFAULT_BUFFER_SIZE
+
+        Examples
+        --------
+        >>> iterator([{"type": "click"}, {"type": "view"}]).write_jsonl("events.jsonl")
+        """
+        from fluentiter.io import write_jsonl
+
+        write_jsonl(self._unwrap(), path, encoding, buffer_size)
 
     def partition(
-        self, func: Callable[[T], bool]
+        self, func: Callable[[T], bool], max_memory: Optional[int] = None
     ) -> Tuple["FluentIterator[T]", "FluentIterator[T]"]:
         """
         Create two iterators from this one, by applying `func` to every element.
@@ -708,10 +1417,21 @@ class FluentIterator(Generic[T], Iterator[T]):
         first iterator, all those for which it returns `True` wil become part
         of the second iterator
 
+        Notes
+        -----
+        Elements taken from this iterator by one of the returned iterators are
+        buffered until the other one yields them. If one side is consumed first,
+        the whole other side is buffered. Set `max_memory` to pickle the elements
+        to a temporary file past that limit, or use `partition_into` to
+        consume both sides at once.
+
         Parameters
         ----------
         func : Callable[[T], bool]
             Function to apply to sort elements into partitions
+        max_memory : Optional[int], optional
+            Maximum number of elements buffered in memory by each of the
+            returned iterators, by default unlimited
 
         Returns
         -------
@@ -728,13 +1448,61 @@ class FluentIterator(Generic[T], Iterator[T]):
         """
         from fluentiter import iterator
         from fluentiter.more import miter
-
-        a, b = miter.partition(func, self)
+        from fluentiter.spill import SpillQueue, drain
+
+        _validate_max_memory(max_memory)
+        source = self._unwrap()
+        profile = ACTIVE_PROFILE.get()
+        if profile is not None:
+            source, track = profile.track_buffered("partition", source, copies=1)
+        if max_memory is None:
+            a, b = miter.partition(func, source)
+        else:
+            falses: SpillQueue[T] = SpillQueue(max_memory)
+            trues: SpillQueue[T] = SpillQueue(max_memory)
+
+            def route(x: Any) -> None:
+                (trues if func(x) else falses).append(x)
+
+            a, b = drain(source, route, falses), drain(source, route, trues)
+        if profile is not None:
+            return iterator(track(a)), iterator(track(b))
         return iterator(a), iterator(b)
 
-    A = TypeVar("A")
-
-    def fold(self, initial_value: A, func: Callable[[A, T], A]) -> A:
+    def partition_into(
+        self,
+        func: Callable[[T], bool],
+        false_sink: Callable[[T], Any],
+        true_sink: Callable[[T], Any],
+    ) -> None:
+        """
+        Like `partition`, but consume this iterator at once and push every
+        element to one of two sinks instead of returning two iterators.
+        Nothing is buffered.
+
+        Parameters
+        ----------
+        func : Callable[[T], bool]
+            Function to apply to sort elements into partitions
+        false_sink : Callable[[T], Any]
+            Called with every element for which `func(element) == False`
+        true_sink : Callable[[T], Any]
+            Called with every element for which `func(element) == True`
+
+        Examples
+        --------
+        >>> errors, others = [], []
+        >>> iterator(log_lines).partition_into(is_error, others.append, errors.append)
+        """
+        for x in self._unwrap():
+            if func(x):
+                true_sink(x)
+            else:
+                false_sink(x)
+
+    A = TypeVar("A")
+
+    def fold(self, initial_value: A, func: Callable[[A, T], A]) -> A:
         """
         Fold every element of this iterator into a single value by repeatedly
         applying `func`.
@@ -766,10 +1534,68 @@ class FluentIterator(Generic[T], Iterator[T]):
         >>> iterator(["hot", "dog", "bun"]).fold(1, lambda a, x: a + len(x))
             10
         """
-        acc = initial_value
-        for x in self:
-            acc = func(acc, x)
-        return acc
+        return functools.reduce(func, self._unwrap(), initial_value)
+
+    def par_fold(
+        self,
+        initial_value: A,
+        func: Callable[[A, T], A],
+        combine: Callable[[A, A], A],
+        workers: Optional[int] = None,
+        executor: Literal["thread", "process"] = "process",
+        chunksize: int = 1024,
+    ) -> A:
+        """
+        Like `.fold`, but fold chunks of `chunksize` elements concurrently
+        on a pool of workers. The partial results of all chunks are then
+        merged in order by repeatedly applying `combine`.
+
+        For an empty iterator this returns the initial value.
+
+        Notes
+        -----
+        - Every chunk is folded starting from `initial_value`, so it should
+          be neutral for `combine`, e.g. `0` for addition.
+        - With `executor="process"` the functions, the elements and the
+          accumulators must be picklable.
+
+        Parameters
+        ----------
+        initial_value : A
+            Initial value of the accumulator of every chunk
+        func : Callable[[A, T], A]
+            Folding function
+        combine : Callable[[A, A], A]
+            Function merging two partial results
+        workers : Optional[int], optional
+            Number of workers, by default the same as for the
+            executors in `concurrent.futures`
+        executor : Literal["thread", "process"], optional
+            Whether to use a pool of threads or processes, by default "process"
+        chunksize : int, optional
+            Number of elements folded by a worker at once, by default 1024
+
+        Returns
+        -------
+        A
+            Folded value
+
+        Raises
+        ------
+        ValueError
+            If `workers` or `chunksize` is <= 0
+
+        Examples
+        --------
+        >>> iterator(range(10**6)).par_fold(0, operator.add, operator.add)
+            499999500000
+        """
+        from fluentiter.parallel import par_fold, validate_arguments
+
+        validate_arguments(workers, None, executor, chunksize)
+        return par_fold(
+            self._unwrap(), initial_value, func, combine, workers, executor, chunksize
+        )
 
     def reduce(self, func: Callable[[T, R], R]) -> Union[T, R]:
         """
@@ -809,7 +1635,7 @@ class FluentIterator(Generic[T], Iterator[T]):
         from fluentiter.exceptions import EmptyIteratorError
 
         try:
-            return functools.reduce(func, self)  # type: ignore[arg-type]
+            return functools.reduce(func, self._unwrap())  # type: ignore[arg-type]
         except TypeError:
             raise EmptyIteratorError("Cannot reduce an empty iterator")
 
@@ -837,10 +1663,7 @@ class FluentIterator(Generic[T], Iterator[T]):
         >>> iterator([]).any()
         False
         """
-        for x in self:
-            if func(x):
-                return True
-        return False
+        return any(map(func, self._unwrap()))
 
     def find(self, func: Callable[[T], bool]) -> T:
         """
@@ -872,9 +1695,8 @@ class FluentIterator(Generic[T], Iterator[T]):
         """
         from fluentiter.exceptions import NotFoundError
 
-        for x in self:
-            if func(x):
-                return x
+        for x in filter(func, self._unwrap()):
+            return x
         raise NotFoundError("No element matching the given predicate")
 
     def position(self, func: Callable[[T], bool]) -> Union[int, Literal[-1]]:
@@ -899,7 +1721,7 @@ class FluentIterator(Generic[T], Iterator[T]):
         >>> iterator(["bert", "waldo", "ernie"]).position(lambda x: x == "waldo")
             1
         """
-        for i, e in enumerate(self):
+        for i, e in enumerate(self._unwrap()):
             if func(e):
                 return i
         return -1
@@ -935,8 +1757,8 @@ class FluentIterator(Generic[T], Iterator[T]):
 
         try:
             if key is None:
-                return max(self)  # type: ignore[type-var]
-            return max(self, key=key)
+                return max(self._unwrap())  # type: ignore[type-var]
+            return max(self._unwrap(), key=key)
         except ValueError:
             raise EmptyIteratorError("Can not get `max` of empty iterator")
 
@@ -971,18 +1793,300 @@ class FluentIterator(Generic[T], Iterator[T]):
 
         try:
             if key is None:
-                return min(self)  # type: ignore[type-var]
-            return min(self, key=key)
+                return min(self._unwrap())  # type: ignore[type-var]
+            return min(self._unwrap(), key=key)
         except ValueError:
             raise EmptyIteratorError("Can not get `min` of empty iterator")
 
+    def top_k(self, k: int, key: Optional[Callable[[T], Any]] = None) -> List[T]:
+        """
+        Return the `k` largest elements of this iterator in descending order.
+
+        Only `k` elements are kept in memory at a time, which is much cheaper
+        than sorting all elements when `k` is small.
+
+        If a key is given, the results of `key(element)` will
+        be compared instead of the elements themselves.
+
+        Parameters
+        ----------
+        k : int
+            Number of elements to return
+        key : Optional[Callable[[T], Any]], optional
+            Key to use for comparison, by default None
+
+        Returns
+        -------
+        List[T]
+            Up to `k` largest elements
+
+        Raises
+        ------
+        ValueError
+            If `k` is < 0
+
+        Examples
+        --------
+        >>> iterator([3, 1, 4, 1, 5, 9, 2, 6]).top_k(3)
+            [9, 6, 5]
+        """
+        if k < 0:
+            raise ValueError(f"K must be an integer >=0. Got {k}")
+        return heapq.nlargest(k, self._unwrap(), key=key)  # type: ignore[arg-type]
+
+    def bottom_k(self, k: int, key: Optional[Callable[[T], Any]] = None) -> List[T]:
+        """
+        Return the `k` smallest elements of this iterator in ascending order.
+        See `top_k` for details.
+
+        Parameters
+        ----------
+        k : int
+            Number of elements to return
+        key : Optional[Callable[[T], Any]], optional
+            Key to use for comparison, by default None
+
+        Returns
+        -------
+        List[T]
+            Up to `k` smallest elements
+
+        Raises
+        ------
+        ValueError
+            If `k` is < 0
+
+        Examples
+        --------
+        >>> iterator([3, 1, 4, 1, 5, 9, 2, 6]).bottom_k(3)
+            [1, 1, 2]
+        """
+        if k < 0:
+            raise ValueError(f"K must be an integer >=0. Got {k}")
+        return heapq.nsmallest(k, self._unwrap(), key=key)  # type: ignore[arg-type]
+
+    K = TypeVar("K")
+
+    def group_by(self, key: Callable[[T], K]) -> Dict[K, List[T]]:
+        """
+        Collect the elements of this iterator into lists by the result of `key`.
+
+        Notes
+        -----
+        This keeps every element in memory. If only an aggregate of every
+        group is needed, use `count_by`, `reduce_by_key` or `aggregate_by`,
+        which only keep one value per key.
+
+        Parameters
+        ----------
+        key : Callable[[T], K]
+            Function returning the group of an element
+
+        Returns
+        -------
+        Dict[K, List[T]]
+            Lists of elements by key, in the order the keys were first seen
+
+        Examples
+        --------
+        >>> iterator(["apple", "avocado", "banana"]).group_by(lambda x: x[0])
+            {"a": ["apple", "avocado"], "b": ["banana"]}
+        """
+        groups: Dict[Any, List[T]] = collections.defaultdict(list)
+        for x in self._unwrap():
+            groups[key(x)].append(x)
+        return dict(groups)
+
+    def count_by(self, key: Optional[Callable[[T], K]] = None) -> Counter[K]:
+        """
+        Count the elements of this iterator by the result of `key`,
+        or count equal elements if no key is given.
+
+        Parameters
+        ----------
+        key : Optional[Callable[[T], K]], optional
+            Function returning the group of an element, by default None
+
+        Returns
+        -------
+        Counter[K]
+            Number of elements by key
+
+        Examples
+        --------
+        >>> iterator(["apple", "avocado", "banana"]).count_by(lambda x: x[0])
+            Counter({"a": 2, "b": 1})
+        """
+        if key is None:
+            return collections.Counter(self._unwrap())  # type: ignore[arg-type]
+        return collections.Counter(map(key, self._unwrap()))
+
+    def reduce_by_key(
+        self, key: Callable[[T], K], func: Callable[[T, T], T]
+    ) -> Dict[K, T]:
+        """
+        Like `reduce`, but reduce the elements of every group separately.
+        Only the reduced value of every key is kept in memory.
+
+        Parameters
+        ----------
+        key : Callable[[T], K]
+            Function returning the group of an element
+        func : Callable[[T, T], T]
+            Reducing function
+
+        Returns
+        -------
+        Dict[K, T]
+            Reduced value by key, in the order the keys were first seen
+
+        Examples
+        --------
+        >>> sales = [("tea", 3), ("coffee", 5), ("tea", 2)]
+        >>> iterator(sales).reduce_by_key(lambda x: x[0], lambda a, x: (a[0], a[1] + x[1]))
+            {"tea": ("tea", 5), "coffee": ("coffee", 5)}
+        """
+        missing = object()
+        result: Dict[Any, Any] = {}
+        for x in self._unwrap():
+            k = key(x)
+            acc = result.get(k, missing)
+            result[k] = x if acc is missing else func(acc, x)
+        return result
+
+    def aggregate_by(
+        self, key: Callable[[T], K], **aggregations: Tuple[Any, Callable[[Any, T], Any]]
+    ) -> Dict[K, Dict[str, Any]]:
+        """
+        Compute several aggregates of every group in a single pass.
+
+        Every aggregation is given as a keyword argument of
+        `(initial_value, func)`. Like in `fold`, `func` receives the accumulator
+        and an element and returns the new accumulator. Every key starts with a
+        copy of `initial_value`. Only the accumulators of every key are kept
+        in memory.
+
+        Parameters
+        ----------
+        key : Callable[[T], K]
+            Function returning the group of an element
+        **aggregations : Tuple[Any, Callable[[Any, T], Any]]
+            Initial value and folding function by name
+
+        Returns
+        -------
+        Dict[K, Dict[str, Any]]
+            Accumulators by name by key, in the order the keys were first seen
+
+        Examples
+        --------
+        >>> requests = [("/home", 120), ("/about", 80), ("/home", 100)]
+        >>> iterator(requests).aggregate_by(
+        >>>     lambda r: r[0],
+        >>>     hits=(0, lambda a, r: a + 1),
+        >>>     bytes=(0, lambda a, r: a + r[1]),
+        >>> )
+            {"/home": {"hits": 2, "bytes": 220}, "/about": {"hits": 1, "bytes": 80}}
+        """
+        names = tuple(aggregations)
+        initials = [initial for initial, _ in aggregations.values()]
+        funcs = tuple(enumerate(func for _, func in aggregations.values()))
+        result: Dict[Any, List[Any]] = {}
+        for x in self._unwrap():
+            k = key(x)
+            accs = result.get(k)
+            if accs is None:
+                accs = result[k] = [copy.copy(initial) for initial in initials]
+            for i, func in funcs:
+                accs[i] = func(accs[i], x)
+        return {k: dict(zip(names, accs)) for k, accs in result.items()}
+
+    def group_consecutive(
+        self, key: Optional[Callable[[T], K]] = None
+    ) -> "GroupConsecutiveIterator[Tuple[K, FluentIterator[T]]]":
+        """
+        Create an iterator yielding a tuple of the key and an iterator of the
+        elements for every run of consecutive elements with the same key.
+        Without a key, runs of equal elements are grouped.
+
+        This is built on `itertools.groupby` and never buffers a group,
+        so for input sorted by key, e.g. log lines or rows of an `ORDER BY`
+        query, it groups in constant memory.
+
+        Notes
+        -----
+        The iterators of the groups share this iterator: advancing to the next
+        group exhausts the previous one. Use `group_consecutive_tuples` to
+        keep the elements of every group.
+
+        Parameters
+        ----------
+        key : Optional[Callable[[T], K]], optional
+            Function returning the group of an element, by default None
+
+        Returns
+        -------
+        GroupConsecutiveIterator[Tuple[K, FluentIterator[T]]]
+            Iterator of key, group tuples
+
+        Examples
+        --------
+        >>> (iterator(["apple", "avocado", "banana", "apricot"])
+        >>>     .group_consecutive(lambda x: x[0])
+        >>>     .map(lambda g: (g[0], g[1].count()))
+        >>>     .to_list()
+        >>> )
+            [("a", 2), ("b", 1), ("a", 1)]
+        """
+        from fluentiter.itertypes import GroupConsecutiveIterator
+
+        return GroupConsecutiveIterator(self, key, collect=False)
+
+    def group_consecutive_tuples(
+        self, key: Optional[Callable[[T], K]] = None
+    ) -> "GroupConsecutiveIterator[Tuple[K, Tuple[T, ...]]]":
+        """
+        Like `group_consecutive`, but collect the elements of every group into
+        a tuple. Only one group is held in memory at a time.
+
+        Parameters
+        ----------
+        key : Optional[Callable[[T], K]], optional
+            Function returning the group of an element, by default None
+
+        Returns
+        -------
+        GroupConsecutiveIterator[Tuple[K, Tuple[T, ...]]]
+            Iterator of key, group tuples
+
+        Examples
+        --------
+        >>> iterator([1, 1, 2, 1]).group_consecutive_tuples().to_list()
+            [(1, (1, 1)), (2, (2,)), (1, (1,))]
+        """
+        from fluentiter.itertypes import GroupConsecutiveIterator
+
+        return GroupConsecutiveIterator(self, key, collect=True)
+
     def unzip(
-        self: "FluentIterator[Tuple[T, U]]",
+        self: "FluentIterator[Tuple[T, U]]", max_memory: Optional[int] = None
     ) -> Tuple["FluentIterator[T]", "FluentIterator[U]"]:
         """
         Unzip an iterator of tuples into two iterators, by building the first one from all first
         elements of each tuple, and the second from all other elements of the tuples.
 
+        Notes
+        -----
+        Like with `partition`, elements are buffered until both iterators yielded
+        them. Set `max_memory` to pickle them to a temporary file past that
+        limit, or use `unzip_into` to consume both sides at once.
+
+        Parameters
+        ----------
+        max_memory : Optional[int], optional
+            Maximum number of elements buffered in memory by each of the
+            returned iterators, by default unlimited
+
         Returns
         -------
         Tuple[FluentIterator[T], FluentIterator[U]]
@@ -997,12 +2101,153 @@ class FluentIterator(Generic[T], Iterator[T]):
             ["beer", "pizza"]
         """
         from fluentiter import iterator
+        from fluentiter.spill import SpillQueue, drain
+
+        _validate_max_memory(max_memory)
+        source = self._unwrap()
+        profile = ACTIVE_PROFILE.get()
+        if profile is not None:
+            source, track = profile.track_buffered("unzip", source, copies=2)
+        first: Iterator[Any]
+        second: Iterator[Any]
+        if max_memory is None:
+            a, b = itertools.tee(source)
+            first = (x[0] for x in a)
+            second = (x[1] if len(x) == 2 else x[1:] for x in b)
+        else:
+            firsts: SpillQueue[T] = SpillQueue(max_memory)
+            seconds: SpillQueue[U] = SpillQueue(max_memory)
+
+            def route(x: Tuple[T, U]) -> None:
+                firsts.append(x[0])
+                seconds.append(x[1] if len(x) == 2 else x[1:])
+
+            first, second = drain(source, route, firsts), drain(source, route, seconds)
+        if profile is not None:
+            return iterator(track(first)), iterator(track(second))
+        return iterator(first), iterator(second)
+
+    def unzip_into(
+        self: "FluentIterator[Tuple[T, U]]",
+        first_sink: Callable[[T], Any],
+        second_sink: Callable[[U], Any],
+    ) -> None:
+        """
+        Like `unzip`, but consume this iterator at once and push the first
+        and the other elements of every tuple to two sinks instead of
+        returning two iterators. Nothing is buffered.
 
-        a, b = itertools.tee(self)
-        return (
-            iterator((x[0] for x in a)),
-            iterator((x[1] if len(x) == 2 else x[1:] for x in b)),  # type: ignore[misc]
-        )
+        Parameters
+        ----------
+        first_sink : Callable[[T], Any]
+            Called with the first element of every tuple
+        second_sink : Callable[[U], Any]
+            Called with the other elements of every tuple
+
+        Examples
+        --------
+        >>> names, ages = [], []
+        >>> iterator([("Arthur", 42), ("Ford", 200)]).unzip_into(names.append, ages.append)
+        >>> names
+            ["Arthur", "Ford"]
+        """
+        for x in self._unwrap():
+            first_sink(x[0])
+            second_sink(x[1] if len(x) == 2 else x[1:])
+
+    def cache(
+        self, max_memory: Optional[int] = None, spill_dir: Optional[str] = None
+    ) -> "CachedIterable[T]":
+        """
+        Turn this iterator into an iterable, which can be iterated
+        any number of times. Elements are pulled from this iterator only
+        once, when the first cursor reaches them, and remembered.
+
+        Notes
+        -----
+        Every `iter(...)` on the returned iterable creates a new
+        `FluentIterator` starting at the first element. Cursors can be
+        consumed independently and interleaved.
+        If `max_memory` is given, all elements past that limit are pickled
+        to a temporary file in `spill_dir` and read back in chunks.
+
+        Parameters
+        ----------
+        max_memory : Optional[int], optional
+            Maximum number of elements held in memory, by default unlimited
+        spill_dir : Optional[str], optional
+            Directory of the temporary file, by default the system default
+
+        Returns
+        -------
+        CachedIterable[T]
+            Re-iterable cache of this iterator
+
+        Raises
+        ------
+        ValueError
+            If `max_memory` is <= 0
+
+        Examples
+        --------
+        >>> rows = iterator(read_rows()).map(expensive).cache()
+        >>> iterator(rows).count()
+            3
+        >>> iterator(rows).map(str).to_list()
+            ["a", "b", "c"]
+        """
+        from fluentiter.cache import CachedIterable
+
+        _validate_max_memory(max_memory)
+        return CachedIterable(self._unwrap(), max_memory, spill_dir)
+
+    def sorted(
+        self,
+        key: Optional[Callable[[T], Any]] = None,
+        reverse: bool = False,
+        max_memory: Optional[int] = None,
+    ) -> "SortedIterator[T]":
+        """
+        Create an iterator yielding the elements of this one in sorted order.
+        Like the builtin `sorted`, the sort is stable.
+
+        Nothing is sorted until the first element is requested, then this
+        iterator is consumed completely.
+
+        Notes
+        -----
+        If `max_memory` is given and this iterator has more elements, an external
+        merge sort is used: sorted runs of `max_memory` elements are pickled to
+        a temporary file and merged lazily while the results are yielded.
+
+        Parameters
+        ----------
+        key : Optional[Callable[[T], Any]], optional
+            Key to use for comparison, by default None
+        reverse : bool, optional
+            Sort in descending order, by default False
+        max_memory : Optional[int], optional
+            Maximum number of elements sorted in memory, by default unlimited
+
+        Returns
+        -------
+        SortedIterator[T]
+            Iterator of the sorted elements
+
+        Raises
+        ------
+        ValueError
+            If `max_memory` is <= 0
+
+        Examples
+        --------
+        >>> iterator(["pear", "fig", "apple"]).sorted(key=len).to_list()
+            ["fig", "pear", "apple"]
+        """
+        from fluentiter.itertypes import SortedIterator
+
+        _validate_max_memory(max_memory)
+        return SortedIterator(self, key, reverse, max_memory)
 
     def cycle(self) -> "CycleIterator[T]":
         """
@@ -1038,6 +2283,13 @@ class FluentIterator(Generic[T], Iterator[T]):
         """
         Sum up all elements in this iterator
 
+        Notes
+        -----
+        Elements are added one after another like `+` does, also floats.
+        Only if the first element is an int or bool the builtin `sum`
+        is used, which since Python 3.12 adds floats following it with
+        compensated summation. This may round differently.
+
         Returns
         -------
         Optional[T]
@@ -1052,14 +2304,19 @@ class FluentIterator(Generic[T], Iterator[T]):
         >>> iterator([]).sum()
             None
         """
-        # built in sum cant work with str
-        sum_ = None
-        for x in self:
-            if sum_ is None:
-                sum_ = x
-                continue
-            sum_ += x
-        return sum_
+        it = self._unwrap()
+        for first in it:
+            break
+        else:
+            return None
+        # builtin sum can not add str, so pick a fast path by the first element
+        if type(first) in _INTEGERS:
+            return sum(it, first)  # type: ignore[call-overload]
+        if type(first) is str:
+            return "".join(itertools.chain((first,), it))  # type: ignore[arg-type,return-value]
+        if type(first) is bytes:
+            return b"".join(itertools.chain((first,), it))  # type: ignore[arg-type,return-value]
+        return functools.reduce(operator.iadd, it, first)
 
     def product(self) -> T:
         """
@@ -1082,14 +2339,14 @@ class FluentIterator(Generic[T], Iterator[T]):
         """
         from fluentiter.exceptions import EmptyIteratorError
 
-        is_empty = True
-        prod = 1
-        for x in self:
-            is_empty = False
-            prod *= x  # type: ignore[operator]
-        if is_empty:
+        it = self._unwrap()
+        for first in it:
+            break
+        else:
             raise EmptyIteratorError("Can not calculate product of an empty iterator")
-        return cast(T, prod)
+        if type(first) in _NUMBERS:
+            return cast(T, math.prod(it, start=first))  # type: ignore[call-overload]
+        return cast(T, functools.reduce(operator.imul, it, 1 * first))  # type: ignore[operator]
 
     def rolling_window(self, size: int) -> "more.RollingWindowIterator[T]":
         """
@@ -1173,6 +2430,173 @@ class FluentIterator(Generic[T], Iterator[T]):
             raise ValueError(f"Size must be an integer >0. Got {size}")
         return TumblingWindowIterator(self, size)
 
+    def top_k_by_window(
+        self, size: int, k: int, key: Optional[Callable[[T], Any]] = None
+    ) -> "TopKWindowIterator[T]":
+        """
+        Create an iterator yielding the `k` largest elements of every
+        non-overlapping window of `size` elements in descending order.
+
+        This is like `.tumbling_window(size).map(lambda w: heapq.nlargest(k, w))`,
+        but the windows are never collected, only `k` elements
+        are kept in memory.
+
+        Parameters
+        ----------
+        size : int
+            Size of the windows
+        k : int
+            Number of elements to keep of every window
+        key : Optional[Callable[[T], Any]], optional
+            Key to use for comparison, by default None
+
+        Returns
+        -------
+        TopKWindowIterator[T]
+            An iterator of lists of up to `k` elements
+
+        Raises
+        ------
+        ValueError
+            If `size` or `k` is <= 0
+
+        Examples
+        --------
+        >>> iterator([3, 1, 4, 1, 5, 9, 2, 6]).top_k_by_window(4, 2).to_list()
+            [[4, 3], [9, 6]]
+        """
+        from fluentiter.itertypes import TopKWindowIterator
+
+        if size <= 0:
+            raise ValueError(f"Size must be an integer >0. Got {size}")
+        if k <= 0:
+            raise ValueError(f"K must be an integer >0. Got {k}")
+        return TopKWindowIterator(self, size, k, key)
+
+    def batched(self, size: int) -> "BatchedIterator[T]":
+        """
+        Create an iterator of lists holding `size` consecutive elements each.
+
+        If the count of elements in the iterator is not cleanly divisable by
+        `size`, the last list will be shorter.
+
+        Notes
+        -----
+        This behaves like `tumbling_window`, but yields lists, which can be
+        handed directly to APIs working on whole chunks of data.
+
+        Parameters
+        ----------
+        size : int
+            Maximum size of each batch
+
+        Returns
+        -------
+        BatchedIterator[T]
+            An iterator of lists
+
+        Raises
+        ------
+        ValueError
+            If `size` is <= 0
+
+        Examples
+        --------
+        >>> iterator(range(5)).batched(2).to_list()
+            [[0, 1], [2, 3], [4]]
+        """
+        from fluentiter.itertypes import BatchedIterator
+
+        if size <= 0:
+            raise ValueError(f"Size must be an integer >0. Got {size}")
+        return BatchedIterator(self, size)
+
+    def map_batches(
+        self, func: Callable[[List[T]], Iterable[R]], size: int = 1024
+    ) -> "MapBatchesIterator[R]":
+        """
+        Apply a function to batches of up to `size` elements and yield the elements
+        of the iterables it returns.
+
+        This allows processing elements in bulk, e.g. with `numpy` or
+        `cursor.executemany`, while still producing a flat iterator.
+
+        Parameters
+        ----------
+        func : Callable[[List[T]], Iterable[R]]
+            Function to apply to every batch
+        size : int, optional
+            Maximum size of each batch, by default 1024
+
+        Returns
+        -------
+        MapBatchesIterator[R]
+            Iterator of the elements returned by `func`
+
+        Raises
+        ------
+        ValueError
+            If `size` is <= 0
+
+        Examples
+        --------
+        >>> iterator(["a", "b", "c"]).map_batches(lambda b: "".join(b).upper(), size=2).to_list()
+            ["A", "B", "C"]
+        """
+        from fluentiter.itertypes import MapBatchesIterator
+
+        if size <= 0:
+            raise ValueError(f"Size must be an integer >0. Got {size}")
+        return MapBatchesIterator(self, func, size)
+
+    def columns(
+        self, dtype: Any = "d", chunk_size: int = 4096, numpy: Optional[bool] = None
+    ) -> "ColumnIterator":
+        """
+        Switch to columnar mode, where the numbers of this iterator are
+        collected into arrays of `chunk_size` elements, which are processed
+        as a whole. The chunks are `numpy.ndarray` or, if numpy is not
+        installed, `array.array`.
+
+        Notes
+        -----
+        With numpy, `map` and `filter` call their function once per chunk,
+        which avoids the overhead of calling Python functions per element.
+        Call `.values()` to get back a `FluentIterator` of single elements.
+
+        Parameters
+        ----------
+        dtype : Any, optional
+            Type of the elements, an `array` typecode like "d" or "l" works
+            with both, by default "d" (float)
+        chunk_size : int, optional
+            Number of elements per chunk, by default 4096
+        numpy : Optional[bool], optional
+            Whether to use numpy arrays, by default if numpy is installed
+
+        Returns
+        -------
+        ColumnIterator
+            Iterator in columnar mode
+
+        Raises
+        ------
+        ValueError
+            If chunk_size is <= 0
+        RequiresExtraError
+            If `numpy` is True, but numpy is not installed
+
+        Examples
+        --------
+        >>> iterator(prices).columns().map(lambda p: p * 1.19).filter(lambda p: p > 10).max()
+            1337.0
+        """
+        from fluentiter.columnar import columns
+
+        if chunk_size <= 0:
+            raise ValueError(f"Chunk size must be an integer >0. Got {chunk_size}")
+        return columns(self._unwrap(), dtype, chunk_size, numpy)
+
     def into(self, into: Callable[["FluentIterator[T]"], R]) -> R:
         """
         Turn this iterator into something else, by calling
@@ -1233,17 +2657,45 @@ class FluentIterator(Generic[T], Iterator[T]):
         result = func(self)
         return iterator(result)
 
-    def __iter__(self) -> "FluentIterator[T]":
+    def __iter__(self) -> Iterator[T]:
+        if ACTIVE_PROFILE.get() is not None:
+            # count the elements of the last stage of a profiled pipeline
+            return self._unwrap()
         return self
 
     def __next__(self) -> T:
-        x = self._infallible_next()
-        if x is ITER_STOP:
-            raise StopIteration
-        return cast(T, x)
+        return next(self._iterable)
 
     def __length_hint__(self) -> int:
-        size_hint = self.size_hint()
-        if size_hint is not None:
-            return size_hint
-        return NotImplemented
+        lower, upper = self.size_bounds()
+        if lower == 0 and upper is None:
+            return NotImplemented
+        return lower
+
+
+def _validate_max_memory(max_memory: Optional[int]) -> None:
+    if max_memory is not None and max_memory <= 0:
+        raise ValueError(f"Max memory must be an integer >0. Got {max_memory}")
+
+
+def _validate_how(how: str) -> None:
+    if how not in ("inner", "left", "outer"):
+        raise ValueError(f"How must be 'inner', 'left' or 'outer'. Got {how!r}")
+
+
+def _bounds_of(it: Iterator[Any]) -> Tuple[int, Optional[int]]:
+    """
+    Size bounds of any iterator, exact if it reports a length hint
+    """
+    if type(it) is WatchedIterator:
+        it = it.source
+    if isinstance(it, FluentIterator):
+        return it.size_bounds()
+    try:
+        hint = length_hint(it, -1)
+    except OverflowError:
+        # e.g. the iterator of a range longer than sys.maxsize
+        return 0, None
+    if hint == -1:
+        return 0, None
+    return hint, hint
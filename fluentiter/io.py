@@ -0,0 +1,365 @@
+import csv
+import functools
+import io
+import itertools
+import json
+import mmap
+import operator
+import os
+from typing import (
+    IO,
+    Any,
+    AnyStr,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+)
+
+import fluentiter as fl
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+
+def from_lines(
+    path: PathLike,
+    encoding: str = "utf-8",
+    buffer_size: int = io.DEFAULT_BUFFER_SIZE,
+    keep_ends: bool = False,
+) -> "fl.FluentIterator[str]":
+    """
+    Create an iterator over the lines of a text file.
+    The file is read lazily in blocks of `buffer_size` bytes and closed once
+    the iterator is exhausted.
+
+    Parameters
+    ----------
+    path : PathLike
+        Path of the file
+    encoding : str, optional
+        Encoding of the file, by default "utf-8"
+    buffer_size : int, optional
+        Size of the read buffer in bytes, by default io.DEFAULT_BUFFER_SIZE
+    keep_ends : bool, optional
+        Whether to keep the newline at the end of each line, by default False
+
+    Returns
+    -------
+    FluentIterator[str]
+        Iterator of the lines
+
+    Examples
+    --------
+    >>> from_lines("cities.csv").skip(1).map(lambda line: line.split(",")).next()
+        ["Bielefeld", "Germany", "North Rhine-Westphalia", "2949172"]
+    """
+    return fl.iterator(_lines(path, encoding, buffer_size, keep_ends))
+
+
+def from_mmap(
+    path: PathLike, delimiter: bytes = b"\n"
+) -> "fl.FluentIterator[memoryview]":
+    """
+    Create an iterator over the records of a memory-mapped file, which are
+    separated by `delimiter`. Records are yielded as `memoryview` slices
+    of the mapping, so no data is copied until it is actually used.
+
+    Notes
+    -----
+    The file stays mapped as long as any yielded record is alive, call
+    `bytes(record)` to keep a record around without the mapping.
+
+    Parameters
+    ----------
+    path : PathLike
+        Path of the file
+    delimiter : bytes, optional
+        Separator between records, by default b"\\n"
+
+    Returns
+    -------
+    FluentIterator[memoryview]
+        Iterator of the records, excluding the delimiters
+
+    Raises
+    ------
+    ValueError
+        If `delimiter` is empty
+
+    Examples
+    --------
+    >>> from_mmap("access.log").filter(lambda line: b" 500 " in line).count()
+        17
+    """
+    if not delimiter:
+        raise ValueError("Delimiter must not be empty")
+    return fl.iterator(_mmap_records(path, delimiter))
+
+
+def from_chunks(fileobj: IO[AnyStr], size: int) -> "fl.FluentIterator[AnyStr]":
+    """
+    Create an iterator over chunks of `size` bytes (or characters for text
+    files) read from an open file. Only the last chunk may be shorter.
+    The file is not closed by the iterator.
+
+    Parameters
+    ----------
+    fileobj : IO[AnyStr]
+        File opened for reading
+    size : int
+        Size of the chunks
+
+    Returns
+    -------
+    FluentIterator[AnyStr]
+        Iterator of the chunks
+
+    Raises
+    ------
+    ValueError
+        If size is <= 0
+
+    Examples
+    --------
+    >>> with open("image.png", "rb") as f:
+    ...     digest = from_chunks(f, 2**16).fold(hashlib.sha256(), ...)
+    """
+    if size <= 0:
+        raise ValueError(f"Size must be an integer >0. Got {size}")
+    return fl.iterator(_chunks(fileobj, size))
+
+
+def read_csv(
+    path: PathLike,
+    header: Union[bool, Sequence[str]] = True,
+    types: Optional[Mapping[Any, Callable[[str], Any]]] = None,
+    encoding: str = "utf-8",
+    buffer_size: int = io.DEFAULT_BUFFER_SIZE,
+    **fmtparams: Any,
+) -> "fl.FluentIterator[Any]":
+    """
+    Create an iterator over the rows of a CSV file, which is read lazily.
+
+    With a header, every row is turned into a dict of column name to value.
+    Without one, rows are lists of values.
+
+    Notes
+    -----
+    Rows with fewer values than there are columns only contain
+    the first columns.
+
+    Parameters
+    ----------
+    path : PathLike
+        Path of the file
+    header : Union[bool, Sequence[str]], optional
+        True to read the column names from the first row, a sequence of
+        column names or False to yield lists, by default True
+    types : Optional[Mapping[Any, Callable[[str], Any]]], optional
+        Functions to convert the values of a column with, by column name
+        or by column index if there is no header, by default None
+    encoding : str, optional
+        Encoding of the file, by default "utf-8"
+    buffer_size : int, optional
+        Size of the read buffer in bytes, by default io.DEFAULT_BUFFER_SIZE
+    **fmtparams : Any
+        Formatting parameters passed on to `csv.reader`, e.g. `delimiter`
+
+    Returns
+    -------
+    FluentIterator[Any]
+        Iterator of dicts or lists
+
+    Examples
+    --------
+    >>> read_csv("cities.csv", types={"geonameid": int}).next()
+        {"name": "Bielefeld", "country": "Germany", "geonameid": 2949172}
+    """
+    return fl.iterator(_csv_rows(path, header, types, encoding, buffer_size, fmtparams))
+
+
+def read_jsonl(
+    path: PathLike,
+    encoding: str = "utf-8",
+    buffer_size: int = io.DEFAULT_BUFFER_SIZE,
+) -> "fl.FluentIterator[Any]":
+    """
+    Create an iterator over the JSON values in a file, which contains
+    one value per line. Blank lines are skipped.
+
+    Parameters
+    ----------
+    path : PathLike
+        Path of the file
+    encoding : str, optional
+        Encoding of the file, by default "utf-8"
+    buffer_size : int, optional
+        Size of the read buffer in bytes, by default io.DEFAULT_BUFFER_SIZE
+
+    Returns
+    -------
+    FluentIterator[Any]
+        Iterator of the decoded values
+
+    Examples
+    --------
+    >>> read_jsonl("events.jsonl").filter(lambda e: e["type"] == "click").count()
+        1024
+    """
+    return fl.iterator(_json_lines(path, encoding, buffer_size))
+
+
+def write_csv(
+    rows: Iterable[Any],
+    path: PathLike,
+    header: Union[bool, Sequence[str]] = True,
+    encoding: str = "utf-8",
+    buffer_size: int = io.DEFAULT_BUFFER_SIZE,
+    **fmtparams: Any,
+) -> None:
+    """
+    Write rows of dicts or sequences to a CSV file.
+    See `FluentIterator.write_csv`.
+    """
+    it = iter(rows)
+    head = list(itertools.islice(it, 1))
+    columns: Optional[Sequence[str]] = None
+    if header is True and head and isinstance(head[0], Mapping):
+        columns = list(head[0])
+    elif header is not True and header is not False:
+        columns = header
+    with open(path, "w", encoding=encoding, buffering=buffer_size, newline="") as f:
+        writer = csv.writer(f, **fmtparams)
+        if columns is not None:
+            writer.writerow(columns)
+        if not head:
+            return
+        it = itertools.chain(head, it)
+        if isinstance(head[0], Mapping):
+            if columns is None:
+                columns = list(head[0])
+            it = map(_values_getter(columns), it)
+        # one call for all rows, the file buffers them into large writes
+        writer.writerows(it)
+
+
+def write_jsonl(
+    values: Iterable[Any],
+    path: PathLike,
+    encoding: str = "utf-8",
+    buffer_size: int = io.DEFAULT_BUFFER_SIZE,
+) -> None:
+    """
+    Write values to a file as JSON, one per line.
+    See `FluentIterator.write_jsonl`.
+    """
+    with open(path, "w", encoding=encoding, buffering=buffer_size) as f:
+        f.writelines(map("{}\n".format, map(json.dumps, values)))
+
+
+def _lines(
+    path: PathLike, encoding: str, buffer_size: int, keep_ends: bool
+) -> Generator[str, None, None]:
+    with open(path, encoding=encoding, buffering=buffer_size) as f:
+        if keep_ends:
+            yield from f
+        else:
+            # universal newlines turned every line ending into a single "\n"
+            yield from map(operator.methodcaller("rstrip", "\n"), f)
+
+
+def _mmap_records(
+    path: PathLike, delimiter: bytes
+) -> Generator[memoryview, None, None]:
+    with open(path, "rb") as f:
+        if not os.fstat(f.fileno()).st_size:
+            # empty files can not be mapped
+            return
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapping)
+    try:
+        find, step, end = mapping.find, len(delimiter), len(mapping)
+        start = 0
+        while start < end:
+            stop = find(delimiter, start)
+            if stop == -1:
+                stop = end
+            yield view[start:stop]
+            start = stop + step
+    finally:
+        view.release()
+        try:
+            mapping.close()
+        except BufferError:
+            # records are still in use, the mapping is closed with the last one
+            pass
+
+
+def _chunks(fileobj: IO[AnyStr], size: int) -> Generator[AnyStr, None, None]:
+    first = fileobj.read(size)
+    if not first:
+        return
+    yield first
+    # the empty bytes or str read at the end of the file
+    yield from iter(functools.partial(fileobj.read, size), first[:0])
+
+
+def _csv_rows(
+    path: PathLike,
+    header: Union[bool, Sequence[str]],
+    types: Optional[Mapping[Any, Callable[[str], Any]]],
+    encoding: str,
+    buffer_size: int,
+    fmtparams: Dict[str, Any],
+) -> Generator[Any, None, None]:
+    with open(path, encoding=encoding, buffering=buffer_size, newline="") as f:
+        rows: Iterator[Any] = csv.reader(f, **fmtparams)
+        columns: Optional[Sequence[str]] = None
+        if header is True:
+            columns = next(rows, None)
+            if columns is None:
+                return
+        elif header is not False:
+            columns = header
+        if types:
+            rows = map(_row_converter(columns, types), rows)
+        if columns is None:
+            yield from rows
+        else:
+            yield from map(dict, map(functools.partial(zip, columns), rows))
+
+
+def _row_converter(
+    columns: Optional[Sequence[str]], types: Mapping[Any, Callable[[str], Any]]
+) -> Callable[[List[str]], List[Any]]:
+    keys: Iterable[Any] = range(max(types) + 1) if columns is None else columns
+    converters = [types.get(k, str) for k in keys]
+
+    def convert(row: List[str]) -> List[Any]:
+        return list(map(_call, converters, row)) + row[len(converters) :]
+
+    return convert
+
+
+def _call(func: Callable[[str], Any], value: str) -> Any:
+    return func(value)
+
+
+def _values_getter(columns: Sequence[str]) -> Callable[[Mapping[str, Any]], Any]:
+    if len(columns) == 1:
+        column = columns[0]
+        return lambda row: (row[column],)
+    return operator.itemgetter(*columns)
+
+
+def _json_lines(
+    path: PathLike, encoding: str, buffer_size: int
+) -> Generator[Any, None, None]:
+    with open(path, encoding=encoding, buffering=buffer_size) as f:
+        yield from map(json.loads, filter(str.strip, f))
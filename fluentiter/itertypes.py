@@ -1,12 +1,18 @@
+import collections
+import functools
+import heapq
 import itertools
-from operator import length_hint
+from operator import is_not
 from typing import (
     Any,
     Callable,
+    Dict,
     Generator,
     Iterable,
     Iterator,
+    List,
     Optional,
+    Set,
     Tuple,
     Type,
     TypeVar,
@@ -16,22 +22,56 @@ from typing import (
 
 import fluentiter as fl
 import fluentiter.exceptions as fle
+from fluentiter import spill
+from fluentiter.bloom import BloomFilter
+from fluentiter.core import _bounds_of
+from fluentiter.memo import Cache
+from fluentiter.views import LengthView, SequenceView
 
 Inner = TypeVar("Inner")
 T = TypeVar("T")
 U = TypeVar("U")
 R = TypeVar("R")
 
+# C level predicate, avoids a Python frame per element compared to a lambda
+_is_not_none = functools.partial(is_not, None)
+
+Bounds = Tuple[int, Optional[int]]
+
+
+def _min_upper(a: Optional[int], b: Optional[int]) -> Optional[int]:
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return min(a, b)
+
+
+def _ceil_div(x: Optional[int], size: int) -> Optional[int]:
+    if x is None:
+        return None
+    return -(-x // size)
+
 
 class StepByIterator(fl.FluentIterator[T]):
     """
     Iterator which steps over elements with steps of size `n`.
     """
 
-    __slots__ = ("_iterable",)
+    __slots__ = ("_upstream", "_n")
 
     def __init__(self, it: fl.FluentIterator[T], n: int) -> None:
-        self._iterable = itertools.islice(it, None, None, n)
+        self._iterable = itertools.islice(it._fuse(), None, None, n)
+        self._upstream = it
+        self._n = n
+        view = it._sized_view()
+        if isinstance(view, SequenceView):
+            self._view = view.slice(None, None, n)
+
+    def _bounds(self) -> Bounds:
+        # the first element is yielded right away, later ones after `n` pulls
+        lower, upper = self._upstream.size_bounds()
+        return lower // self._n, _ceil_div(upper, self._n)
 
 
 class ChainedIterator(fl.FluentIterator[Union[T, U]]):
@@ -40,31 +80,21 @@ class ChainedIterator(fl.FluentIterator[Union[T, U]]):
     A and then all elements of B
     """
 
-    __slots__ = ("_iterable",)
+    __slots__ = ("_first", "_other")
 
     def __init__(
         self, first: fl.FluentIterator[T], other: fl.FluentIterator[U]
     ) -> None:
-        self._iterable = itertools.chain(first, other)
+        self._iterable = itertools.chain(first._fuse(), other._fuse())
         self._first = first
         self._other = other
 
-    def size_hint(self) -> Union[int, None]:
-        """
-        Get an estimate of the number of elements in
-        this iterator or `None` if the value can not be
-        estimated.
-
-        Returns
-        -------
-        Union[int, None]
-            Length hint
-        """
-        hintfirst = length_hint(self._first, -1)
-        hintsecond = length_hint(self._other, -1)
-        if hintfirst == -1 or hintsecond == -1:
-            return None
-        return hintfirst + hintsecond
+    def _bounds(self) -> Bounds:
+        lower_first, upper_first = self._first.size_bounds()
+        lower_other, upper_other = self._other.size_bounds()
+        if upper_first is None or upper_other is None:
+            return lower_first + lower_other, None
+        return lower_first + lower_other, upper_first + upper_other
 
 
 class ZippedIterator(fl.FluentIterator[Tuple[T, U]]):
@@ -72,10 +102,20 @@ class ZippedIterator(fl.FluentIterator[Tuple[T, U]]):
     Iterator which yields tuples of (T, U)
     """
 
-    __slots__ = ("_iterable",)
+    __slots__ = ("_upstream", "_other")
 
     def __init__(self, it: fl.FluentIterator[T], other: fl.FluentIterator[U]) -> None:
-        self._iterable = zip(it, other)
+        self._iterable = zip(it._fuse(), other._fuse())
+        self._upstream = it
+        self._other = other
+        view, other_view = it._sized_view(), other._sized_view()
+        if view is not None and other_view is not None:
+            self._view = LengthView(view, other_view)
+
+    def _bounds(self) -> Bounds:
+        lower, upper = self._upstream.size_bounds()
+        lower_other, upper_other = self._other.size_bounds()
+        return min(lower, lower_other), _min_upper(upper, upper_other)
 
 
 class MapIterator(fl.FluentIterator[R]):
@@ -83,10 +123,68 @@ class MapIterator(fl.FluentIterator[R]):
     Iterator which applies a function to every element
     """
 
-    __slots__ = ("_iterable",)
+    __slots__ = ("_upstream",)
 
     def __init__(self, it: fl.FluentIterator[T], func: Callable[[T], R]) -> None:
-        self._iterable = map(func, it)
+        func = self._track(func)
+        self._iterable = map(func, it._fuse())
+        self._upstream = it
+        view = it._sized_view()
+        if view is not None:
+            self._view = view.map(func)
+
+    def _bounds(self) -> Bounds:
+        return self._upstream.size_bounds()
+
+
+class MapCachedIterator(fl.FluentIterator[R]):
+    """
+    Iterator which applies a function to every element, looking up
+    results for repeated keys in a cache
+    """
+
+    __slots__ = ("_upstream", "_memo")
+
+    def __init__(
+        self,
+        it: fl.FluentIterator[T],
+        func: Callable[[T], R],
+        cache: Cache,
+        key: Optional[Callable[[T], Any]],
+    ) -> None:
+        func = self._track(func)
+        if key is not None:
+            key = self._track(key)
+        self._iterable = self._map(it._fuse(), func, cache, key)
+        self._upstream = it
+        self._memo = cache
+
+    @property
+    def memo(self) -> Cache:
+        """
+        The cache of results, e.g. to read its hit and miss counts
+        """
+        return self._memo
+
+    def _bounds(self) -> Bounds:
+        return self._upstream.size_bounds()
+
+    def _map(
+        self,
+        it: Iterator[T],
+        func: Callable[[T], R],
+        cache: Cache,
+        key: Optional[Callable[[T], Any]],
+    ) -> Generator[R, None, None]:
+        get, put = cache.get, cache.put
+        missing = object()
+        for x in it:
+            k = x if key is None else key(x)
+            result = get(k, missing)
+            if result is missing:
+                result = func(x)
+                put(k, result)
+            yield result
 
 
 class FilterIterator(fl.FluentIterator[T]):
@@ -94,10 +192,14 @@ class FilterIterator(fl.FluentIterator[T]):
     Iterator which filters using a given function
     """
 
-    __slots__ = ("_iterable",)
+    __slots__ = ("_upstream",)
 
     def __init__(self, it: fl.FluentIterator[T], func: Callable[[T], bool]) -> None:
-        self._iterable = filter(func, it)
+        self._iterable = filter(self._track(func), it._fuse())
+        self._upstream = it
+
+    def _bounds(self) -> Bounds:
+        return 0, self._upstream.size_bounds()[1]
 
 
 class FilterMapIterator(fl.FluentIterator[R]):
@@ -105,15 +207,16 @@ class FilterMapIterator(fl.FluentIterator[R]):
     Iterator which filters and maps using a given function
     """
 
-    __slots__ = ("_iterable",)
+    __slots__ = ("_upstream",)
 
     def __init__(
         self, it: fl.FluentIterator[T], func: Callable[[T], Optional[R]]
     ) -> None:
-        # for some reason .filter gets inferred ot -> FluentIterator | None here
-        self._iterable = cast(
-            fl.FluentIterator[R], it.map(func=func).filter(lambda x: x is not None)
-        )
+        self._iterable = filter(_is_not_none, map(self._track(func), it._fuse()))
+        self._upstream = it
+
+    def _bounds(self) -> Bounds:
+        return 0, self._upstream.size_bounds()[1]
 
 
 class EnumerateIterator(fl.FluentIterator[Tuple[int, T]]):
@@ -121,10 +224,17 @@ class EnumerateIterator(fl.FluentIterator[Tuple[int, T]]):
     Iterator which yields tuples of (index, element)
     """
 
-    __slots__ = ("_iterable",)
+    __slots__ = ("_upstream",)
 
     def __init__(self, it: fl.FluentIterator[T]) -> None:
-        self._iterable = enumerate(it)
+        self._iterable = enumerate(it._fuse())
+        self._upstream = it
+        view = it._sized_view()
+        if view is not None:
+            self._view = LengthView(view)
+
+    def _bounds(self) -> Bounds:
+        return self._upstream.size_bounds()
 
 
 class PeekIterator(fl.FluentIterator[T]):
@@ -132,7 +242,7 @@ class PeekIterator(fl.FluentIterator[T]):
     Iterator which allows to peek the next element
     """
 
-    __slots__ = ("_iterable",)
+    __slots__ = ("_sentinel", "_peeked")
 
     def __init__(self, it: Iterator[T]) -> None:
         self._iterable = it
@@ -150,18 +260,34 @@ class PeekIterator(fl.FluentIterator[T]):
             raise StopIteration
         return next_val
 
+    def _bounds(self) -> Bounds:
+        return self._with_peeked(_bounds_of(self._iterable))
+
+    def _with_peeked(self, bounds: Bounds) -> Bounds:
+        """
+        Add the peeked element to the bounds of the elements after it
+        """
+        lower, upper = bounds
+        if self._peeked is self._sentinel:
+            return lower, upper
+        return lower + 1, None if upper is None else upper + 1
+
 
 class SkipWhileIterator(fl.FluentIterator[T]):
     """
     Iterator which skips elements as long as a predicate is true
     """
 
-    __slots__ = ("_iterable",)
+    __slots__ = ("_upstream",)
 
     def __init__(
         self, it: fl.FluentIterator[T], predicate: Callable[[T], bool]
     ) -> None:
-        self._iterable = itertools.dropwhile(predicate, it)
+        self._iterable = itertools.dropwhile(self._track(predicate), it._fuse())
+        self._upstream = it
+
+    def _bounds(self) -> Bounds:
+        return 0, self._upstream.size_bounds()[1]
 
 
 class TakeWhileIterator(fl.FluentIterator[T]):
@@ -169,12 +295,16 @@ class TakeWhileIterator(fl.FluentIterator[T]):
     Iterator which yields elements as long as a predicate is true
     """
 
-    __slots__ = ("_iterable",)
+    __slots__ = ("_upstream",)
 
     def __init__(
         self, it: fl.FluentIterator[T], predicate: Callable[[T], bool]
     ) -> None:
-        self._iterable = itertools.takewhile(predicate, it)
+        self._iterable = itertools.takewhile(self._track(predicate), it._fuse())
+        self._upstream = it
+
+    def _bounds(self) -> Bounds:
+        return 0, self._upstream.size_bounds()[1]
 
 
 class MapWhileIterator(fl.FluentIterator[R]):
@@ -183,14 +313,18 @@ class MapWhileIterator(fl.FluentIterator[R]):
     function does not return `None`
     """
 
-    __slots__ = ("_iterable",)
+    __slots__ = ("_upstream",)
 
     def __init__(
         self, it: fl.FluentIterator[T], func: Callable[[T], Union[R, None]]
     ) -> None:
-        self._iterable = cast(
-            TakeWhileIterator[R], it.map(func).take_while(lambda x: x is not None)
+        self._iterable = itertools.takewhile(
+            _is_not_none, map(self._track(func), it._fuse())
         )
+        self._upstream = it
+
+    def _bounds(self) -> Bounds:
+        return 0, self._upstream.size_bounds()[1]
 
 
 class SkipNIterator(fl.FluentIterator[T]):
@@ -198,10 +332,20 @@ class SkipNIterator(fl.FluentIterator[T]):
     Iterator which skips its first `N` elements
     """
 
-    __slots__ = ("_iterable",)
+    __slots__ = ("_upstream", "_n")
 
     def __init__(self, it: fl.FluentIterator[T], n: int) -> None:
-        self._iterable = itertools.islice(it, n, None)
+        self._iterable = itertools.islice(it._fuse(), n, None)
+        self._upstream = it
+        self._n = n
+        view = it._sized_view()
+        if isinstance(view, SequenceView):
+            self._view = view.slice(n, None, None)
+
+    def _bounds(self) -> Bounds:
+        # the elements may have been skipped already
+        lower, upper = self._upstream.size_bounds()
+        return max(0, lower - self._n), upper
 
 
 class TakeNIterator(fl.FluentIterator[T]):
@@ -209,10 +353,19 @@ class TakeNIterator(fl.FluentIterator[T]):
     Iterator which only returns its first `N` elements
     """
 
-    __slots__ = ("_iterable",)
+    __slots__ = ("_upstream", "_n")
 
     def __init__(self, it: fl.FluentIterator[T], n: int) -> None:
-        self._iterable = itertools.islice(it, None, n)
+        self._iterable = itertools.islice(it._fuse(), None, n)
+        self._upstream = it
+        self._n = n
+        view = it._sized_view()
+        if isinstance(view, SequenceView):
+            self._view = view.slice(None, n, None)
+
+    def _bounds(self) -> Bounds:
+        # islice does not tell how many elements were taken already
+        return 0, _min_upper(self._upstream.size_bounds()[1], self._n)
 
 
 class ScanIterator(fl.FluentIterator[R]):
@@ -221,7 +374,7 @@ class ScanIterator(fl.FluentIterator[R]):
     that state to every element.
     """
 
-    __slots__ = ("_iterable",)
+    __slots__ = ("_upstream",)
     S = TypeVar("S")
 
     def __init__(
@@ -230,11 +383,15 @@ class ScanIterator(fl.FluentIterator[R]):
         initial_state: S,
         func: Callable[[S, T], Tuple[S, R]],
     ) -> None:
-        self._iterable = self._scan(it, initial_state, func)
+        self._iterable = self._scan(it._fuse(), initial_state, self._track(func))
+        self._upstream = it
+
+    def _bounds(self) -> Bounds:
+        return 0, self._upstream.size_bounds()[1]
 
     def _scan(
         self,
-        it: fl.FluentIterator[T],
+        it: Iterator[T],
         initial_state: S,
         func: Callable[[S, T], Tuple[S, R]],
     ) -> Generator[R, None, None]:
@@ -252,7 +409,7 @@ class FlatMapIterator(fl.FluentIterator[R]):
     Iterator which maps flattens elements
     """
 
-    __slots__ = ("_iterable",)
+    __slots__ = ()
 
     def __init__(
         self,
@@ -260,7 +417,7 @@ class FlatMapIterator(fl.FluentIterator[R]):
         func: Callable[[T], Iterable[R]],
         exclude: Tuple[Type, ...],
     ) -> None:
-        self._iterable = it.map(func).flatten(exclude=exclude)
+        self._iterable = _flatten(map(self._track(func), it._fuse()), exclude)
 
 
 class FlattenIterator(fl.FluentIterator[T]):
@@ -268,22 +425,22 @@ class FlattenIterator(fl.FluentIterator[T]):
     Iterator which flattens elements
     """
 
-    __slots__ = ("_iterable",)
+    __slots__ = ()
 
     def __init__(
         self, it: fl.FluentIterator[Union[T, Iterable[T]]], exclude: Tuple[Type, ...]
     ) -> None:
-        self._iterable = self._flatten(it)
-        self._exclude = exclude
+        self._iterable = _flatten(it._fuse(), exclude)
 
-    def _flatten(
-        self, it: fl.FluentIterator[Union[T, Iterable[T]]]
-    ) -> Generator[T, None, None]:
-        for elem in it:
-            if isinstance(elem, Iterable) and not isinstance(elem, self._exclude):
-                yield from elem
-            else:
-                yield cast(T, elem)
+
+def _flatten(
+    it: Iterator[Union[T, Iterable[T]]], exclude: Tuple[Type, ...]
+) -> Generator[T, None, None]:
+    for elem in it:
+        if isinstance(elem, Iterable) and not isinstance(elem, exclude):
+            yield from elem
+        else:
+            yield cast(T, elem)
 
 
 class InspectIterator(fl.FluentIterator[T]):
@@ -292,13 +449,17 @@ class InspectIterator(fl.FluentIterator[T]):
     but yields the original elements
     """
 
-    __slots__ = ("_iterable",)
+    __slots__ = ("_upstream",)
 
     def __init__(self, it: fl.FluentIterator[T], func: Callable[[T], Any]) -> None:
-        self._iterable = self._scan(it, func)
+        self._iterable = self._scan(it._fuse(), self._track(func))
+        self._upstream = it
+
+    def _bounds(self) -> Bounds:
+        return self._upstream.size_bounds()
 
     def _scan(
-        self, it: fl.FluentIterator[T], func: Callable[[T], Any]
+        self, it: Iterator[T], func: Callable[[T], Any]
     ) -> Generator[T, None, None]:
         for x in it:
             func(x)
@@ -311,10 +472,10 @@ class CycleIterator(fl.FluentIterator[T]):
     and cycles through them forever
     """
 
-    __slots__ = ("_iterable",)
+    __slots__ = ()
 
     def __init__(self, it: fl.FluentIterator[T]) -> None:
-        self._iterable = itertools.cycle(it)
+        self._iterable = itertools.cycle(it._fuse())
 
 
 class TumblingWindowIterator(fl.FluentIterator[tuple[T, ...]]):
@@ -323,21 +484,374 @@ class TumblingWindowIterator(fl.FluentIterator[tuple[T, ...]]):
     comprised of the elements of another iterator.
     """
 
-    __slots__ = ("_iterable",)
+    __slots__ = ("_upstream", "_size")
 
     def __init__(self, it: fl.FluentIterator[T], size: int) -> None:
-        self._iterable = self._tumble(it, size)
+        self._iterable = self._tumble(it._fuse(), size)
+        self._upstream = it
+        self._size = size
+
+    def _bounds(self) -> Bounds:
+        lower, upper = self._upstream.size_bounds()
+        return _ceil_div(lower, self._size) or 0, _ceil_div(upper, self._size)
 
     def _tumble(
-        self, it: fl.FluentIterator[T], size: int
+        self, it: Iterator[T], size: int
     ) -> Generator[tuple[T, ...], None, None]:
-        while True:
-            elems = []
-            for _ in range(size):
-                try:
-                    elems.append(next(it))
-                except StopIteration:
-                    if len(elems) > 0:
-                        yield tuple(elems)
-                    return
-            yield tuple(elems)
+        # islice collects each window in C instead of calling next() per element
+        while window := tuple(itertools.islice(it, size)):
+            yield window
+
+
+class BatchedIterator(fl.FluentIterator[List[T]]):
+    """
+    Iterator which yields lists of up to `size` elements
+    of another iterator.
+    """
+
+    __slots__ = ("_upstream", "_size")
+
+    def __init__(self, it: fl.FluentIterator[T], size: int) -> None:
+        self._iterable = _batch(it._fuse(), size)
+        self._upstream = it
+        self._size = size
+
+    def _bounds(self) -> Bounds:
+        lower, upper = self._upstream.size_bounds()
+        return _ceil_div(lower, self._size) or 0, _ceil_div(upper, self._size)
+
+
+def _batch(it: Iterator[T], size: int) -> Generator[List[T], None, None]:
+    while batch := list(itertools.islice(it, size)):
+        yield batch
+
+
+class TopKWindowIterator(fl.FluentIterator[List[T]]):
+    """
+    Iterator which yields the `k` largest elements of every
+    non-overlapping window of `size` elements of another iterator.
+    """
+
+    __slots__ = ("_upstream", "_size")
+
+    def __init__(
+        self,
+        it: fl.FluentIterator[T],
+        size: int,
+        k: int,
+        key: Optional[Callable[[T], Any]],
+    ) -> None:
+        if key is not None:
+            key = self._track(key)
+        self._iterable = self._top_k(it._fuse(), size, k, key)
+        self._upstream = it
+        self._size = size
+
+    def _bounds(self) -> Bounds:
+        lower, upper = self._upstream.size_bounds()
+        return _ceil_div(lower, self._size) or 0, _ceil_div(upper, self._size)
+
+    def _top_k(
+        self,
+        it: Iterator[T],
+        size: int,
+        k: int,
+        key: Optional[Callable[[T], Any]],
+    ) -> Generator[List[T], None, None]:
+        # the window is never materialized, nlargest keeps a heap of `k` elements
+        for first in it:
+            window = itertools.chain((first,), itertools.islice(it, size - 1))
+            yield heapq.nlargest(k, window, key=key)  # type: ignore[arg-type]
+
+
+class GroupConsecutiveIterator(fl.FluentIterator[R]):
+    """
+    Iterator which yields a tuple of the key and the elements
+    of every run of consecutive elements with the same key
+    """
+
+    __slots__ = ("_upstream",)
+
+    def __init__(
+        self,
+        it: fl.FluentIterator[T],
+        key: Optional[Callable[[T], Any]],
+        collect: bool,
+    ) -> None:
+        if key is not None:
+            key = self._track(key)
+        groups = itertools.groupby(it._fuse(), key)
+        self._iterable = itertools.starmap(
+            _collect_group if collect else _wrap_group, groups
+        )
+        self._upstream = it
+
+    def _bounds(self) -> Bounds:
+        # groupby may hold the first element of the next group already
+        upper = self._upstream.size_bounds()[1]
+        return 0, None if upper is None else upper + 1
+
+
+def _wrap_group(key: Any, group: Iterator[T]) -> Tuple[Any, "fl.FluentIterator[T]"]:
+    return key, fl.FluentIterator(group)
+
+
+def _collect_group(key: Any, group: Iterator[T]) -> Tuple[Any, Tuple[T, ...]]:
+    return key, tuple(group)
+
+
+class HashJoinIterator(fl.FluentIterator[Tuple[Optional[T], Optional[U]]]):
+    """
+    Iterator which joins the elements of two iterators with equal keys
+    by building a hash table of the smaller one
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        it: fl.FluentIterator[T],
+        other: fl.FluentIterator[U],
+        left_key: Callable[[T], Any],
+        right_key: Callable[[U], Any],
+        how: str,
+    ) -> None:
+        left_key, right_key = self._track(left_key), self._track(right_key)
+        left_upper = it.size_bounds()[1]
+        right_upper = other.size_bounds()[1]
+        # build the table from the right side, unless the left one is known
+        # to be smaller, e.g. a dimension table joined with a stream
+        if left_upper is not None and (right_upper is None or left_upper < right_upper):
+            self._iterable = _hash_join(
+                other._fuse(),
+                right_key,
+                it._fuse(),
+                left_key,
+                keep_stream=how == "outer",
+                keep_table=how != "inner",
+                swap=True,
+            )
+        else:
+            self._iterable = _hash_join(
+                it._fuse(),
+                left_key,
+                other._fuse(),
+                right_key,
+                keep_stream=how != "inner",
+                keep_table=how == "outer",
+                swap=False,
+            )
+
+
+def _hash_join(
+    stream: Iterator[Any],
+    stream_key: Callable[[Any], Any],
+    table_rows: Iterator[Any],
+    table_key: Callable[[Any], Any],
+    keep_stream: bool,
+    keep_table: bool,
+    swap: bool,
+) -> Generator[Tuple[Any, Any], None, None]:
+    table: Dict[Any, List[Any]] = collections.defaultdict(list)
+    for row in table_rows:
+        table[table_key(row)].append(row)
+    matched = set()
+    for x in stream:
+        k = stream_key(x)
+        rows = table.get(k)
+        if rows is None:
+            if keep_stream:
+                yield (None, x) if swap else (x, None)
+            continue
+        if keep_table:
+            matched.add(k)
+        for row in rows:
+            yield (row, x) if swap else (x, row)
+    if keep_table:
+        for k, rows in table.items():
+            if k not in matched:
+                for row in rows:
+                    yield (row, None) if swap else (None, row)
+
+
+class MergeJoinIterator(fl.FluentIterator[Tuple[Optional[T], Optional[U]]]):
+    """
+    Iterator which joins the elements of two iterators sorted by key
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        it: fl.FluentIterator[T],
+        other: fl.FluentIterator[U],
+        left_key: Callable[[T], Any],
+        right_key: Callable[[U], Any],
+        how: str,
+    ) -> None:
+        self._iterable = self._merge(
+            itertools.groupby(it._fuse(), self._track(left_key)),
+            itertools.groupby(other._fuse(), self._track(right_key)),
+            keep_left=how != "inner",
+            keep_right=how == "outer",
+        )
+
+    def _merge(
+        self,
+        left: Iterator[Tuple[Any, Iterator[T]]],
+        right: Iterator[Tuple[Any, Iterator[U]]],
+        keep_left: bool,
+        keep_right: bool,
+    ) -> Generator[Tuple[Optional[T], Optional[U]], None, None]:
+        done: Tuple[Any, Any] = (None, None)
+        left_key, left_group = next(left, done)
+        right_key, right_group = next(right, done)
+        while left_group is not None and right_group is not None:
+            if left_key < right_key:
+                if keep_left:
+                    yield from zip(left_group, itertools.repeat(None))
+                left_key, left_group = next(left, done)
+            elif right_key < left_key:
+                if keep_right:
+                    yield from zip(itertools.repeat(None), right_group)
+                right_key, right_group = next(right, done)
+            else:
+                # only the elements of the right side sharing one key are buffered
+                rows = list(right_group)
+                for x in left_group:
+                    for row in rows:
+                        yield x, row
+                left_key, left_group = next(left, done)
+                right_key, right_group = next(right, done)
+        if keep_left:
+            while left_group is not None:
+                yield from zip(left_group, itertools.repeat(None))
+                left_key, left_group = next(left, done)
+        if keep_right:
+            while right_group is not None:
+                yield from zip(itertools.repeat(None), right_group)
+                right_key, right_group = next(right, done)
+
+
+class UniqueIterator(fl.FluentIterator[T]):
+    """
+    Iterator which skips elements whose key was seen before
+    """
+
+    __slots__ = ("_upstream",)
+
+    def __init__(
+        self,
+        it: fl.FluentIterator[T],
+        key: Optional[Callable[[T], Any]],
+        max_seen: Optional[int],
+    ) -> None:
+        if key is not None:
+            key = self._track(key)
+        if max_seen is None:
+            self._iterable = self._unique(it._fuse(), key)
+        else:
+            self._iterable = self._unique_lru(it._fuse(), key, max_seen)
+        self._upstream = it
+
+    def _bounds(self) -> Bounds:
+        return 0, self._upstream.size_bounds()[1]
+
+    def _unique(
+        self, it: Iterator[T], key: Optional[Callable[[T], Any]]
+    ) -> Generator[T, None, None]:
+        seen: Set[Any] = set()
+        add = seen.add
+        for x in it:
+            k = x if key is None else key(x)
+            if k not in seen:
+                add(k)
+                yield x
+
+    def _unique_lru(
+        self, it: Iterator[T], key: Optional[Callable[[T], Any]], max_seen: int
+    ) -> Generator[T, None, None]:
+        seen: "collections.OrderedDict[Any, None]" = collections.OrderedDict()
+        for x in it:
+            k = x if key is None else key(x)
+            if k in seen:
+                # keep recently repeated keys from being evicted
+                seen.move_to_end(k)
+                continue
+            seen[k] = None
+            if len(seen) > max_seen:
+                seen.popitem(last=False)
+            yield x
+
+
+class UniqueApproxIterator(fl.FluentIterator[T]):
+    """
+    Iterator which skips elements whose key was seen before
+    according to a Bloom filter
+    """
+
+    __slots__ = ("_upstream",)
+
+    def __init__(
+        self,
+        it: fl.FluentIterator[T],
+        key: Optional[Callable[[T], Any]],
+        capacity: int,
+        error_rate: float,
+    ) -> None:
+        if key is not None:
+            key = self._track(key)
+        self._iterable = self._unique(
+            it._fuse(), key, BloomFilter(capacity, error_rate)
+        )
+        self._upstream = it
+
+    def _bounds(self) -> Bounds:
+        return 0, self._upstream.size_bounds()[1]
+
+    def _unique(
+        self, it: Iterator[T], key: Optional[Callable[[T], Any]], seen: BloomFilter
+    ) -> Generator[T, None, None]:
+        add = seen.add
+        for x in it:
+            if not add(x if key is None else key(x)):
+                yield x
+
+
+class MapBatchesIterator(fl.FluentIterator[R]):
+    """
+    Iterator which applies a function to whole batches of elements
+    and yields the elements of the returned iterables
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        it: fl.FluentIterator[T],
+        func: Callable[[List[T]], Iterable[R]],
+        size: int,
+    ) -> None:
+        self._iterable = itertools.chain.from_iterable(
+            map(self._track(func), _batch(it._fuse(), size))
+        )
+
+
+class SortedIterator(fl.FluentIterator[T]):
+    """
+    Iterator which yields the elements of another iterator
+    in sorted order
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        it: fl.FluentIterator[T],
+        key: Optional[Callable[[T], Any]],
+        reverse: bool,
+        max_memory: Optional[int],
+    ) -> None:
+        if key is not None:
+            key = self._track(key)
+        self._iterable = spill.sort(it._fuse(), key, reverse, max_memory)
@@ -0,0 +1,133 @@
+import abc
+import collections
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class Cache(abc.ABC):
+    """
+    Bounded mapping of keys to results, which counts its hits and misses
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Share of lookups which found a result, 0.0 if there were none
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @abc.abstractmethod
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the result stored for `key` or `default`,
+        counting a hit or a miss
+        """
+
+    @abc.abstractmethod
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store the result for `key`, evicting other results if full
+        """
+
+    @abc.abstractmethod
+    def __len__(self) -> int:
+        """
+        Number of stored results
+        """
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(hits={self.hits}, misses={self.misses}, "
+            f"size={len(self)})"
+        )
+
+
+class LRU(Cache):
+    """
+    Cache of at most `maxsize` results, which evicts the least
+    recently used result first
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize <= 0:
+            raise ValueError(f"Maxsize must be an integer >0. Got {maxsize}")
+        super().__init__()
+        self.maxsize = maxsize
+        self._data: "collections.OrderedDict[Hashable, Any]" = collections.OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class TTL(Cache):
+    """
+    Cache, which forgets results `ttl` seconds after they were stored.
+    If `maxsize` is given, the oldest results are evicted first once full.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        maxsize: Optional[int] = None,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if ttl <= 0:
+            raise ValueError(f"TTL must be a number >0. Got {ttl}")
+        if maxsize is not None and maxsize <= 0:
+            raise ValueError(f"Maxsize must be an integer >0. Got {maxsize}")
+        super().__init__()
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._timer = timer
+        # results by key with their expiry time, in the order they expire
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None or entry[0] <= self._timer():
+            self.misses += 1
+            return default
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        now = self._timer()
+        # re-insert, so the result moves to the end of the expiry order
+        self._data.pop(key, None)
+        self._data[key] = (now + self.ttl, value)
+        self._expire(now)
+
+    def __len__(self) -> int:
+        self._expire(self._timer())
+        return len(self._data)
+
+    def _expire(self, now: float) -> None:
+        data = self._data
+        while data:
+            key = next(iter(data))
+            if data[key][0] > now and (
+                self.maxsize is None or len(data) <= self.maxsize
+            ):
+                return
+            del data[key]
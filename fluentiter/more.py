@@ -1,4 +1,5 @@
-from typing import Tuple, TypeVar
+import itertools
+from typing import Generator, Iterator, List, Optional, Tuple, TypeVar
 
 import fluentiter as fl
 from fluentiter.exceptions import RequiresExtraError
@@ -20,7 +21,33 @@ class RollingWindowIterator(fl.FluentIterator[Tuple[T, ...]]):
     `n` containing the iterators elements.
     """
 
-    __slots__ = ("_iterable",)
+    __slots__ = ("_upstream", "_pending")
 
     def __init__(self, it: fl.FluentIterator[T], size: int) -> None:
-        self._iterable = miter.sliding_window(it, size)
+        # the first window takes `size - 1` elements more than the ones after it
+        self._pending = [size - 1]
+        self._iterable = itertools.chain.from_iterable(
+            _windows(it._fuse(), size, self._pending)
+        )
+        self._upstream = it
+
+    def _bounds(self) -> Tuple[int, Optional[int]]:
+        lower, upper = self._upstream.size_bounds()
+        pending = self._pending[0]
+        return (
+            max(0, lower - pending),
+            None if upper is None else max(0, upper - pending),
+        )
+
+
+def _windows(
+    it: Iterator[T], size: int, pending: List[int]
+) -> Generator[Iterator[Tuple[T, ...]], None, None]:
+    """
+    Yields the windows of `it` as a single iterator, which is only created
+    once the first window is pulled, as some versions of `more_itertools`
+    fill all but the last element of it right away.
+    Clears `pending` then.
+    """
+    pending[0] = 0
+    yield miter.sliding_window(it, size)
@@ -0,0 +1,233 @@
+import collections
+import contextlib
+import functools
+import itertools
+import os
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import (
+    Callable,
+    Deque,
+    Generator,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+import fluentiter as fl
+
+T = TypeVar("T")
+R = TypeVar("R")
+A = TypeVar("A")
+
+ExecutorKind = Literal["thread", "process"]
+
+
+class ParMapIterator(fl.FluentIterator[R]):
+    """
+    Iterator which applies a function to every element
+    on a pool of workers
+    """
+
+    __slots__ = ("_upstream",)
+
+    def __init__(
+        self,
+        it: fl.FluentIterator[T],
+        func: Callable[[T], R],
+        workers: Optional[int],
+        ordered: bool,
+        prefetch: Optional[int],
+        executor: ExecutorKind,
+        chunksize: int,
+    ) -> None:
+        chunks = _par_chunks(
+            it._fuse(),
+            functools.partial(_map_chunk, func),
+            workers,
+            ordered,
+            prefetch,
+            executor,
+            chunksize,
+        )
+        self._iterable = itertools.chain.from_iterable(chunks)
+        self._upstream = it
+
+    def _bounds(self) -> Tuple[int, Optional[int]]:
+        # the results of the chunks in flight are not counted
+        return self._upstream.size_bounds()[0], None
+
+
+class ParFilterIterator(fl.FluentIterator[T]):
+    """
+    Iterator which filters using a given function
+    on a pool of workers
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        it: fl.FluentIterator[T],
+        func: Callable[[T], bool],
+        workers: Optional[int],
+        ordered: bool,
+        prefetch: Optional[int],
+        executor: ExecutorKind,
+        chunksize: int,
+    ) -> None:
+        chunks = _par_chunks(
+            it._fuse(),
+            functools.partial(_filter_chunk, func),
+            workers,
+            ordered,
+            prefetch,
+            executor,
+            chunksize,
+        )
+        self._iterable = itertools.chain.from_iterable(chunks)
+
+
+def par_fold(
+    it: Iterator[T],
+    initial_value: A,
+    func: Callable[[A, T], A],
+    combine: Callable[[A, A], A],
+    workers: Optional[int],
+    executor: ExecutorKind,
+    chunksize: int,
+) -> A:
+    """
+    Fold every chunk of `it` on a pool of workers and combine the
+    partial results in order.
+    """
+    partials: Generator[A, None, None] = _par_chunks(
+        it,
+        functools.partial(_fold_chunk, initial_value, func),
+        workers,
+        True,
+        None,
+        executor,
+        chunksize,
+    )
+    with contextlib.closing(partials):
+        return functools.reduce(combine, partials, next(partials, initial_value))
+
+
+def validate_arguments(
+    workers: Optional[int],
+    prefetch: Optional[int],
+    executor: ExecutorKind,
+    chunksize: int,
+) -> None:
+    """
+    Raise a `ValueError` for invalid arguments to the parallel methods.
+    """
+    if workers is not None and workers <= 0:
+        raise ValueError(f"Workers must be an integer >0. Got {workers}")
+    if prefetch is not None and prefetch <= 0:
+        raise ValueError(f"Prefetch must be an integer >0. Got {prefetch}")
+    if chunksize <= 0:
+        raise ValueError(f"Chunksize must be an integer >0. Got {chunksize}")
+    if executor not in ("thread", "process"):
+        raise ValueError(f"Executor must be 'thread' or 'process'. Got {executor!r}")
+
+
+# the chunk functions live on module level, so they can be pickled
+# and sent to worker processes
+def _map_chunk(func: Callable[[T], R], chunk: List[T]) -> List[R]:
+    return list(map(func, chunk))
+
+
+def _filter_chunk(func: Callable[[T], bool], chunk: List[T]) -> List[T]:
+    return list(filter(func, chunk))
+
+
+def _fold_chunk(initial_value: A, func: Callable[[A, T], A], chunk: List[T]) -> A:
+    return functools.reduce(func, chunk, initial_value)
+
+
+def _make_executor(kind: ExecutorKind, workers: int) -> Executor:
+    if kind == "thread":
+        return ThreadPoolExecutor(max_workers=workers)
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+def _default_workers(kind: ExecutorKind) -> int:
+    # same defaults as the executors in concurrent.futures
+    if kind == "thread":
+        return min(32, (os.cpu_count() or 1) + 4)
+    return os.cpu_count() or 1
+
+
+def _par_chunks(
+    it: Iterator[T],
+    apply: Callable[[List[T]], R],
+    workers: Optional[int],
+    ordered: bool,
+    prefetch: Optional[int],
+    kind: ExecutorKind,
+    chunksize: int,
+) -> Generator[R, None, None]:
+    """
+    Apply `apply` to chunks of `it` on an executor and yield the results.
+    """
+    workers = workers or _default_workers(kind)
+    # at most `window` chunks are pulled from `it` but not yet yielded
+    window = prefetch or 2 * workers
+    chunks = iter(functools.partial(_take_chunk, it, chunksize), [])
+    executor = _make_executor(kind, workers)
+    try:
+        if ordered:
+            yield from _ordered(executor, chunks, apply, window)
+        else:
+            yield from _unordered(executor, chunks, apply, window)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _take_chunk(it: Iterator[T], chunksize: int) -> List[T]:
+    return list(itertools.islice(it, chunksize))
+
+
+def _ordered(
+    executor: Executor,
+    chunks: Iterator[List[T]],
+    apply: Callable[[List[T]], R],
+    window: int,
+) -> Generator[R, None, None]:
+    pending: Deque["Future[R]"] = collections.deque(
+        executor.submit(apply, x) for x in itertools.islice(chunks, window)
+    )
+    while pending:
+        future = pending.popleft()
+        for x in itertools.islice(chunks, 1):
+            pending.append(executor.submit(apply, x))
+        yield future.result()
+
+
+def _unordered(
+    executor: Executor,
+    chunks: Iterator[List[T]],
+    apply: Callable[[List[T]], R],
+    window: int,
+) -> Generator[R, None, None]:
+    pending: Set["Future[R]"] = {
+        executor.submit(apply, x) for x in itertools.islice(chunks, window)
+    }
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for x in itertools.islice(chunks, len(done)):
+            pending.add(executor.submit(apply, x))
+        for future in done:
+            yield future.result()
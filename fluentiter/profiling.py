@@ -0,0 +1,208 @@
+import contextlib
+import time
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from fluentiter.core import ACTIVE_PROFILE
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass
+class StageStats:
+    """
+    Statistics of a single stage of a profiled pipeline.
+
+    Attributes
+    ----------
+    name : str
+        Name of the stage, i.e. the name of the iterator class
+    elements : int
+        Number of elements yielded by the stage
+    calls : int
+        Number of calls to the function given to the stage
+    callable_time : float
+        Seconds spent inside the function given to the stage
+    overhead_time : float
+        Seconds spent in the stage itself, excluding upstream stages
+        and the function given to the stage
+    total_time : float
+        Seconds spent producing the elements of this stage, including
+        all upstream stages
+    peak_buffered : int
+        Maximum number of elements buffered at once by stages
+        splitting an iterator like `unzip` or `partition`
+    """
+
+    name: str
+    elements: int = 0
+    calls: int = 0
+    callable_time: float = 0.0
+    overhead_time: float = 0.0
+    total_time: float = 0.0
+    peak_buffered: int = 0
+
+
+class Profile:
+    """
+    Collects statistics of all stages of the pipelines built while it is active.
+    Create one with `fluentiter.profiling.profile()`.
+    """
+
+    def __init__(self) -> None:
+        self._stages: Dict[int, StageStats] = {}
+        # keep the profiled stages alive, so their ids are not reused
+        self._refs: List[object] = []
+        # time spent in nested timed calls, one entry per running timed call
+        self._child_time = [0.0]
+
+    @property
+    def stages(self) -> List[StageStats]:
+        """
+        Statistics of all stages in the order they were first seen
+        """
+        return list(self._stages.values())
+
+    def report(self) -> str:
+        """
+        Format the statistics of all stages as a table
+        """
+        lines = [
+            f"{'stage':<28}{'elements':>10}{'calls':>10}{'callable s':>12}"
+            f"{'overhead s':>12}{'total s':>12}{'buffered':>10}"
+        ]
+        for i, s in enumerate(self.stages):
+            lines.append(
+                f"{f'{i} {s.name}':<28}{s.elements:>10}{s.calls:>10}{s.callable_time:>12.6f}"
+                f"{s.overhead_time:>12.6f}{s.total_time:>12.6f}{s.peak_buffered:>10}"
+            )
+        return "\n".join(lines)
+
+    def stage(self, stage: object, name: Optional[str] = None) -> StageStats:
+        """
+        Get the statistics of `stage`, registering it if it was not seen before
+        """
+        key = id(stage)
+        if key not in self._stages:
+            self._refs.append(stage)
+            self._stages[key] = StageStats(name or type(stage).__name__)
+        return self._stages[key]
+
+    def track_callable(self, stage: object, func: Callable[..., R]) -> Callable[..., R]:
+        """
+        Wrap the function given to `stage` to record its calls
+        """
+
+        def tracked(*args: Any) -> R:
+            start = self._enter()
+            try:
+                return func(*args)
+            finally:
+                elapsed, _ = self._exit(start)
+                stats = self.stage(stage)
+                stats.calls += 1
+                stats.callable_time += elapsed
+
+        return tracked
+
+    def track_output(self, stage: object, it: Iterator[T]) -> Generator[T, None, None]:
+        """
+        Wrap the iterator producing the elements of `stage` to record them
+        """
+        return self._track_output(self.stage(stage), it)
+
+    def _track_output(
+        self, stats: StageStats, it: Iterator[T]
+    ) -> Generator[T, None, None]:
+        while True:
+            start = self._enter()
+            try:
+                x = next(it)
+            except StopIteration:
+                return
+            finally:
+                elapsed, children = self._exit(start)
+                stats.total_time += elapsed
+                stats.overhead_time += elapsed - children
+            stats.elements += 1
+            yield x
+
+    def track_buffered(
+        self, name: str, source: Iterator[T], copies: int
+    ) -> Tuple[Iterator[T], Callable[[Iterator[R]], Iterator[R]]]:
+        """
+        Track a stage which splits `source` into several outputs, every element
+        going to `copies` of them.
+
+        Returns the wrapped source and a function to wrap every output with.
+        """
+        stats = self.stage(object(), name)
+        pulled = 0
+
+        def track_source() -> Generator[T, None, None]:
+            nonlocal pulled
+            for x in source:
+                pulled += 1
+                stats.peak_buffered = max(
+                    stats.peak_buffered, pulled * copies - stats.elements
+                )
+                yield x
+
+        def track_output(it: Iterator[R]) -> Iterator[R]:
+            return self._track_output(stats, it)
+
+        return track_source(), track_output
+
+    def _enter(self) -> float:
+        self._child_time.append(0.0)
+        return time.perf_counter()
+
+    def _exit(self, start: float) -> Tuple[float, float]:
+        elapsed = time.perf_counter() - start
+        children = self._child_time.pop()
+        self._child_time[-1] += elapsed
+        return elapsed, children
+
+
+@contextlib.contextmanager
+def profile() -> Generator[Profile, None, None]:
+    """
+    Profile all pipelines built inside this context.
+
+    For every stage the number of elements, the time spent in the functions
+    given to it and the time spent in fluentiter itself is recorded.
+    The statistics include work done after the context was left, as long as
+    the pipeline was built inside it.
+
+    Notes
+    -----
+    Profiling adds considerable overhead to every element and is meant for
+    finding the slow stages of a pipeline, not for measuring absolute runtimes.
+
+    Examples
+    --------
+    >>> with profile() as prof:
+    >>>     iterator(range(100)).map(slow).filter(fast).to_list()
+    >>> print(prof.report())
+        stage           elements     calls  callable s  overhead s     total s  buffered
+        0 FluentIterator     100         0    0.000000    0.000012    0.000021         0
+        1 MapIterator        100       100    0.511230    0.000061    0.511320         0
+        2 FilterIterator      50       100    0.000010    0.000049    0.511402         0
+    """
+    prof = Profile()
+    token = ACTIVE_PROFILE.set(prof)
+    try:
+        yield prof
+    finally:
+        ACTIVE_PROFILE.reset(token)
@@ -0,0 +1,212 @@
+import collections
+import heapq
+import itertools
+import pickle
+import tempfile
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Deque,
+    Generator,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class SpillQueue(Generic[T]):
+    """
+    First-in first-out queue, which keeps at most `max_memory` elements
+    in memory and pickles all further elements to a temporary file.
+
+    The elements are written and read back in chunks of `max_memory // 2`
+    elements, so the file is only touched once per chunk.
+    """
+
+    __slots__ = (
+        "_head_size",
+        "_chunk_size",
+        "_dir",
+        "_head",
+        "_tail",
+        "_file",
+        "_chunks",
+        "_read_pos",
+        "_write_pos",
+        "_len",
+        "_closed",
+    )
+
+    def __init__(
+        self, max_memory: Optional[int] = None, dir: Optional[str] = None
+    ) -> None:
+        if max_memory is None:
+            self._chunk_size = self._head_size = -1
+        else:
+            self._chunk_size = max(1, max_memory // 2)
+            self._head_size = max_memory - self._chunk_size
+        self._dir = dir
+        # elements are read from the head, then from the chunks in the file
+        # and finally from the tail, which is written to the file once full
+        self._head: Deque[T] = collections.deque()
+        self._tail: List[T] = []
+        self._file: Optional[IO[bytes]] = None
+        self._chunks = 0
+        self._read_pos = 0
+        self._write_pos = 0
+        self._len = 0
+        self._closed = False
+
+    def __len__(self) -> int:
+        return self._len
+
+    @property
+    def in_memory(self) -> int:
+        """
+        Number of elements currently held in memory
+        """
+        return len(self._head) + len(self._tail)
+
+    def append(self, x: T) -> None:
+        if self._closed:
+            return
+        self._len += 1
+        if self._head_size == -1 or (
+            not self._chunks and not self._tail and len(self._head) < self._head_size
+        ):
+            self._head.append(x)
+            return
+        self._tail.append(x)
+        if len(self._tail) >= self._chunk_size:
+            self._spill()
+
+    def popleft(self) -> T:
+        """
+        Remove and return the oldest element
+
+        Raises
+        ------
+        IndexError
+            If the queue is empty
+        """
+        if not self._head:
+            if self._chunks:
+                self._head.extend(self._load())
+            else:
+                self._head.extend(self._tail)
+                self._tail.clear()
+        x = self._head.popleft()
+        self._len -= 1
+        return x
+
+    def close(self) -> None:
+        """
+        Drop all elements and delete the temporary file.
+        Elements appended afterwards are dropped as well.
+        """
+        self._closed = True
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._head.clear()
+        self._tail.clear()
+        self._chunks = self._read_pos = self._write_pos = self._len = 0
+
+    def _spill(self) -> None:
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(dir=self._dir)
+        self._file.seek(self._write_pos)
+        pickle.dump(self._tail, self._file, pickle.HIGHEST_PROTOCOL)
+        self._write_pos = self._file.tell()
+        self._chunks += 1
+        self._tail = []
+
+    def _load(self) -> List[T]:
+        assert self._file is not None
+        self._file.seek(self._read_pos)
+        chunk: List[T] = pickle.load(self._file)
+        self._read_pos = self._file.tell()
+        self._chunks -= 1
+        if not self._chunks:
+            # everything was read, reuse the file from the start
+            self._file.seek(0)
+            self._file.truncate()
+            self._read_pos = self._write_pos = 0
+        return chunk
+
+
+def drain(
+    source: Iterator[T], route: Callable[[T], None], queue: SpillQueue[R]
+) -> Generator[R, None, None]:
+    """
+    Yield the elements of `queue`. While it is empty, pull elements from `source`
+    and hand them to `route`, which appends them to this or other queues.
+
+    Several `drain` generators sharing `source` split it into multiple iterators.
+    """
+    try:
+        while True:
+            if not queue:
+                for x in source:
+                    route(x)
+                    if queue:
+                        break
+                else:
+                    return
+            yield queue.popleft()
+    finally:
+        queue.close()
+
+
+def sort(
+    it: Iterator[T],
+    key: Optional[Callable[[T], Any]],
+    reverse: bool,
+    max_memory: Optional[int],
+    dir: Optional[str] = None,
+) -> Generator[T, None, None]:
+    """
+    Yield the elements of `it` sorted like `sorted` does.
+
+    If there are more than `max_memory` elements, runs of `max_memory` elements
+    are sorted and written to a temporary file one after another.
+    The runs are then merged lazily, reading a few elements of each at a time.
+    """
+    run = list(itertools.islice(it, max_memory))
+    if max_memory is None or len(run) < max_memory:
+        run.sort(key=key, reverse=reverse)
+        yield from run
+        return
+    with tempfile.TemporaryFile(dir=dir) as file:
+        runs = []
+        while run:
+            run.sort(key=key, reverse=reverse)
+            start = file.tell()
+            file.writelines(pickle.dumps(x, pickle.HIGHEST_PROTOCOL) for x in run)
+            runs.append((start, len(run)))
+            run = list(itertools.islice(it, max_memory))
+        # keep at most `max_memory` elements in memory while merging
+        batch = max(1, max_memory // len(runs))
+        yield from heapq.merge(
+            *(_read_run(file, start, n, batch) for start, n in runs),
+            key=key,
+            reverse=reverse,
+        )
+
+
+def _read_run(
+    file: IO[bytes], position: int, n: int, batch: int
+) -> Generator[Any, None, None]:
+    # the runs share one file, so seek to this run before every read
+    while n:
+        file.seek(position)
+        elements = [pickle.load(file) for _ in range(min(batch, n))]
+        position = file.tell()
+        n -= len(elements)
+        yield from elements
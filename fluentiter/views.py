@@ -0,0 +1,244 @@
+import itertools
+from operator import length_hint
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple, Union
+
+# iterators which report their exact remaining length and can be repositioned
+# with `__setstate__`, e.g. `iter([1, 2, 3]).__setstate__(2)`
+_SEEKABLE_SOURCES = (list, tuple, range)
+
+
+# `slice` of an `islice` stage and the position of the root it counts from
+_Slice = Tuple[slice, int]
+# flag shared by views, which is cleared once they no longer hold
+_Cell = List[bool]
+
+
+class SequenceView:
+    """
+    Describes the remaining elements of an iterator drawing its elements
+    from a sequence, so they can be counted and accessed without iterating.
+
+    The elements are `funcs` applied to `seq[i]` for every index `i` of `seq`,
+    which has not yet been consumed from `root`, the builtin iterator over `seq`.
+    Lists may change while iterating, so their length is looked up every time.
+
+    `slices` narrow the indices down for `islice` stages, which count from
+    wherever `root` was when they were created.
+
+    A view holds as long as all of its `cells` are set. Views derived from
+    it depend on its `derived` cell as well, which is cleared once elements
+    are pulled past the `islice` stages of those, see `WatchedIterator`.
+    """
+
+    __slots__ = ("_root", "_seq", "_funcs", "_slices", "_cells", "_derived")
+
+    def __init__(
+        self,
+        root: Iterator[Any],
+        seq: Sequence[Any],
+        funcs: Tuple[Callable[[Any], Any], ...] = (),
+        slices: Tuple[_Slice, ...] = (),
+        cells: Tuple[_Cell, ...] = (),
+    ) -> None:
+        self._root = root
+        self._seq = seq
+        self._funcs = funcs
+        self._slices = slices
+        self._cells = cells
+        self._derived: _Cell = [True]
+
+    @classmethod
+    def of(cls, iterable: Any, root: Iterator[Any]) -> Optional["SequenceView"]:
+        """
+        Create a view of `root` if it iterates over a list, tuple or range
+        """
+        if type(iterable) not in _SEEKABLE_SOURCES:
+            return None
+        try:
+            len(iterable)
+        except OverflowError:
+            # ranges longer than sys.maxsize have no length
+            return None
+        return cls(root, iterable)
+
+    def valid(self) -> bool:
+        """
+        Whether this view still describes the remaining elements
+        """
+        return [False] not in self._cells
+
+    def invalidate_derived(self) -> None:
+        """
+        Mark the views derived from this one so far as invalid
+        """
+        self._derived[0] = False
+        self._derived = [True]
+
+    def remaining_indices(self) -> range:
+        """
+        Indices into the sequence of the elements not yet consumed
+        """
+        return self._narrow()[0]
+
+    def remaining(self) -> int:
+        return len(self.remaining_indices())
+
+    def value(self, index: int) -> Any:
+        x = self._seq[index]
+        for func in self._funcs:
+            x = func(x)
+        return x
+
+    def advance(self, n: int) -> None:
+        """
+        Consume the next `n` elements without computing them
+        """
+        if n > 0:
+            index = self.remaining_indices()[n - 1]
+            self._root.__setstate__(index + 1)  # type: ignore[attr-defined]
+
+    def exhaust(self) -> None:
+        """
+        Consume all elements without computing them, moving `root` as far
+        as iterating until the end would
+        """
+        self._root.__setstate__(self._narrow()[1])  # type: ignore[attr-defined]
+
+    def iterate(self) -> Iterator[Any]:
+        """
+        Build a new iterator over the remaining elements
+        """
+        remaining, end = self._narrow()
+        position = self._position()
+        start = remaining.start if remaining else end
+        it: Iterator[Any] = itertools.islice(
+            self._root, start - position, end - position, remaining.step
+        )
+        for func in self._funcs:
+            it = map(func, it)
+        return it
+
+    def map(self, func: Callable[[Any], Any]) -> "SequenceView":
+        return SequenceView(
+            self._root,
+            self._seq,
+            self._funcs + (func,),
+            self._slices,
+            self._cells + (self._derived,),
+        )
+
+    def slice(
+        self, start: Optional[int], stop: Optional[int], step: Optional[int]
+    ) -> "SequenceView":
+        """
+        View of the elements an `islice` with these arguments, created now,
+        would yield
+        """
+        return SequenceView(
+            self._root,
+            self._seq,
+            self._funcs,
+            self._slices + ((slice(start, stop, step), self._position()),),
+            self._cells + (self._derived,),
+        )
+
+    def _narrow(self) -> Tuple[range, int]:
+        """
+        Indices of the remaining elements and the position of `root`
+        once they are all consumed
+        """
+        position = self._position()
+        indices = range(len(self._seq))
+        end = len(indices)
+        for s, start in self._slices:
+            drawn = _after(indices, start)
+            if s.stop is not None and s.stop <= len(drawn):
+                # `islice` stops pulling once it yielded `stop` elements
+                end = drawn[s.stop - 1] + 1 if s.stop else position
+            indices = drawn[s]
+        return _after(indices, position), max(end, position)
+
+    def _position(self) -> int:
+        # exhausted builtin iterators report 0, so this is always in bounds
+        return len(self._seq) - length_hint(self._root)
+
+
+def _after(indices: range, position: int) -> range:
+    """
+    Indices which are at least `position`
+    """
+    if not indices or position <= indices.start:
+        return indices
+    # number of indices below `position`, i.e. ceil((position - start) / step)
+    return indices[-((indices.start - position) // indices.step) :]
+
+
+class LengthView:
+    """
+    Describes only the number of remaining elements of an iterator,
+    which yields one element for every element of each of `views`.
+    """
+
+    __slots__ = ("_views", "_cells", "_derived")
+
+    def __init__(self, *views: "View") -> None:
+        self._views = views
+        self._cells = tuple(v._derived for v in views)
+        self._derived: _Cell = [True]
+
+    def valid(self) -> bool:
+        return [False] not in self._cells and all(v.valid() for v in self._views)
+
+    def invalidate_derived(self) -> None:
+        self._derived[0] = False
+        self._derived = [True]
+
+    def remaining(self) -> int:
+        return min(v.remaining() for v in self._views)
+
+    def advance(self, n: int) -> None:
+        for view in self._views:
+            view.advance(n)
+
+    def exhaust(self) -> None:
+        counts = [v.remaining() for v in self._views]
+        n = min(counts)
+        for view, count in zip(self._views, counts):
+            if count == n:
+                # `zip` stops at the first exhausted iterator
+                view.exhaust()
+                return
+            view.advance(n + 1)
+
+    def map(self, func: Callable[[Any], Any]) -> "LengthView":
+        return LengthView(self)
+
+
+View = Union[SequenceView, LengthView]
+
+
+class WatchedIterator(Iterator[Any]):
+    """
+    Iterator, which invalidates the views derived from `view` once an
+    element is pulled from it.
+
+    Replaces the iterator of a FluentIterator once an adapter draws from the
+    same iterator `source`, since pulling from both moves the position in the
+    root of the adapter's view in ways it cannot tell apart.
+    """
+
+    __slots__ = ("source", "_view")
+
+    def __init__(self, source: Iterator[Any], view: Optional[View]) -> None:
+        self.source = source
+        self._view = view
+
+    def __next__(self) -> Any:
+        if self._view is not None:
+            self._view.invalidate_derived()
+        return next(self.source)
+
+    def __length_hint__(self) -> int:
+        hint = length_hint(self.source, -1)
+        # NotImplemented makes `length_hint` fall back to its default
+        return NotImplemented if hint == -1 else hint
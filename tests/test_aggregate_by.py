@@ -0,0 +1,47 @@
+import hypothesis.strategies as st
+from hypothesis import given
+
+from fluentiter import iterator
+
+
+@given(st.lists(st.integers()))
+def test_reduce_by_key(elements):
+    result = iterator(elements).reduce_by_key(lambda x: x % 3, max)
+    expected = {}
+    for x in elements:
+        expected[x % 3] = max(expected.get(x % 3, x), x)
+    assert result == expected
+
+
+def test_reduce_by_key_keeps_first():
+    result = iterator([(1, "a"), (2, "b"), (1, "c")]).reduce_by_key(
+        lambda x: x[0], lambda a, x: (a[0], a[1] + x[1])
+    )
+    assert result == {1: (1, "ac"), 2: (2, "b")}
+
+
+def test_aggregate_by():
+    requests = [("/home", 120), ("/about", 80), ("/home", 100)]
+    result = iterator(requests).aggregate_by(
+        lambda r: r[0],
+        hits=(0, lambda a, r: a + 1),
+        bytes=(0, lambda a, r: a + r[1]),
+        largest=(None, lambda a, r: r[1] if a is None else max(a, r[1])),
+    )
+    assert result == {
+        "/home": {"hits": 2, "bytes": 220, "largest": 120},
+        "/about": {"hits": 1, "bytes": 80, "largest": 80},
+    }
+
+
+def test_aggregate_by_copies_initial():
+    def append(acc, x):
+        acc.append(x)
+        return acc
+
+    result = iterator([1, 2, 3]).aggregate_by(lambda x: x % 2, seen=([], append))
+    assert result == {1: {"seen": [1, 3]}, 0: {"seen": [2]}}
+
+
+def test_aggregate_by_without_aggregations():
+    assert iterator([1, 2]).aggregate_by(lambda x: x) == {1: {}, 2: {}}
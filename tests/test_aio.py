@@ -0,0 +1,148 @@
+import asyncio
+
+import hypothesis.strategies as st
+import pytest
+from hypothesis import given
+
+from fluentiter import aiterator
+from fluentiter.exceptions import EmptyIteratorError, NotFoundError, StopScan
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+async def agen(elements):
+    for x in elements:
+        await asyncio.sleep(0)
+        yield x
+
+
+async def double(x):
+    await asyncio.sleep(0)
+    return x * 2
+
+
+@given(st.lists(st.integers()))
+def test_to_list_sync_and_async_source(elements):
+    assert run(aiterator(elements).to_list()) == elements
+    assert run(aiterator(agen(elements)).to_list()) == elements
+
+
+def test_next():
+    async def main():
+        my_iter = aiterator([1])
+        assert await my_iter.next() == 1
+        with pytest.raises(StopAsyncIteration):
+            await my_iter.next()
+
+    run(main())
+
+
+def test_map_sync_and_async():
+    assert run(aiterator(agen([1, 2])).map(lambda x: x + 1).to_list()) == [2, 3]
+    assert run(aiterator(agen([1, 2])).map(double).to_list()) == [2, 4]
+
+
+def test_filter():
+    async def is_even(x):
+        return x % 2 == 0
+
+    assert run(aiterator(range(6)).filter(is_even).to_list()) == [0, 2, 4]
+
+
+def test_filter_map():
+    my_iter = aiterator([{"a": 1}, {}, {"a": 3}]).filter_map(lambda x: x.get("a"))
+    assert run(my_iter.to_list()) == [1, 3]
+
+
+def test_enumerate_inspect():
+    seen = []
+    my_iter = aiterator("ab").inspect(seen.append).enumerate()
+    assert run(my_iter.to_list()) == [(0, "a"), (1, "b")]
+    assert seen == ["a", "b"]
+
+
+def test_skip_take():
+    assert run(aiterator(range(10)).skip(2).take(3).to_list()) == [2, 3, 4]
+    assert run(aiterator(range(10)).take(0).to_list()) == []
+
+
+def test_take_closes_upstream():
+    closed = []
+
+    async def source():
+        try:
+            for i in range(10):
+                yield i
+        finally:
+            closed.append(True)
+
+    assert run(aiterator(source()).take(2).to_list()) == [0, 1]
+    assert closed == [True]
+
+
+def test_skip_while_take_while():
+    week = ["Thursday", "Friday", "Saturday", "Sunday", "Monday"]
+    my_iter = aiterator(week).skip_while(lambda x: x != "Saturday")
+    my_iter = my_iter.take_while(lambda x: x in {"Saturday", "Sunday"})
+    assert run(my_iter.to_list()) == ["Saturday", "Sunday"]
+
+
+def test_scan():
+    def running_sum(state, x):
+        if x > 3:
+            raise StopScan
+        return state + x, state + x
+
+    assert run(aiterator(range(10)).scan(0, running_sum).to_list()) == [0, 1, 3, 6]
+
+
+def test_windows():
+    assert run(aiterator(range(5)).tumbling_window(2).to_list()) == [
+        (0, 1),
+        (2, 3),
+        (4,),
+    ]
+    assert run(aiterator(range(4)).rolling_window(3).to_list()) == [
+        (0, 1, 2),
+        (1, 2, 3),
+    ]
+    with pytest.raises(ValueError):
+        aiterator([]).tumbling_window(0)
+    with pytest.raises(ValueError):
+        aiterator([]).rolling_window(0)
+
+
+def test_fold_reduce():
+    async def add(a, b):
+        return a + b
+
+    assert run(aiterator(range(5)).fold(10, add)) == 20
+    assert run(aiterator("abc").reduce(add)) == "abc"
+    with pytest.raises(EmptyIteratorError):
+        run(aiterator([]).reduce(add))
+
+
+def test_count_last():
+    assert run(aiterator(agen(range(7))).count()) == 7
+    assert run(aiterator(range(7)).last()) == 6
+    with pytest.raises(EmptyIteratorError):
+        run(aiterator([]).last())
+
+
+def test_any_find():
+    assert run(aiterator([0, 0, 1]).any())
+    assert not run(aiterator([]).any())
+    assert (
+        run(aiterator(["bert", "waldo"]).find(lambda x: x.startswith("w"))) == "waldo"
+    )
+    with pytest.raises(NotFoundError):
+        run(aiterator(["bert"]).find(lambda x: x.startswith("w")))
+
+
+def test_async_for():
+    async def main():
+        return [x async for x in aiterator(agen("abc"))]
+
+    assert run(main()) == ["a", "b", "c"]
@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+
+from fluentiter import aiterator
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def make_tracked(delays):
+    """
+    Create a function which sleeps for `delays[x]` seconds and tracks
+    how many calls are running at the same time
+    """
+    stats = {"running": 0, "max_running": 0, "cancelled": []}
+
+    async def func(x):
+        stats["running"] += 1
+        stats["max_running"] = max(stats["max_running"], stats["running"])
+        try:
+            await asyncio.sleep(delays.get(x, 0))
+        except asyncio.CancelledError:
+            stats["cancelled"].append(x)
+            raise
+        finally:
+            stats["running"] -= 1
+        return x
+
+    return func, stats
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_amap_concurrency(ordered):
+    func, stats = make_tracked({x: 0.01 for x in range(20)})
+    result = run(
+        aiterator(range(20)).amap(func, concurrency=4, ordered=ordered).to_list()
+    )
+    assert sorted(result) == list(range(20))
+    assert stats["max_running"] == 4
+
+
+def test_amap_ordered():
+    func, _ = make_tracked({0: 0.05, 1: 0.01})
+    assert run(aiterator(range(4)).amap(func, concurrency=4).to_list()) == [0, 1, 2, 3]
+
+
+def test_amap_unordered():
+    func, _ = make_tracked({0: 0.05, 1: 0.01})
+    result = run(aiterator(range(4)).amap(func, concurrency=4, ordered=False).to_list())
+    # 2 and 3 finish at the same time, so their order is undefined
+    assert sorted(result[:2]) == [2, 3]
+    assert result[2:] == [1, 0]
+
+
+def test_amap_sync_function():
+    assert run(aiterator(range(3)).amap(str).to_list()) == ["0", "1", "2"]
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_amap_backpressure(ordered):
+    pulled = []
+
+    async def main():
+        source = aiterator(range(100)).inspect(pulled.append)
+        my_iter = source.amap(str, concurrency=3, ordered=ordered)
+        await my_iter.next()
+        await asyncio.sleep(0.01)
+        # nothing is read while the consumer does not ask for more
+        assert len(pulled) <= 4
+        await my_iter.aclose()
+
+    run(main())
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_amap_timeout(ordered):
+    func, stats = make_tracked({1: 10})
+    my_iter = aiterator(range(5)).amap(
+        func, concurrency=2, ordered=ordered, timeout=0.01
+    )
+    with pytest.raises(asyncio.TimeoutError):
+        run(my_iter.to_list())
+    assert stats["running"] == 0
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_amap_cancels_on_early_stop(ordered):
+    func, stats = make_tracked({x: 10 for x in range(1, 100)})
+    my_iter = aiterator(range(100)).amap(func, concurrency=4, ordered=ordered)
+    assert run(my_iter.take(1).to_list()) == [0]
+    assert sorted(stats["cancelled"]) == [1, 2, 3]
+    assert stats["running"] == 0
+
+
+def test_amap_cancels_on_find():
+    func, stats = make_tracked({x: 10 for x in range(3, 100)})
+    my_iter = aiterator(range(100)).amap(func, concurrency=4, ordered=False)
+    assert run(my_iter.find(lambda x: x == 2)) == 2
+    assert stats["running"] == 0
+
+
+def test_amap_invalid_concurrency():
+    with pytest.raises(ValueError):
+        aiterator([]).amap(str, concurrency=0)
@@ -0,0 +1,33 @@
+import hypothesis.strategies as st
+import pytest
+from hypothesis import given
+
+from fluentiter import iterator
+
+
+def test_batched_simple():
+    assert iterator(range(6)).batched(3).to_list() == [[0, 1, 2], [3, 4, 5]]
+
+
+def test_batched_too_short():
+    assert iterator(range(5)).batched(2).to_list() == [[0, 1], [2, 3], [4]]
+    assert iterator([]).batched(2).to_list() == []
+
+
+def test_batched_is_lazy():
+    my_iter = iterator(range(5))
+    batches = my_iter.batched(2)
+    assert batches.next() == [0, 1]
+    assert my_iter.next() == 2
+
+
+@given(st.lists(st.integers()), st.integers(min_value=1, max_value=10))
+def test_batched_fuzz(elements, size):
+    batches = iterator(elements).batched(size).to_list()
+    assert [x for batch in batches for x in batch] == elements
+    assert all(len(batch) == size for batch in batches[:-1])
+
+
+def test_raises_min_size():
+    with pytest.raises(ValueError):
+        iterator(range(8)).batched(0)
@@ -0,0 +1,96 @@
+import threading
+
+import hypothesis.strategies as st
+import pytest
+from hypothesis import given
+
+from fluentiter import FluentIterator, iterator
+
+
+def counting(elements, pulled):
+    for x in elements:
+        pulled.append(x)
+        yield x
+
+
+@given(
+    st.lists(st.integers(), max_size=30),
+    st.one_of(st.none(), st.integers(1, 6)),
+    st.lists(st.integers(0, 2), max_size=80),
+)
+def test_interleaved_cursors(elements, max_memory, steps):
+    pulled = []
+    cache = iterator(counting(elements, pulled)).cache(max_memory=max_memory)
+    cursors = [iter(cache) for _ in range(3)]
+    seen = [[], [], []]
+    for step in steps:
+        x = next(cursors[step], None)
+        if x is not None or len(seen[step]) < len(elements):
+            seen[step].append(x)
+    for cursor, values in zip(cursors, seen):
+        values.extend(cursor)
+        assert values == elements
+    assert pulled == elements
+    assert iter(cache).to_list() == elements
+
+
+def test_cursor_is_fluent_iterator():
+    cache = iterator([1, 2, 3]).cache()
+    assert isinstance(iter(cache), FluentIterator)
+    assert iter(cache).map(str).to_list() == ["1", "2", "3"]
+    assert iterator(cache).sum() == 6
+    assert list(cache) == [1, 2, 3]
+
+
+def test_lazy():
+    pulled = []
+    cache = iterator(counting(range(100), pulled)).cache()
+    assert pulled == []
+    assert iter(cache).take(3).to_list() == [0, 1, 2]
+    assert pulled == [0, 1, 2]
+    assert cache.cached == 3
+    assert iter(cache).nth(4) == 4
+    assert pulled == [0, 1, 2, 3, 4]
+
+
+def test_spills_past_max_memory(tmp_path):
+    cache = iterator(range(1000)).cache(max_memory=10, spill_dir=str(tmp_path))
+    first, second = iter(cache), iter(cache)
+    assert first.to_list() == list(range(1000))
+    assert cache.in_memory <= 10
+    assert second.step_by(7).to_list() == list(range(0, 1000, 7))
+
+
+def test_unlimited_keeps_everything_in_memory():
+    cache = iterator(range(100)).cache()
+    iter(cache).count()
+    assert cache.in_memory == 100
+
+
+def test_concurrent_threads():
+    cache = iterator(x for x in range(10_000)).cache(max_memory=64)
+    results = [None] * 4
+
+    def consume(i):
+        results[i] = iter(cache).to_list()
+
+    threads = [threading.Thread(target=consume, args=(i,)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results == [list(range(10_000))] * 4
+
+
+@pytest.mark.parametrize("max_memory", [0, -1])
+def test_invalid_max_memory(max_memory):
+    with pytest.raises(ValueError):
+        iterator([1]).cache(max_memory=max_memory)
+
+
+def test_fill_after_other_cursor():
+    # a cursor waiting for the lock finds the element already pulled
+    cache = iterator([1]).cache()
+    assert cache._fill(0)
+    assert cache._fill(0)
+    assert not cache._fill(1)
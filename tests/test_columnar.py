@@ -0,0 +1,113 @@
+import array
+
+import hypothesis.strategies as st
+import pytest
+from hypothesis import given, settings
+
+from fluentiter import columnar, iterator
+from fluentiter.exceptions import EmptyIteratorError, RequiresExtraError
+
+BACKENDS = [
+    False,
+    pytest.param(True, marks=pytest.mark.skipif(columnar.np is None, reason="numpy")),
+]
+
+
+def as_list(chunk):
+    return chunk.tolist()
+
+
+@pytest.mark.parametrize("numpy", BACKENDS)
+@settings(max_examples=30)
+@given(st.lists(st.integers(-1000, 1000), max_size=50), st.integers(1, 7))
+def test_same_as_fluent_iterator(numpy, elements, chunk_size):
+    def cols():
+        return iterator(elements).columns("q", chunk_size, numpy=numpy)
+
+    expected = iterator(elements).map(lambda x: x * 3 + 1).filter(lambda x: x > 0)
+    it = cols().map(lambda x: x * 3 + 1).filter(lambda x: x > 0)
+    assert it.values().to_list() == expected.to_list()
+    assert cols().sum() == iterator(elements).sum()
+    assert cols().count() == len(elements)
+    if elements:
+        assert cols().min() == min(elements)
+        assert cols().max() == max(elements)
+
+
+@pytest.mark.parametrize("numpy", BACKENDS)
+def test_chunks(numpy):
+    chunks = iterator(range(7)).columns("l", 3, numpy=numpy).chunks().map(as_list)
+    assert chunks.to_list() == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+@pytest.mark.parametrize("numpy", BACKENDS)
+def test_filter_drops_empty_chunks(numpy):
+    it = iterator(range(9)).columns("l", 3, numpy=numpy).filter(lambda x: x % 6 == 0)
+    assert it.chunks().map(as_list).to_list() == [[0], [6]]
+
+
+@pytest.mark.parametrize("numpy", BACKENDS)
+def test_map_dtype(numpy):
+    it = iterator([1, 2]).columns("l", numpy=numpy).map(lambda x: x / 2, dtype="d")
+    assert it.to_array().tolist() == [0.5, 1.0]
+    assert it.sum() is None
+
+
+@pytest.mark.parametrize("numpy", BACKENDS)
+def test_python_numbers(numpy):
+    it = iterator([1.5, 2.5]).columns(numpy=numpy)
+    assert [type(x) for x in it] == [float, float]
+    assert type(iterator([1, 2]).columns("l", numpy=numpy).sum()) is int
+
+
+@pytest.mark.parametrize("numpy", BACKENDS)
+def test_empty(numpy):
+    it = iterator([]).columns(numpy=numpy)
+    assert it.sum() is None
+    assert iterator([]).columns(numpy=numpy).count() == 0
+    assert iterator([]).columns(numpy=numpy).to_array().tolist() == []
+    with pytest.raises(EmptyIteratorError):
+        iterator([]).columns(numpy=numpy).min()
+    with pytest.raises(EmptyIteratorError):
+        iterator([]).columns(numpy=numpy).max()
+
+
+@pytest.mark.parametrize("numpy", BACKENDS)
+def test_to_array(numpy):
+    result = iterator(x for x in range(5)).to_array("l", numpy=numpy)
+    assert result.tolist() == [0, 1, 2, 3, 4]
+    columns = iterator(range(5)).columns("l", 2, numpy=numpy).to_array()
+    assert columns.tolist() == [0, 1, 2, 3, 4]
+
+
+def test_array_fallback():
+    assert isinstance(iterator([1.0]).to_array(numpy=False), array.array)
+    it = iterator([1.0]).columns(numpy=False).chunks()
+    assert isinstance(it.next(), array.array)
+
+
+def test_default_backend(monkeypatch):
+    assert columnar._use_numpy(None) is (columnar.np is not None)
+    monkeypatch.setattr(columnar, "np", None)
+    assert isinstance(iterator([1.0]).to_array(), array.array)
+    with pytest.raises(RequiresExtraError):
+        iterator([1.0]).columns(numpy=True)
+
+
+@pytest.mark.parametrize("chunk_size", [0, -1])
+def test_invalid_chunk_size(chunk_size):
+    with pytest.raises(ValueError):
+        iterator([1]).columns(chunk_size=chunk_size)
+
+
+@pytest.mark.skipif(columnar.np is None, reason="numpy")
+def test_numpy_calls_once_per_chunk():
+    calls = []
+
+    def double(x):
+        calls.append(len(x))
+        return x * 2
+
+    it = iterator(range(10)).columns("l", 4, numpy=True).map(double)
+    assert it.to_array().tolist() == [2 * x for x in range(10)]
+    assert calls == [4, 4, 2]
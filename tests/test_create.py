@@ -1,3 +1,10 @@
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+import fluentiter
 from fluentiter import FluentIterator, iterator
 
 
@@ -11,3 +18,29 @@ def test_iterator_from_generator():
     x = range(20)
     my_iter = iterator(x)
     assert isinstance(my_iter, FluentIterator)
+
+
+def test_optional_modules_imported_lazily():
+    # a fresh interpreter, other tests import the modules already
+    code = (
+        "import sys, fluentiter; "
+        "assert 'fluentiter.aio' not in sys.modules; "
+        "assert 'fluentiter.io' not in sys.modules; "
+        "assert 'fluentiter.profiling' not in sys.modules; "
+        "assert fluentiter.AsyncFluentIterator is sys.modules['fluentiter.aio']"
+        ".AsyncFluentIterator; "
+        "assert fluentiter.from_lines is sys.modules['fluentiter.io'].from_lines"
+    )
+    root = pathlib.Path(__file__).parent.parent
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=root)
+
+
+def test_lazy_export():
+    from fluentiter.aio import AsyncFluentIterator
+
+    assert fluentiter.AsyncFluentIterator is AsyncFluentIterator
+
+
+def test_missing_attribute():
+    with pytest.raises(AttributeError):
+        fluentiter.not_a_name
@@ -0,0 +1,142 @@
+import json
+
+import pytest
+
+from fluentiter import FluentIterator, iterator
+from fluentiter.io import read_csv, read_jsonl
+
+CITIES = "name,country,geonameid\nBielefeld,Germany,2949172\nParis,France,2988507\n"
+
+
+@pytest.fixture
+def cities(tmp_path):
+    path = tmp_path / "cities.csv"
+    path.write_text(CITIES)
+    return path
+
+
+def test_read_csv(cities):
+    it = read_csv(cities)
+    assert isinstance(it, FluentIterator)
+    assert it.to_list() == [
+        {"name": "Bielefeld", "country": "Germany", "geonameid": "2949172"},
+        {"name": "Paris", "country": "France", "geonameid": "2988507"},
+    ]
+
+
+def test_read_csv_types(cities):
+    it = read_csv(cities, types={"geonameid": int})
+    assert [x["geonameid"] for x in it] == [2949172, 2988507]
+
+
+def test_read_csv_given_header(cities):
+    it = read_csv(cities, header=["a", "b", "c"])
+    assert it.next() == {"a": "name", "b": "country", "c": "geonameid"}
+    assert it.count() == 2
+
+
+def test_read_csv_without_header(cities):
+    it = read_csv(cities, header=False).skip(1)
+    assert it.to_list() == [
+        ["Bielefeld", "Germany", "2949172"],
+        ["Paris", "France", "2988507"],
+    ]
+
+
+def test_read_csv_types_by_index(cities):
+    it = read_csv(cities, header=False, types={1: str.upper}).skip(1)
+    assert it.next() == ["Bielefeld", "GERMANY", "2949172"]
+
+
+def test_read_csv_short_and_long_rows(tmp_path):
+    path = tmp_path / "ragged.csv"
+    path.write_text("a,b\n1\n1,2,3\n")
+    assert read_csv(path, types={"a": int}).to_list() == [{"a": 1}, {"a": 1, "b": "2"}]
+    path.write_text("1\n1,2,3\n")
+    assert read_csv(path, header=False, types={0: int}).to_list() == [
+        [1],
+        [1, "2", "3"],
+    ]
+
+
+def test_read_csv_fmtparams(tmp_path):
+    path = tmp_path / "semicolon.csv"
+    path.write_text('a;b\n"x;y";2\n')
+    assert read_csv(path, delimiter=";").to_list() == [{"a": "x;y", "b": "2"}]
+
+
+def test_read_csv_empty(tmp_path):
+    path = tmp_path / "empty.csv"
+    path.write_text("")
+    assert read_csv(path).to_list() == []
+
+
+def test_write_csv_dicts(tmp_path, cities):
+    path = tmp_path / "out.csv"
+    read_csv(cities).write_csv(path)
+    assert path.read_bytes() == CITIES.replace("\n", "\r\n").encode()
+
+
+def test_write_csv_select_columns(tmp_path):
+    path = tmp_path / "out.csv"
+    iterator([{"a": 1, "b": 2}, {"b": 4, "a": 3}]).write_csv(path, header=["b"])
+    assert path.read_text().splitlines() == ["b", "2", "4"]
+
+
+def test_write_csv_dicts_without_header(tmp_path):
+    path = tmp_path / "out.csv"
+    iterator([{"a": 1, "b": 2}, {"b": 4, "a": 3}]).write_csv(path, header=False)
+    assert path.read_text().splitlines() == ["1,2", "3,4"]
+
+
+def test_write_csv_missing_column(tmp_path):
+    with pytest.raises(KeyError):
+        iterator([{"a": 1, "b": 2}, {"a": 3}]).write_csv(tmp_path / "out.csv")
+
+
+def test_write_csv_sequences(tmp_path):
+    path = tmp_path / "out.csv"
+    iterator([(1, "x"), [None, "y,z"]]).write_csv(path, header=["a", "b"])
+    assert path.read_text().splitlines() == ["a,b", "1,x", ',"y,z"']
+
+
+def test_write_csv_sequences_default_header(tmp_path):
+    path = tmp_path / "out.csv"
+    iterator([(1, 2)]).write_csv(path, delimiter="\t")
+    assert path.read_bytes() == b"1\t2\r\n"
+
+
+def test_write_csv_empty(tmp_path):
+    path = tmp_path / "out.csv"
+    iterator([]).write_csv(path)
+    assert path.read_text() == ""
+    iterator([]).write_csv(path, header=["a", "b"])
+    assert path.read_bytes() == b"a,b\r\n"
+
+
+def test_write_csv_roundtrip(tmp_path):
+    path = tmp_path / "out.csv"
+    rows = [{"id": i, "square": i * i} for i in range(10_000)]
+    iterator(rows).write_csv(path, buffer_size=1024)
+    assert read_csv(path, types={"id": int, "square": int}).to_list() == rows
+
+
+def test_read_jsonl(tmp_path):
+    path = tmp_path / "events.jsonl"
+    path.write_text('{"type": "click"}\n\n[1, 2]\n  \n"text"')
+    assert read_jsonl(path).to_list() == [{"type": "click"}, [1, 2], "text"]
+
+
+def test_write_jsonl(tmp_path):
+    path = tmp_path / "events.jsonl"
+    values = [{"type": "click", "id": 1}, None, "ü", [1.5]]
+    iterator(values).write_jsonl(path)
+    lines = path.read_text().splitlines()
+    assert [json.loads(x) for x in lines] == values
+    assert read_jsonl(path).to_list() == values
+
+
+def test_write_jsonl_empty(tmp_path):
+    path = tmp_path / "events.jsonl"
+    iterator([]).write_jsonl(path)
+    assert path.read_text() == ""
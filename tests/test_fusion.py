@@ -0,0 +1,116 @@
+import pytest
+
+from fluentiter import FluentIterator, iterator
+
+
+def test_fused_stages_skip_python_next(monkeypatch):
+    """
+    Test chained adapters pull from each other without going
+    through FluentIterator.__next__ for every element
+    """
+    calls = []
+    original_next = FluentIterator.__next__
+
+    def counting_next(self):
+        calls.append(self)
+        return original_next(self)
+
+    monkeypatch.setattr(FluentIterator, "__next__", counting_next)
+    my_iter = (
+        iterator(range(10))
+        .map(lambda x: x * 2)
+        .filter(lambda x: x % 3 == 0)
+        .skip(1)
+        .take(2)
+    )
+    assert list(my_iter) == [6, 12]
+    # only the outermost iterator is advanced in Python
+    assert all(x is my_iter for x in calls)
+
+
+def test_fused_after_peek():
+    my_iter = iterator(range(5))
+    assert my_iter.peek() == 0
+    assert my_iter.map(lambda x: x + 1).to_list() == [1, 2, 3, 4, 5]
+
+
+def test_peek_after_building_downstream():
+    # the downstream stage must still see the peeked element
+    my_iter = iterator([1, 2, 3, 4])
+    mapped = my_iter.map(lambda x: x * 10)
+    assert my_iter.peek() == 1
+    assert mapped.to_list() == [10, 20, 30, 40]
+
+
+def test_peek_after_pulling_from_downstream():
+    my_iter = iterator([1, 2, 3, 4])
+    mapped = my_iter.map(lambda x: x * 10)
+    assert next(mapped) == 10
+    assert my_iter.peek() == 2
+    assert next(mapped) == 20
+    assert mapped.to_list() == [30, 40]
+
+
+def test_peek_after_pulling_from_both():
+    my_iter = iterator(range(6))
+    mapped = my_iter.skip(1).map(str)
+    assert next(my_iter) == 0
+    assert my_iter.peek() == 1
+    assert next(mapped) == "2"
+    assert my_iter.peek() == 3
+    assert my_iter.to_list() == [3, 4, 5]
+    with pytest.raises(StopIteration):
+        my_iter.peek()
+
+
+def test_peek_intermediate_stage_after_building_downstream():
+    my_iter = iterator([0, 1, 2, 3, 4, 5]).skip(1)
+    zipped = my_iter.map(str).zip(range(10)).chain([("x", -1)])
+    assert my_iter.peek() == 1
+    assert zipped.to_list() == [
+        ("1", 0),
+        ("2", 1),
+        ("3", 2),
+        ("4", 3),
+        ("5", 4),
+        ("x", -1),
+    ]
+
+
+def test_peek_after_building_downstream_without_view():
+    # the element can not be looked up without consuming it
+    my_iter = iterator(x for x in range(6)).filter(lambda x: x % 2)
+    zipped = my_iter.map(str).zip(range(10)).chain([("x", -1)])
+    with pytest.raises(ValueError):
+        my_iter.peek()
+    assert zipped.to_list() == [("1", 0), ("3", 1), ("5", 2), ("x", -1)]
+
+
+def test_peek_before_building_downstream():
+    my_iter = iterator(x for x in range(3))
+    assert my_iter.peek() == 0
+    mapped = my_iter.map(str)
+    assert next(mapped) == "0"
+    assert my_iter.peek() == 1
+    assert mapped.to_list() == ["1", "2"]
+    with pytest.raises(StopIteration):
+        my_iter.peek()
+
+
+def test_wrap_fluent_iterator():
+    inner = iterator(range(3)).map(str)
+    assert iterator(inner).to_list() == ["0", "1", "2"]
+
+
+def test_custom_next_is_respected():
+    """
+    Test adapters still go through a custom __next__ of a subclass
+    """
+
+    class Doubling(FluentIterator):
+        __slots__ = ()
+
+        def __next__(self):
+            return next(self._iterable) * 2
+
+    assert Doubling([1, 2, 3]).map(str).to_list() == ["2", "4", "6"]
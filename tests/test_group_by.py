@@ -0,0 +1,28 @@
+import collections
+
+import hypothesis.strategies as st
+from hypothesis import given
+
+from fluentiter import iterator
+
+
+@given(st.lists(st.integers()))
+def test_group_by(elements):
+    groups = iterator(elements).group_by(lambda x: x % 3)
+    assert list(groups) == list(dict.fromkeys(x % 3 for x in elements))
+    for k, group in groups.items():
+        assert group == [x for x in elements if x % 3 == k]
+
+
+def test_group_by_empty():
+    assert iterator([]).group_by(len) == {}
+
+
+@given(st.lists(st.integers(0, 5)))
+def test_count_by(elements):
+    assert iterator(elements).count_by() == collections.Counter(elements)
+
+
+def test_count_by_key():
+    counts = iterator(["apple", "avocado", "banana"]).count_by(lambda x: x[0])
+    assert counts == {"a": 2, "b": 1}
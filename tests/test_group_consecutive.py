@@ -0,0 +1,47 @@
+import itertools
+
+import hypothesis.strategies as st
+from hypothesis import given
+
+from fluentiter import FluentIterator, iterator
+
+
+@given(st.lists(st.integers(0, 3)))
+def test_group_consecutive(elements):
+    groups = iterator(elements).group_consecutive().to_list()
+    assert [k for k, _ in groups] == [k for k, _ in itertools.groupby(elements)]
+
+
+@given(st.lists(st.integers(0, 10)))
+def test_group_consecutive_tuples(elements):
+    result = iterator(elements).group_consecutive_tuples(lambda x: x // 3).to_list()
+    expected = [(k, tuple(g)) for k, g in itertools.groupby(elements, lambda x: x // 3)]
+    assert result == expected
+
+
+def test_group_consecutive_groups_are_fluent():
+    words = ["apple", "avocado", "banana", "apricot"]
+    result = (
+        iterator(words)
+        .group_consecutive(lambda x: x[0])
+        .map(lambda g: (g[0], g[1].map(len).to_list()))
+        .to_list()
+    )
+    assert result == [("a", [5, 7]), ("b", [6]), ("a", [7])]
+
+
+def test_group_consecutive_is_lazy():
+    pulled = []
+    groups = (
+        iterator(range(100)).inspect(pulled.append).group_consecutive(lambda x: x // 10)
+    )
+    key, group = groups.next()
+    assert key == 0
+    assert isinstance(group, FluentIterator)
+    assert group.next() == 0
+    assert pulled == [0]
+
+
+def test_group_consecutive_bounds():
+    assert iterator(iter([1, 1, 2])).group_consecutive().size_bounds() == (0, 4)
+    assert iterator(x for x in [1]).group_consecutive().size_bounds() == (0, None)
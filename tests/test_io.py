@@ -0,0 +1,91 @@
+import io
+
+import pytest
+
+from fluentiter import FluentIterator, from_chunks, from_lines, from_mmap
+
+
+@pytest.fixture
+def text_file(tmp_path):
+    path = tmp_path / "lines.txt"
+    path.write_bytes(b"name,country\nBielefeld,Germany\r\nParis,France")
+    return path
+
+
+def test_from_lines(text_file):
+    it = from_lines(text_file)
+    assert isinstance(it, FluentIterator)
+    assert it.to_list() == ["name,country", "Bielefeld,Germany", "Paris,France"]
+
+
+def test_from_lines_keep_ends(text_file):
+    assert from_lines(text_file, keep_ends=True).to_list() == [
+        "name,country\n",
+        "Bielefeld,Germany\n",
+        "Paris,France",
+    ]
+
+
+def test_from_lines_encoding(tmp_path):
+    path = tmp_path / "latin.txt"
+    path.write_bytes("Köln\nMünchen\n".encode("latin-1"))
+    assert from_lines(path, encoding="latin-1", buffer_size=2).to_list() == [
+        "Köln",
+        "München",
+    ]
+
+
+def test_from_lines_is_lazy(tmp_path):
+    # the file is only opened once the first line is requested
+    it = from_lines(tmp_path / "missing.txt")
+    with pytest.raises(FileNotFoundError):
+        it.next()
+
+
+def test_from_mmap(text_file):
+    records = from_mmap(text_file).to_list()
+    assert all(isinstance(x, memoryview) for x in records)
+    assert [bytes(x) for x in records] == [
+        b"name,country",
+        b"Bielefeld,Germany\r",
+        b"Paris,France",
+    ]
+
+
+def test_from_mmap_delimiter(tmp_path):
+    path = tmp_path / "records.bin"
+    path.write_bytes(b"a\x00\x00bc\x00\x00\x00\x00d\x00\x00")
+    it = from_mmap(path, delimiter=b"\x00\x00").map(bytes)
+    assert it.to_list() == [b"a", b"bc", b"", b"d"]
+
+
+def test_from_mmap_count_without_keeping_records(text_file):
+    assert from_mmap(text_file).count() == 3
+
+
+def test_from_mmap_empty_file(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+    assert from_mmap(path).to_list() == []
+
+
+def test_from_mmap_empty_delimiter(text_file):
+    with pytest.raises(ValueError):
+        from_mmap(text_file, delimiter=b"")
+
+
+@pytest.mark.parametrize("content", [b"abcdefg", "abcdefg"])
+def test_from_chunks(content):
+    f = io.BytesIO(content) if isinstance(content, bytes) else io.StringIO(content)
+    assert from_chunks(f, 3).to_list() == [content[:3], content[3:6], content[6:]]
+    assert not f.closed
+
+
+def test_from_chunks_empty():
+    assert from_chunks(io.BytesIO(), 3).to_list() == []
+
+
+@pytest.mark.parametrize("size", [0, -1])
+def test_from_chunks_invalid_size(size):
+    with pytest.raises(ValueError):
+        from_chunks(io.BytesIO(), size)
@@ -0,0 +1,79 @@
+import hypothesis.strategies as st
+import pytest
+from hypothesis import given
+
+from fluentiter import iterator
+
+st_rows = st.lists(st.tuples(st.integers(0, 5), st.integers()), max_size=15)
+
+
+def key(row):
+    return row[0]
+
+
+def nested_loop_join(left, right, how):
+    result = []
+    matched = set()
+    for x in left:
+        rows = [y for y in right if key(x) == key(y)]
+        matched.update(id(y) for y in rows)
+        result.extend((x, y) for y in rows)
+        if not rows and how != "inner":
+            result.append((x, None))
+    if how == "outer":
+        result.extend((None, y) for y in right if id(y) not in matched)
+    return result
+
+
+def canonical(pairs):
+    return sorted(pairs, key=repr)
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "outer"])
+@given(st_rows, st_rows)
+def test_join(how, left, right):
+    result = iterator(left).join(right, key, how=how).to_list()
+    assert canonical(result) == canonical(nested_loop_join(left, right, how))
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "outer"])
+@given(st_rows, st_rows)
+def test_join_duplicate_keys(how, left, right):
+    result = iterator(left).join(iter(right + right), key, how=how).to_list()
+    assert canonical(result) == canonical(nested_loop_join(left, right + right, how))
+
+
+def test_join_keeps_stream_order():
+    users = [(1, "Arthur"), (2, "Ford")]
+    events = [(2, "hitchhike"), (1, "panic"), (2, "drink")]
+    result = iterator(events).join(users, key).map(lambda p: p[0][1]).to_list()
+    assert result == ["hitchhike", "panic", "drink"]
+
+
+def test_join_builds_table_from_smaller_left():
+    consumed = []
+    users = iterator([(1, "Arthur")])
+    events = (consumed.append(e) or e for e in [(1, "a"), (1, "b"), (2, "c")])
+    joined = users.join(events, key)
+    assert joined.next() == ((1, "Arthur"), (1, "a"))
+    assert consumed == [(1, "a")]
+
+
+def test_join_right_key():
+    result = iterator([1, 2]).join(["a", "bb"], lambda x: x, len).to_list()
+    assert result == [(1, "a"), (2, "bb")]
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "outer"])
+@given(st_rows, st_rows)
+def test_merge_join(how, left, right):
+    left, right = sorted(left, key=key), sorted(right, key=key)
+    result = iterator(left).merge_join(right, key, how=how).to_list()
+    assert canonical(result) == canonical(nested_loop_join(left, right, how))
+    assert [key(x or y) for x, y in result] == sorted(key(x or y) for x, y in result)
+
+
+@pytest.mark.parametrize("method", ["join", "merge_join"])
+def test_join_invalid_how(method):
+    with pytest.raises(ValueError):
+        getattr(iterator([1]), method)([1], key, how="cross")
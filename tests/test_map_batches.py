@@ -0,0 +1,30 @@
+import hypothesis.strategies as st
+import pytest
+from hypothesis import given
+
+from fluentiter import iterator
+
+
+def test_map_batches_simple():
+    my_iter = iterator(range(5)).map_batches(lambda b: [sum(b)], size=2)
+    assert my_iter.to_list() == [1, 5, 4]
+
+
+def test_map_batches_batch_sizes():
+    sizes = []
+    my_iter = iterator(range(7)).map_batches(
+        lambda b: sizes.append(len(b)) or b, size=3
+    )
+    assert my_iter.to_list() == list(range(7))
+    assert sizes == [3, 3, 1]
+
+
+@given(st.lists(st.text()), st.integers(min_value=1, max_value=10))
+def test_map_batches_fuzz(elements, size):
+    result = iterator(elements).map_batches(lambda b: [x.upper() for x in b], size=size)
+    assert result.to_list() == [x.upper() for x in elements]
+
+
+def test_raises_min_size():
+    with pytest.raises(ValueError):
+        iterator(range(8)).map_batches(list, size=0)
@@ -0,0 +1,123 @@
+import hypothesis.strategies as st
+import pytest
+from hypothesis import given
+
+from fluentiter import iterator
+from fluentiter.memo import LRU, TTL
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def counted(func, calls):
+    def wrapper(x):
+        calls.append(x)
+        return func(x)
+
+    return wrapper
+
+
+@given(st.lists(st.integers(0, 10)), st.integers(1, 5))
+def test_same_as_map(elements, maxsize):
+    it = iterator(elements).map_cached(lambda x: x * 2, LRU(maxsize))
+    assert it.to_list() == [x * 2 for x in elements]
+    assert it.memo.hits + it.memo.misses == len(elements)
+
+
+def test_calls_once_per_key():
+    calls = []
+    it = iterator([1, 2, 1, 1, 3, 2]).map_cached(counted(str, calls))
+    assert it.to_list() == ["1", "2", "1", "1", "3", "2"]
+    assert calls == [1, 2, 3]
+    assert (it.memo.hits, it.memo.misses) == (3, 3)
+    assert it.memo.hit_rate == 0.5
+
+
+def test_none_results_are_cached():
+    calls = []
+    iterator([1, 1]).map_cached(counted(lambda x: None, calls)).to_list()
+    assert calls == [1]
+
+
+def test_key_for_unhashable_elements():
+    calls = []
+    rows = [{"ip": "a"}, {"ip": "b"}, {"ip": "a"}]
+    it = iterator(rows).map_cached(
+        counted(lambda row: row["ip"].upper(), calls), key=lambda row: row["ip"]
+    )
+    assert it.to_list() == ["A", "B", "A"]
+    assert calls == [{"ip": "a"}, {"ip": "b"}]
+
+
+def test_lru_evicts_least_recently_used():
+    calls = []
+    cache = LRU(maxsize=2)
+    iterator([1, 2, 1, 3, 1, 2]).map_cached(counted(str, calls), cache).to_list()
+    # 2 was evicted by 3, 1 was used recently and kept
+    assert calls == [1, 2, 3, 2]
+    assert len(cache) == 2
+    assert repr(cache) == "LRU(hits=2, misses=4, size=2)"
+
+
+def test_shared_cache_across_pipelines():
+    calls = []
+    cache = LRU()
+    iterator([1, 2]).map_cached(counted(str, calls), cache).to_list()
+    iterator([2, 1]).map_cached(counted(str, calls), cache).to_list()
+    assert calls == [1, 2]
+    assert cache.hits == 2
+
+
+def test_ttl_expires():
+    clock = Clock()
+    calls = []
+    cache = TTL(ttl=10, timer=clock)
+    func = counted(str, calls)
+    assert iterator([1, 1]).map_cached(func, cache).to_list() == ["1", "1"]
+    clock.now = 5
+    iterator([2]).map_cached(func, cache).to_list()
+    clock.now = 10
+    assert len(cache) == 1
+    iterator([1, 2]).map_cached(func, cache).to_list()
+    assert calls == [1, 2, 1]
+    assert (cache.hits, cache.misses) == (2, 3)
+
+
+def test_ttl_maxsize():
+    calls = []
+    cache = TTL(ttl=100, maxsize=2, timer=Clock())
+    iterator([1, 2, 3, 1]).map_cached(counted(str, calls), cache).to_list()
+    assert calls == [1, 2, 3, 1]
+    assert len(cache) == 2
+
+
+def test_ttl_refresh_on_put():
+    clock = Clock()
+    cache = TTL(ttl=10, timer=clock)
+    cache.put("a", 1)
+    clock.now = 8
+    cache.put("a", 2)
+    clock.now = 12
+    assert cache.get("a") == 2
+
+
+def test_default_hit_rate():
+    assert LRU().hit_rate == 0.0
+
+
+def test_default_cache_is_bounded():
+    it = iterator(range(5000)).map_cached(str)
+    it.to_list()
+    assert isinstance(it.memo, LRU)
+    assert len(it.memo) == it.memo.maxsize == 1024
+
+
+@pytest.mark.parametrize("make", [lambda: LRU(0), lambda: TTL(0), lambda: TTL(1, 0)])
+def test_invalid(make):
+    with pytest.raises(ValueError):
+        make()
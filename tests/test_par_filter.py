@@ -0,0 +1,32 @@
+import hypothesis.strategies as st
+import pytest
+from hypothesis import given, settings
+
+from fluentiter import iterator
+
+
+@settings(max_examples=20)
+@given(st.lists(st.integers()), st.integers(min_value=1, max_value=10))
+def test_par_filter_threads(elements, chunksize):
+    result = iterator(elements).par_filter(
+        lambda x: x % 3 == 0, workers=2, executor="thread", chunksize=chunksize
+    )
+    assert result.to_list() == [x for x in elements if x % 3 == 0]
+
+
+def test_par_filter_process():
+    elements = [0, 1, "", "a", None, [], [1]] * 10
+    result = iterator(elements).par_filter(bool, workers=2, chunksize=4)
+    assert result.to_list() == [x for x in elements if x]
+
+
+def test_par_filter_unordered():
+    result = iterator(range(100)).par_filter(
+        bool, workers=2, executor="thread", ordered=False, chunksize=7
+    )
+    assert sorted(result) == list(range(1, 100))
+
+
+def test_par_filter_invalid_arguments():
+    with pytest.raises(ValueError):
+        iterator([]).par_filter(bool, chunksize=-1)
@@ -0,0 +1,39 @@
+import operator
+
+import hypothesis.strategies as st
+import pytest
+from hypothesis import given, settings
+
+from fluentiter import iterator
+
+
+@settings(max_examples=20)
+@given(st.lists(st.integers()), st.integers(min_value=1, max_value=10))
+def test_par_fold_threads(elements, chunksize):
+    result = iterator(elements).par_fold(
+        0, operator.add, operator.add, executor="thread", chunksize=chunksize
+    )
+    assert result == sum(elements)
+
+
+def test_par_fold_process():
+    result = iterator(range(1000)).par_fold(
+        0, operator.add, operator.add, workers=2, chunksize=100
+    )
+    assert result == sum(range(1000))
+
+
+def test_par_fold_keeps_order():
+    result = iterator("abcdefg").par_fold(
+        "", operator.add, operator.add, workers=3, executor="thread", chunksize=2
+    )
+    assert result == "abcdefg"
+
+
+def test_par_fold_empty():
+    assert iterator([]).par_fold(42, operator.add, operator.add) == 42
+
+
+def test_par_fold_invalid_arguments():
+    with pytest.raises(ValueError):
+        iterator([]).par_fold(0, operator.add, operator.add, workers=0)
@@ -0,0 +1,97 @@
+import threading
+import time
+
+import hypothesis.strategies as st
+import pytest
+from hypothesis import given, settings
+
+from fluentiter import iterator
+
+
+@settings(max_examples=20)
+@given(st.lists(st.integers()))
+def test_par_map_ordered(elements):
+    result = iterator(elements).par_map(lambda x: x * 2, workers=4).to_list()
+    assert result == [x * 2 for x in elements]
+
+
+@settings(max_examples=20)
+@given(st.lists(st.integers()))
+def test_par_map_unordered(elements):
+    result = iterator(elements).par_map(lambda x: x * 2, workers=4, ordered=False)
+    assert sorted(result) == sorted(x * 2 for x in elements)
+
+
+def test_par_map_unordered_refills():
+    result = iterator(range(10)).par_map(str, workers=2, prefetch=2, ordered=False)
+    assert sorted(result) == sorted(map(str, range(10)))
+
+
+def test_par_map_is_concurrent():
+    # would time out if the calls ran one after another
+    barrier = threading.Barrier(4, timeout=5)
+
+    def func(x):
+        barrier.wait()
+        return x
+
+    result = iterator(range(4)).par_map(func, workers=4)
+    assert sorted(result) == [0, 1, 2, 3]
+
+
+def test_par_map_unordered_yields_first_completed():
+    def func(x):
+        time.sleep(0.2 if x == 0 else 0)
+        return x
+
+    result = iterator(range(3)).par_map(func, workers=3, ordered=False).to_list()
+    assert result[-1] == 0
+
+
+def test_par_map_bounded_prefetch():
+    pulled = []
+    source = iterator(range(100)).inspect(pulled.append)
+    my_iter = source.par_map(lambda x: x, workers=2, prefetch=3)
+    assert pulled == []
+    assert my_iter.next() == 0
+    assert len(pulled) == 4
+    assert my_iter.take(2).to_list() == [1, 2]
+    assert len(pulled) <= 6
+
+
+def test_par_map_raises():
+    def func(x):
+        if x == 3:
+            raise KeyError(x)
+        return x
+
+    with pytest.raises(KeyError):
+        iterator(range(10)).par_map(func, workers=2).to_list()
+
+
+def test_par_map_chunksize():
+    result = iterator(range(10)).par_map(str, workers=2, chunksize=3)
+    assert result.to_list() == list(map(str, range(10)))
+
+
+def test_par_map_process():
+    result = iterator(range(-50, 50)).par_map(abs, executor="process", chunksize=8)
+    assert result.to_list() == list(map(abs, range(-50, 50)))
+
+
+def test_par_map_process_unordered():
+    result = iterator(range(-50, 50)).par_map(
+        abs, workers=2, executor="process", ordered=False, chunksize=8
+    )
+    assert sorted(result) == sorted(map(abs, range(-50, 50)))
+
+
+def test_par_map_invalid_arguments():
+    with pytest.raises(ValueError):
+        iterator([]).par_map(str, workers=0)
+    with pytest.raises(ValueError):
+        iterator([]).par_map(str, prefetch=0)
+    with pytest.raises(ValueError):
+        iterator([]).par_map(str, chunksize=0)
+    with pytest.raises(ValueError):
+        iterator([]).par_map(str, executor="fiber")
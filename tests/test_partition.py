@@ -1,3 +1,5 @@
+import pytest
+
 from fluentiter import iterator
 
 
@@ -7,3 +9,35 @@ def test_partition():
     evens, odds = my_iter.partition(lambda x: bool(x & 1))
     assert list(odds) == [1, 3, 5, 7, 9]
     assert list(evens) == [0, 2, 4, 6, 8]
+
+
+def test_partition_max_memory():
+    evens, odds = iterator(range(1000)).partition(lambda x: bool(x & 1), max_memory=10)
+    assert list(odds) == list(range(1, 1000, 2))
+    assert list(evens) == list(range(0, 1000, 2))
+
+
+def test_partition_max_memory_interleaved():
+    evens, odds = iterator(range(10)).partition(lambda x: bool(x & 1), max_memory=1)
+    assert [next(odds), next(evens), next(evens), next(odds)] == [1, 0, 2, 3]
+    assert evens.to_list() == [4, 6, 8]
+    assert odds.to_list() == [5, 7, 9]
+
+
+def test_partition_max_memory_close():
+    evens, odds = iterator(range(10)).partition(lambda x: bool(x & 1), max_memory=2)
+    assert next(evens) == 0
+    odds._iterable.close()
+    assert evens.to_list() == [2, 4, 6, 8]
+
+
+def test_partition_invalid_max_memory():
+    with pytest.raises(ValueError):
+        iterator(range(10)).partition(bool, max_memory=0)
+
+
+def test_partition_into():
+    evens, odds = [], []
+    iterator(range(10)).partition_into(lambda x: bool(x & 1), evens.append, odds.append)
+    assert evens == [0, 2, 4, 6, 8]
+    assert odds == [1, 3, 5, 7, 9]
@@ -35,3 +35,11 @@ def test_peek_raise():
     _ = list(my_iter)
     with pytest.raises(StopIteration):
         my_iter.peek()
+
+
+def test_peek_raise_after_consuming_peeked():
+    my_iter = iterator(x for x in range(1))
+    assert my_iter.peek() == 0
+    assert next(my_iter) == 0
+    with pytest.raises(StopIteration):
+        my_iter.peek()
@@ -1,4 +1,5 @@
 import math
+from fractions import Fraction
 
 import hypothesis.strategies as st
 import pytest
@@ -23,3 +24,15 @@ def test_product_empty():
 
 def test_product_inf():
     assert math.isnan(iterator([float("inf"), 0]).product())
+
+
+def test_product_floats():
+    assert iterator([0.5, 4, 1.5]).product() == 3.0
+
+
+def test_product_fractions():
+    assert iterator([Fraction(1, 3), Fraction(3, 2)]).product() == Fraction(1, 2)
+
+
+def test_product_repeats_sequences():
+    assert iterator(["ab", 2]).product() == "abab"
@@ -0,0 +1,77 @@
+import time
+
+import pytest
+
+from fluentiter import iterator
+from fluentiter.profiling import ACTIVE_PROFILE, profile
+
+
+def test_profile_stages():
+    def slow(x):
+        time.sleep(0.001)
+        return x
+
+    with profile() as prof:
+        result = iterator(range(20)).map(slow).filter(lambda x: x % 2 == 0).to_list()
+    assert result == list(range(0, 20, 2))
+
+    source, mapped, filtered = prof.stages
+    assert (source.name, mapped.name, filtered.name) == (
+        "FluentIterator",
+        "MapIterator",
+        "FilterIterator",
+    )
+    assert (source.elements, mapped.elements, filtered.elements) == (20, 20, 10)
+    assert (source.calls, mapped.calls, filtered.calls) == (0, 20, 20)
+    assert mapped.callable_time >= 0.02
+    # the time spent in `slow` is attributed to the map stage only
+    assert mapped.overhead_time < mapped.callable_time
+    assert filtered.overhead_time < mapped.callable_time
+    assert filtered.total_time >= mapped.total_time >= mapped.callable_time
+
+
+def test_profile_for_loop():
+    with profile() as prof:
+        for _ in iterator([1, 2, 3]).map(str):
+            pass
+    assert [s.elements for s in prof.stages] == [3, 3]
+
+
+@pytest.mark.parametrize("max_memory", [None, 2])
+def test_profile_unzip_buffer(max_memory):
+    with profile() as prof:
+        a, b = iterator(range(10)).map(lambda x: (x, x)).unzip(max_memory=max_memory)
+        assert list(a) == list(range(10))
+        assert list(b) == list(range(10))
+    unzip = next(s for s in prof.stages if s.name == "unzip")
+    assert unzip.elements == 20
+    assert unzip.peak_buffered >= 10
+
+
+@pytest.mark.parametrize("max_memory", [None, 2])
+def test_profile_partition_buffer(max_memory):
+    with profile() as prof:
+        evens, odds = iterator(range(10)).partition(
+            lambda x: bool(x & 1), max_memory=max_memory
+        )
+        assert list(odds) == [1, 3, 5, 7, 9]
+        assert list(evens) == [0, 2, 4, 6, 8]
+    partition = next(s for s in prof.stages if s.name == "partition")
+    assert partition.elements == 10
+    assert partition.peak_buffered >= 5
+
+
+def test_profile_report():
+    with profile() as prof:
+        iterator(range(3)).skip_while(lambda x: x < 1).count()
+    report = prof.report().splitlines()
+    assert len(report) == 3
+    assert "SkipWhileIterator" in report[2]
+
+
+def test_profile_is_reset():
+    with profile():
+        assert ACTIVE_PROFILE.get() is not None
+    assert ACTIVE_PROFILE.get() is None
+    my_iter = iterator([1])
+    assert iter(my_iter) is my_iter
@@ -28,3 +28,20 @@ def test_rolling_window_valueerror():
         iterator(range(5)).rolling_window(0)
     with pytest.raises(ValueError):
         iterator(range(5)).rolling_window(-1)
+
+
+def test_rolling_window_size_hint():
+    it = iterator(range(5)).rolling_window(3)
+    assert it.size_hint() == 3
+    assert next(it) == (0, 1, 2)
+    assert it.size_hint() == 2
+    assert it.to_list() == [(1, 2, 3), (2, 3, 4)]
+    assert it.size_hint() == 0
+    assert iterator(range(2)).rolling_window(3).size_hint() == 0
+
+
+def test_rolling_window_is_lazy():
+    source = iterator(range(5))
+    windows = source.rolling_window(3)
+    assert source.next() == 0
+    assert windows.to_list() == [(1, 2, 3), (2, 3, 4)]
@@ -0,0 +1,309 @@
+from contextlib import nullcontext
+
+import hypothesis.strategies as st
+import pytest
+from hypothesis import given
+
+from fluentiter import iterator
+from fluentiter.exceptions import EmptyIteratorError
+
+SOURCES = [list, tuple, lambda x: range(len(x))]
+
+# operations which keep the knowledge about the sequence source
+OPERATIONS = {
+    "map": lambda it, n: it.map(lambda x: (x, n)),
+    "enumerate": lambda it, n: it.enumerate(),
+    "zip": lambda it, n: it.zip(list(range(n * 3))),
+    "step_by": lambda it, n: it.step_by(n + 1),
+    "skip": lambda it, n: it.skip(n),
+    "take": lambda it, n: it.take(n * 2),
+    "next": lambda it, n: _advance(it, n),
+}
+
+
+def _advance(it, n):
+    for _ in range(n):
+        next(it, None)
+    return it
+
+
+st_pipeline = st.lists(
+    st.tuples(st.sampled_from(sorted(OPERATIONS)), st.integers(0, 5)), max_size=6
+)
+
+
+def build(source, pipeline):
+    it = iterator(source)
+    for name, n in pipeline:
+        it = OPERATIONS[name](it, n)
+    return it
+
+
+def generator(source):
+    yield from source
+
+
+@pytest.mark.parametrize("make_source", SOURCES)
+@given(st.lists(st.integers(), max_size=30), st_pipeline)
+def test_count_same_as_iterating(make_source, elements, pipeline):
+    source = make_source(elements)
+    fast = build(source, pipeline)
+    slow = build(generator(source), pipeline)
+    assert fast.size_hint() in (None, len(list(build(source, pipeline))))
+    assert fast.count() == slow.count()
+    assert fast.to_list() == []
+
+
+@pytest.mark.parametrize("make_source", SOURCES)
+@given(st.lists(st.integers(), max_size=30), st_pipeline)
+def test_last_same_as_iterating(make_source, elements, pipeline):
+    source = make_source(elements)
+    expected = list(build(generator(source), pipeline))
+    fast = build(source, pipeline)
+    if expected:
+        assert fast.last() == expected[-1]
+    else:
+        with pytest.raises(EmptyIteratorError):
+            fast.last()
+    assert fast.to_list() == []
+
+
+@pytest.mark.parametrize("make_source", SOURCES)
+@given(st.lists(st.integers(), max_size=30), st_pipeline, st.integers(0, 35))
+def test_nth_same_as_iterating(make_source, elements, pipeline, index):
+    source = make_source(elements)
+    expected = list(build(generator(source), pipeline))
+    fast = build(source, pipeline)
+    if index < len(expected):
+        assert fast.nth(index) == expected[index]
+        assert fast.size_hint() in (None, len(expected) - index - 1)
+        assert fast.to_list() == expected[index + 1 :]
+    else:
+        with pytest.raises(IndexError):
+            fast.nth(index)
+        assert fast.to_list() == []
+
+
+def test_count_does_not_call_map():
+    calls = []
+    it = iterator(list(range(10**6))).map(calls.append).enumerate()
+    assert it.count() == 10**6
+    assert calls == []
+
+
+def test_last_calls_map_once():
+    calls = []
+
+    def double(x):
+        calls.append(x)
+        return 2 * x
+
+    assert iterator(range(10**9)).map(double).step_by(3).last() == 2 * 999999999
+    assert calls == [999999999]
+
+
+def test_nth_then_next():
+    it = iterator(list(range(10))).map(str).skip(2)
+    assert it.nth(3) == "5"
+    assert it.next() == "6"
+    assert it.size_hint() == 3
+
+
+def test_count_after_next():
+    it = iterator((1, 2, 3, 4)).step_by(2)
+    assert it.next() == 1
+    assert it.count() == 1
+
+
+def test_count_after_peek():
+    it = iterator([1, 2, 3]).map(str)
+    assert it.peek() == "1"
+    assert it.count() == 3
+
+
+def _take_after_next():
+    it = iterator(list(range(10)))
+    taken = it.take(3)
+    next(it)
+    return taken
+
+
+def test_take_after_next_on_upstream():
+    assert _take_after_next().size_hint() in (None, 3)
+    assert _take_after_next().count() == 3
+    assert _take_after_next().last() == 3
+    assert _take_after_next().nth(2) == 3
+    assert _take_after_next().to_list() == [1, 2, 3]
+
+
+def test_skip_after_next_on_upstream():
+    it = iterator(list(range(10)))
+    skipped = it.skip(2)
+    next(it)
+    assert skipped.size_hint() in (None, 7)
+    assert skipped.count() == 7
+
+
+def test_step_by_after_next_on_upstream():
+    it = iterator(list(range(10)))
+    stepped = it.step_by(3).map(str)
+    next(it)
+    assert stepped.size_hint() == 3
+    assert stepped.to_list() == ["1", "4", "7"]
+
+
+def test_take_after_next_on_both():
+    it = iterator(list(range(10)))
+    taken = it.take(3)
+    assert next(taken) == 0
+    assert next(it) == 1
+    assert taken.size_hint() is None
+    assert taken.count() == 2
+    assert it.to_list() == list(range(4, 10))
+
+
+def test_count_after_next_on_upstream_of_filter():
+    it = iterator(list(range(10)))
+    taken = it.take(5)
+    odd = taken.filter(lambda x: x % 2)
+    assert next(odd) == 1
+    assert next(taken) == 2
+    assert taken.size_hint() == 2
+    assert taken.to_list() == [3, 4]
+
+
+@pytest.mark.parametrize(
+    "make_adapter", [lambda it: it.map(str), lambda it: it.take(5)]
+)
+def test_count_after_peek_on_upstream(make_adapter):
+    it = iterator([1, 2, 3])
+    adapter = make_adapter(it)
+    assert it.peek() == 1
+    assert adapter.size_hint() is None or adapter.size_hint() == 3
+    assert adapter.count() == 3
+
+
+def test_no_view_for_other_iterables():
+    it = iterator({1, 2, 3}).map(str)
+    assert it._sized_view() is None
+    assert it.count() == 3
+
+
+def test_no_view_after_filter():
+    it = iterator([1, 2, 3]).filter(bool).map(str)
+    assert it._sized_view() is None
+    assert it.last() == "3"
+
+
+def test_nth_on_upstream():
+    it = iterator(list(range(10)))
+    skipped = it.skip(2)
+    assert it.nth(1) == 1
+    assert skipped.size_hint() in (None, 6)
+    assert it.peek() == 2
+    assert skipped.to_list() == [4, 5, 6, 7, 8, 9]
+
+
+def test_count_after_next_on_upstream_of_zip():
+    zipped = iterator([1, 2, 3]).zip([4, 5, 6])
+    mapped = zipped.map(str)
+    assert next(zipped) == (1, 4)
+    assert mapped.size_hint() == 2
+    assert mapped.count() == 2
+
+
+def test_terminals_after_extending_list():
+    source = [1, 2, 3]
+    it = iterator(source).skip(1).map(str)
+    source.extend([4, 5])
+    assert it.size_hint() == 4
+    assert it.nth(1) == "3"
+    assert it.last() == "5"
+
+
+def test_count_after_extending_list():
+    source = [1, 2, 3]
+    it = iterator(source).step_by(2)
+    source.extend([4, 5])
+    assert it.count() == 3
+
+
+@pytest.mark.parametrize(
+    "terminal, error",
+    [(lambda it: it.last(), EmptyIteratorError), (lambda it: it.nth(0), IndexError)],
+)
+def test_terminals_after_clearing_list(terminal, error):
+    source = [1, 2, 3]
+    it = iterator(source).map(str)
+    assert next(it) == "1"
+    source.clear()
+    assert it.size_hint() == 0
+    with pytest.raises(error):
+        terminal(it)
+    assert it.count() == 0
+
+
+TERMINALS = {
+    "count": lambda it: it.count(),
+    "last": lambda it: it.last(),
+    "nth": lambda it: it.nth(2),
+}
+
+
+@pytest.mark.parametrize("terminal", TERMINALS)
+@given(st.lists(st.integers(), max_size=30), st_pipeline)
+def test_terminals_consume_source_like_iterating(terminal, elements, pipeline):
+    def left_in_source(source):
+        it = iterator(source)
+        adapter = build(it, pipeline)
+        try:
+            TERMINALS[terminal](adapter)
+        except IndexError:
+            pass
+        return it.to_list()
+
+    assert left_in_source(elements) == left_in_source(generator(elements))
+
+
+@pytest.mark.parametrize("terminal", TERMINALS)
+def test_skip_past_the_end_consumes_source(terminal):
+    it = iterator([1, 2, 3])
+    with pytest.raises(IndexError) if terminal != "count" else nullcontext():
+        TERMINALS[terminal](it.skip(5))
+    assert it.to_list() == []
+
+
+def test_step_by_consumes_trailing_elements():
+    it = iterator(list(range(11)))
+    assert it.step_by(3).count() == 4
+    assert it.to_list() == []
+    it = iterator(list(range(11)))
+    assert it.step_by(3).last() == 9
+    assert it.to_list() == []
+
+
+def test_take_stops_after_last_element():
+    it = iterator(list(range(11)))
+    assert it.step_by(3).take(2).count() == 2
+    assert it.to_list() == list(range(4, 11))
+    it = iterator(list(range(11)))
+    assert it.take(0).count() == 0
+    assert it.to_list() == list(range(11))
+
+
+def test_rest_after_nth_consumes_source():
+    it = iterator(list(range(11)))
+    stepped = it.step_by(3)
+    assert stepped.nth(1) == 3
+    assert stepped.to_list() == [6, 9]
+    assert it.to_list() == []
+
+
+def test_terminals_on_shared_iterator_iterate():
+    it = iterator(list(range(10)))
+    taken = it.take(3)
+    mapped = taken.map(str)
+    assert taken.nth(0) == 0
+    assert taken.count() == 2
+    assert mapped.to_list() == []
+    assert it.to_list() == list(range(3, 10))
@@ -0,0 +1,161 @@
+import operator
+
+import hypothesis.strategies as st
+import pytest
+from hypothesis import given, settings
+
+from fluentiter import iterator
+
+ADAPTERS = {
+    "map": lambda it: it.map(str),
+    "enumerate": lambda it: it.enumerate(),
+    "inspect": lambda it: it.inspect(str),
+    "zip": lambda it: it.zip(range(7)),
+    "zip_generator": lambda it: it.zip(x for x in range(7)),
+    "chain": lambda it: it.chain([1, 2]),
+    "chain_generator": lambda it: it.chain(x for x in range(2)),
+    "step_by": lambda it: it.step_by(3),
+    "skip": lambda it: it.skip(2),
+    "take": lambda it: it.take(4),
+    "filter": lambda it: it.filter(bool),
+    "filter_map": lambda it: it.filter_map(lambda x: x or None),
+    "skip_while": lambda it: it.skip_while(lambda x: x < 3),
+    "take_while": lambda it: it.take_while(lambda x: x < 3),
+    "map_while": lambda it: it.map_while(lambda x: x if x < 3 else None),
+    "scan": lambda it: it.scan(0, lambda s, x: (s, x)),
+    "flat_map": lambda it: it.flat_map(lambda x: [x, x]),
+    "flatten": lambda it: it.map(lambda x: [x]).flatten(),
+    "tumbling_window": lambda it: it.tumbling_window(3),
+    "batched": lambda it: it.batched(3),
+    "map_batches": lambda it: it.map_batches(lambda b: b, size=3),
+    "rolling_window": lambda it: it.rolling_window(3),
+    "par_map": lambda it: it.par_map(str, workers=2),
+    "par_filter": lambda it: it.par_filter(bool, workers=2, executor="thread"),
+    "unique": lambda it: it.unique(),
+    "unique_approx": lambda it: it.unique_approx(100),
+    "map_cached": lambda it: it.map_cached(str),
+}
+
+SOURCES = {
+    "list": list,
+    "generator": lambda x: (y for y in x),
+    "peeked": lambda x: _peeked(x),
+    "filtered": lambda x: iterator(x).filter(lambda _: True),
+}
+
+
+def _peeked(x):
+    it = iterator(y for y in x)
+    if x:
+        it.peek()
+    return it
+
+
+@pytest.mark.parametrize("source", SOURCES)
+@pytest.mark.parametrize("adapter", ADAPTERS)
+@settings(max_examples=30)
+@given(st.lists(st.integers(0, 5), max_size=12), st.integers(0, 5))
+def test_bounds_hold_while_iterating(source, adapter, elements, consumed):
+    it = ADAPTERS[adapter](iterator(SOURCES[source](elements)))
+    for _ in range(consumed):
+        next(it, None)
+    lower, upper = it.size_bounds()
+    remaining = len(it.to_list())
+    assert lower <= remaining
+    assert upper is None or remaining <= upper
+
+
+@pytest.mark.parametrize("source", ["list", "generator"])
+@pytest.mark.parametrize("adapter", ADAPTERS)
+@settings(max_examples=30)
+@given(st.lists(st.integers(0, 5), min_size=1, max_size=12))
+def test_bounds_hold_after_peek(source, adapter, elements):
+    it = ADAPTERS[adapter](iterator(SOURCES[source](elements)))
+    try:
+        it.peek()
+    except StopIteration:
+        pass
+    lower, upper = it.size_bounds()
+    remaining = len(it.to_list())
+    assert lower <= remaining
+    assert upper is None or remaining <= upper
+
+
+@pytest.mark.parametrize("adapter", ["map", "enumerate", "inspect", "zip"])
+def test_exact_after_peek(adapter):
+    it = ADAPTERS[adapter](iterator([1, 2, 3, 4, 5, 6, 7, 8]))
+    expected = len(ADAPTERS[adapter](iterator([1, 2, 3, 4, 5, 6, 7, 8])).to_list())
+    it.peek()
+    assert it.size_hint() == expected
+
+
+def test_filter_upper_bound_after_peek():
+    it = iterator([1, 2, 3, 4]).filter(bool)
+    it.peek()
+    assert it.size_bounds() == (1, 4)
+
+
+@pytest.mark.parametrize(
+    "adapter",
+    [
+        "map",
+        "enumerate",
+        "inspect",
+        "zip",
+        "chain",
+        "step_by",
+        "skip",
+        "tumbling_window",
+        "batched",
+        "rolling_window",
+    ],
+)
+def test_exact_for_generators_with_length(adapter):
+    # an iterator without a sequence view, which still reports its length
+    source = iterator(iter(range(10))).map(abs)
+    it = ADAPTERS[adapter](source)
+    expected = len(ADAPTERS[adapter](iterator(range(10))).to_list())
+    if adapter == "step_by":
+        assert it.size_bounds() == (expected - 1, expected)
+    elif adapter == "skip":
+        # the first elements may already have been skipped
+        assert it.size_bounds() == (expected, expected + 2)
+    elif adapter == "rolling_window":
+        lower, upper = it.size_bounds()
+        assert lower <= expected <= upper
+    else:
+        assert it.size_bounds() == (expected, expected)
+
+
+def test_unknown():
+    assert iterator(x for x in range(3)).size_bounds() == (0, None)
+    assert iterator(range(3)).cycle().size_bounds() == (0, None)
+
+
+def test_filter_upper_bound():
+    assert iterator([1, 2, 3, 4]).filter(bool).size_bounds() == (0, 4)
+
+
+def test_take_upper_bound():
+    assert iterator(x for x in range(10)).take(3).size_bounds() == (0, 3)
+
+
+def test_par_map_lower_bound():
+    it = iterator(iter(range(10))).par_map(str, workers=1, prefetch=1)
+    assert it.size_bounds() == (10, None)
+
+
+def test_length_hint():
+    assert operator.length_hint(iterator(iter(range(4))).map(str)) == 4
+    assert operator.length_hint(iterator(iter(range(4))).chain(x for x in "ab")) == 4
+    assert operator.length_hint(iterator(x for x in range(4)), -1) == -1
+
+
+def test_into_tuple():
+    assert iterator(iter(range(4))).map(str).into(tuple) == ("0", "1", "2", "3")
+
+
+def test_huge_range():
+    it = iterator(range(10**20))
+    assert it.size_bounds() == (0, None)
+    assert it.take(2).to_list() == [0, 1]
@@ -0,0 +1,61 @@
+import sys
+
+import pytest
+
+from fluentiter import FluentIterator, iterator
+
+# a bare object, the 16 byte GC header and at most four 8 byte slots
+# (64 bit CPython), an instance `__dict__` would not fit into this
+MAX_INSTANCE_SIZE = sys.getsizeof(object()) + 16 + 8 * 4
+
+
+ADAPTERS = {
+    "iterator": lambda it: it,
+    "step_by": lambda it: it.step_by(2),
+    "chain": lambda it: it.chain([1]),
+    "zip": lambda it: it.zip([1]),
+    "map": lambda it: it.map(str),
+    "filter": lambda it: it.filter(bool),
+    "filter_map": lambda it: it.filter_map(str),
+    "enumerate": lambda it: it.enumerate(),
+    "skip_while": lambda it: it.skip_while(bool),
+    "take_while": lambda it: it.take_while(bool),
+    "map_while": lambda it: it.map_while(str),
+    "skip": lambda it: it.skip(1),
+    "take": lambda it: it.take(1),
+    "scan": lambda it: it.scan(0, lambda s, x: (s, x)),
+    "flat_map": lambda it: it.flat_map(lambda x: [x]),
+    "flatten": lambda it: it.map(lambda x: [x]).flatten(),
+    "inspect": lambda it: it.inspect(print),
+    "cycle": lambda it: it.cycle(),
+    "tumbling_window": lambda it: it.tumbling_window(2),
+    "rolling_window": lambda it: it.rolling_window(2),
+    "sorted": lambda it: it.sorted(),
+    "top_k_by_window": lambda it: it.top_k_by_window(2, 1),
+    "group_consecutive": lambda it: it.group_consecutive(),
+    "unique": lambda it: it.unique(),
+    "unique_max_seen": lambda it: it.unique(max_seen=2),
+    "unique_approx": lambda it: it.unique_approx(10),
+    "map_cached": lambda it: it.map_cached(str),
+}
+
+
+@pytest.mark.parametrize("name", ADAPTERS)
+def test_no_instance_dict(name):
+    adapter = ADAPTERS[name](iterator([1, 2, 3]))
+    assert isinstance(adapter, FluentIterator)
+    assert not hasattr(adapter, "__dict__")
+    with pytest.raises(AttributeError):
+        adapter.foo = "bar"
+
+
+@pytest.mark.parametrize("name", ADAPTERS)
+def test_instance_size(name):
+    adapter = ADAPTERS[name](iterator([1, 2, 3]))
+    assert sys.getsizeof(adapter) <= MAX_INSTANCE_SIZE
+
+
+def test_peek_slots():
+    my_iter = iterator([1, 2, 3])
+    my_iter.peek()
+    assert not hasattr(my_iter._iterable, "__dict__")
@@ -0,0 +1,50 @@
+import hypothesis.strategies as st
+import pytest
+from hypothesis import given
+
+from fluentiter import iterator
+from fluentiter.profiling import profile
+
+
+@given(
+    st.lists(st.tuples(st.integers(0, 5), st.integers())),
+    st.booleans(),
+    st.none() | st.integers(1, 10),
+)
+def test_sorted_like_builtin(elements, reverse, max_memory):
+    # sorting by the first element only checks the sort is stable
+    def key(x):
+        return x[0]
+
+    result = iterator(elements).sorted(key, reverse, max_memory).to_list()
+    assert result == sorted(elements, key=key, reverse=reverse)
+
+
+@given(st.lists(st.integers()), st.integers(1, 10))
+def test_sorted_without_key(elements, max_memory):
+    result = iterator(elements).sorted(max_memory=max_memory).to_list()
+    assert result == sorted(elements)
+
+
+def test_sorted_is_lazy():
+    consumed = []
+    it = iterator(range(5, 0, -1)).inspect(consumed.append).sorted(max_memory=2)
+    assert consumed == []
+    assert it.next() == 1
+    assert consumed == [5, 4, 3, 2, 1]
+
+
+def test_sorted_many_runs():
+    it = iterator(range(1000, 0, -1)).sorted(max_memory=7)
+    assert it.take(3).to_list() == [1, 2, 3]
+
+
+def test_sorted_invalid_max_memory():
+    with pytest.raises(ValueError):
+        iterator([1]).sorted(max_memory=0)
+
+
+def test_sorted_profiled_key():
+    with profile() as prof:
+        iterator([3, 1, 2]).sorted(key=lambda x: -x).to_list()
+    assert prof.stages[-1].calls == 3
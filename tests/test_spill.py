@@ -0,0 +1,56 @@
+import collections
+
+import hypothesis.strategies as st
+import pytest
+from hypothesis import given
+
+from fluentiter.spill import SpillQueue
+
+# True appends the next number, False pops the oldest one
+st_operations = st.lists(st.booleans(), max_size=200)
+
+
+@given(st.integers(1, 10), st_operations)
+def test_fifo_like_deque(max_memory, operations):
+    queue = SpillQueue(max_memory)
+    expected = collections.deque()
+    for i, append in enumerate(operations):
+        if append:
+            queue.append(i)
+            expected.append(i)
+        elif expected:
+            assert queue.popleft() == expected.popleft()
+        assert len(queue) == len(expected)
+        assert queue.in_memory <= max_memory
+    assert [queue.popleft() for _ in range(len(queue))] == list(expected)
+
+
+def test_unlimited():
+    queue = SpillQueue()
+    for i in range(1000):
+        queue.append(i)
+    assert queue.in_memory == 1000
+    assert queue.popleft() == 0
+
+
+def test_spills_to_file(tmp_path):
+    queue = SpillQueue(4, dir=str(tmp_path))
+    for i in range(100):
+        queue.append(i)
+    assert queue.in_memory <= 4
+    assert [queue.popleft() for _ in range(100)] == list(range(100))
+
+
+def test_popleft_empty():
+    with pytest.raises(IndexError):
+        SpillQueue(2).popleft()
+
+
+def test_close():
+    queue = SpillQueue(2)
+    for i in range(10):
+        queue.append(i)
+    queue.close()
+    queue.append(1)
+    assert len(queue) == 0
+    assert queue.in_memory == 0
@@ -1,6 +1,8 @@
 import math
+from fractions import Fraction
 
 import hypothesis.strategies as st
+import pytest
 from hypothesis import given
 
 from fluentiter import iterator
@@ -24,3 +26,47 @@ def test_sum_inf():
 def test_sum_str(strlist):
     true_sum = "".join(strlist)
     iterator(strlist).sum() == true_sum
+
+
+def _add_in_loop(elements):
+    total = elements[0]
+    for x in elements[1:]:
+        total = total + x
+    return total
+
+
+@given(st.lists(st.floats(-1e300, 1e300), min_size=1))
+def test_sum_floats(floatlist):
+    assert iterator(floatlist).sum() == _add_in_loop(floatlist)
+
+
+def test_sum_floats_rounding():
+    # builtin sum gives 1.0 since Python 3.12
+    assert iterator([0.1] * 10).sum() == 0.9999999999999999
+
+
+@given(st.lists(st.complex_numbers(max_magnitude=1e300), min_size=1))
+def test_sum_complex(complexlist):
+    assert iterator(complexlist).sum() == _add_in_loop(complexlist)
+
+
+def test_sum_bytes():
+    assert iterator([b"a", b"b", b"c"]).sum() == b"abc"
+
+
+def test_sum_mixed_numbers():
+    assert iterator([1, 2.5, 1j]).sum() == 3.5 + 1j
+    assert iterator([True, True, 1]).sum() == 3
+
+
+def test_sum_fractions():
+    assert iterator([Fraction(1, 3), Fraction(2, 3)]).sum() == 1
+
+
+def test_sum_lists():
+    assert iterator([[1], [2], [3]]).sum() == [1, 2, 3]
+
+
+def test_sum_str_mixed():
+    with pytest.raises(TypeError):
+        iterator(["a", 1]).sum()
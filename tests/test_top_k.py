@@ -0,0 +1,52 @@
+import heapq
+
+import hypothesis.strategies as st
+import pytest
+from hypothesis import given
+
+from fluentiter import iterator
+
+
+@given(st.lists(st.integers()), st.integers(0, 10))
+def test_top_k(elements, k):
+    assert iterator(elements).top_k(k) == sorted(elements, reverse=True)[:k]
+
+
+@given(st.lists(st.integers()), st.integers(0, 10))
+def test_bottom_k(elements, k):
+    assert iterator(elements).bottom_k(k) == sorted(elements)[:k]
+
+
+def test_top_k_key():
+    words = ["a", "ccc", "bb", "dddd"]
+    assert iterator(words).top_k(2, key=len) == ["dddd", "ccc"]
+    assert iterator(words).bottom_k(2, key=len) == ["a", "bb"]
+
+
+@pytest.mark.parametrize("method", ["top_k", "bottom_k"])
+def test_negative_k(method):
+    with pytest.raises(ValueError):
+        getattr(iterator([1]), method)(-1)
+
+
+@given(st.lists(st.integers()), st.integers(1, 5), st.integers(1, 5))
+def test_top_k_by_window(elements, size, k):
+    expected = [
+        heapq.nlargest(k, elements[i : i + size]) for i in range(0, len(elements), size)
+    ]
+    assert iterator(elements).top_k_by_window(size, k).to_list() == expected
+
+
+def test_top_k_by_window_key():
+    it = iterator(["a", "ccc", "bb", "dddd", "e"]).top_k_by_window(2, 1, key=len)
+    assert it.to_list() == [["ccc"], ["dddd"], ["e"]]
+
+
+def test_top_k_by_window_bounds():
+    assert iterator(iter(range(10))).top_k_by_window(4, 1).size_bounds() == (3, 3)
+
+
+@pytest.mark.parametrize("size, k", [(0, 1), (1, 0)])
+def test_top_k_by_window_invalid(size, k):
+    with pytest.raises(ValueError):
+        iterator([1]).top_k_by_window(size, k)
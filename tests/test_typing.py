@@ -48,3 +48,11 @@ from fluentiter.itertypes import FlatMapIterator
 reveal_type(iterator([1,2,3]).tumbling_window(2).to_list())
 """
     assert get_mypy_type(code) == "list[tuple[int, ...]]"
+
+
+def test_batched():
+    code = """
+from fluentiter import iterator
+reveal_type(iterator([1,2,3]).batched(2).to_list())
+"""
+    assert get_mypy_type(code) == "list[list[int]]"
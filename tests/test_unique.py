@@ -0,0 +1,86 @@
+import hypothesis.strategies as st
+import pytest
+from hypothesis import given
+
+from fluentiter import iterator
+from fluentiter.bloom import BloomFilter
+
+
+@given(st.lists(st.integers(0, 20)))
+def test_unique(elements):
+    assert iterator(elements).unique().to_list() == list(dict.fromkeys(elements))
+
+
+def test_unique_key():
+    words = ["Fish", "fish", "Whale", "WHALE", "cod"]
+    assert iterator(words).unique(key=str.lower).to_list() == ["Fish", "Whale", "cod"]
+
+
+def test_unique_lazy():
+    it = iterator(x for x in [1, 1, 2, 3]).unique()
+    assert it.next() == 1
+    assert it.next() == 2
+
+
+@given(st.lists(st.integers(0, 20)), st.integers(1, 5))
+def test_unique_max_seen(elements, max_seen):
+    # reference: remember the `max_seen` most recently seen keys
+    expected, recent = [], []
+    for x in elements:
+        if x in recent:
+            recent.remove(x)
+        else:
+            expected.append(x)
+        recent.append(x)
+        del recent[:-max_seen]
+    assert iterator(elements).unique(max_seen=max_seen).to_list() == expected
+
+
+def test_unique_max_seen_evicts():
+    assert iterator([1, 2, 3, 1, 3]).unique(max_seen=2).to_list() == [1, 2, 3, 1]
+
+
+def test_unique_max_seen_key():
+    it = iterator(["a", "A", "b", "c", "C", "a"]).unique(key=str.lower, max_seen=2)
+    assert it.to_list() == ["a", "b", "c", "a"]
+
+
+@pytest.mark.parametrize("max_seen", [0, -1])
+def test_unique_invalid_max_seen(max_seen):
+    with pytest.raises(ValueError):
+        iterator([1]).unique(max_seen=max_seen)
+
+
+@given(st.lists(st.integers(0, 20)))
+def test_unique_approx_never_yields_duplicates(elements):
+    result = iterator(elements).unique_approx(100).to_list()
+    assert len(result) == len(set(result))
+    assert set(result) <= set(elements)
+
+
+def test_unique_approx_error_rate():
+    elements = [str(x) for x in range(10_000)] * 2
+    result = iterator(elements).unique_approx(10_000, error_rate=0.01).to_list()
+    assert 9_800 <= len(result) <= 10_000
+    assert len(result) == len(set(result))
+
+
+def test_unique_approx_key():
+    it = iterator(["Fish", "fish", "Whale"]).unique_approx(10, key=str.lower)
+    assert it.to_list() == ["Fish", "Whale"]
+
+
+@pytest.mark.parametrize("capacity,error_rate", [(0, 0.1), (10, 0), (10, 1)])
+def test_unique_approx_invalid(capacity, error_rate):
+    with pytest.raises(ValueError):
+        iterator([1]).unique_approx(capacity, error_rate)
+
+
+def test_bloom_filter():
+    bloom = BloomFilter(1000, 0.01)
+    assert bloom.add("a") is False
+    assert bloom.add("a") is True
+    assert "a" in bloom
+    assert sum(str(x) in bloom for x in range(1000)) < 50
+    # about 1.2 bytes per element at 1% error rate
+    assert bloom.size_in_bytes == 1199
@@ -1,3 +1,5 @@
+import pytest
+
 from fluentiter import iterator
 
 
@@ -20,3 +22,21 @@ def test_unequal_length():
     odds, evens = iterator([(1, 2, 4), (3, 6), (5, 8, 10, 12)]).unzip()
     assert list(odds) == [1, 3, 5]
     assert list(evens) == [(2, 4), 6, (8, 10, 12)]
+
+
+def test_unzip_max_memory():
+    firsts, seconds = iterator([(i, -i, i) for i in range(100)]).unzip(max_memory=4)
+    assert list(seconds) == [(-i, i) for i in range(100)]
+    assert list(firsts) == list(range(100))
+
+
+def test_unzip_invalid_max_memory():
+    with pytest.raises(ValueError):
+        iterator([(1, 2)]).unzip(max_memory=-1)
+
+
+def test_unzip_into():
+    firsts, seconds = [], []
+    iterator([(1, 2), (3, 4, 5)]).unzip_into(firsts.append, seconds.append)
+    assert firsts == [1, 3]
+    assert seconds == [2, (4, 5)]